@@ -1,108 +1,95 @@
 """
 대시보드 API (PRD 9.4)
-- GET /api/dashboard/stats/ — 전체 통계 (start_date, end_date)
+- GET /api/dashboard/stats/ — 전체 통계 (start_date, end_date) — 계산은 apps.notes.analytics (사용자 통계 롤업 합산)
+  windows=1,3,12 이면 최근 1·3·12개월 창 통계를 한 응답으로 (창 수와 무관하게 쿼리 2회)
 - GET /api/dashboard/calendar/ — 달력 (year, month)
 - GET /api/dashboard/top-wines/ — Top 10 와인 (sort=count|rating)
+- GET /api/dashboard/grapes/ — 품종별 시음 횟수·평균 평점 (start_date, end_date)
+- 모두 조건부 GET 지원 — 사용자 노트 버전(노트 쓰기·그 노트의 와인 변경마다 증가)으로 ETag, 일치하면 집계 없이 304
+- 응답 본문은 ETag 키로 캐시 (config.responsecache) — 버전이 같으면 다른 기기·앱 재실행에도 재계산 없이 응답,
+  동시 미스는 계산 1회
 """
 from collections import defaultdict
-from datetime import timedelta
 
 from django.db.models import Avg, Count
-from django.db.models.functions import TruncMonth
 from django.utils import timezone
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from apps.notes.models import TastingNote
+from apps.notes.photos import photo_thumbnail
+from apps.notes.analytics import note_statistics, note_statistics_windows, parse_windows
+from apps.notes.rollups import parse_date_range
+from apps.notes.versions import get_user_notes_version
 from apps.wines.models import Wine
+from config.conditional import ConditionalGetMixin
+from config.responsecache import CachedResponseMixin
 
 
-class StatsView(APIView):
+class DashboardView(CachedResponseMixin, ConditionalGetMixin, APIView):
     """
-    대시보드 전체 통계.
-    GET /api/dashboard/stats/
-    Query: start_date, end_date (선택)
+    대시보드 공통 — 내 노트와 그 와인 정보의 집계이므로 내 노트 버전이 같으면 304, 아니면 캐시된 본문.
+    하위 클래스는 build(request) 로 응답 본문만 만든다.
     """
 
     permission_classes = [IsAuthenticated]
 
-    def get(self, request):
-        user = request.user
-        start_date = request.query_params.get("start_date")
-        end_date = request.query_params.get("end_date")
-
-        qs = TastingNote.objects.filter(user=user)
-        if start_date:
-            qs = qs.filter(tasted_date__gte=start_date)
-        if end_date:
-            qs = qs.filter(tasted_date__lte=end_date)
-
-        total_tastings = qs.count()
-        total_wines = qs.values("wine").distinct().count()
-        avg_result = qs.aggregate(Avg("rating"))["rating__avg"]
-        average_rating = round(float(avg_result), 2) if avg_result is not None else None
-
-        type_stats = (
-            qs.values("wine__type")
-            .annotate(count=Count("id"))
-            .order_by("-count")
-        )
-        type_distribution = {row["wine__type"]: row["count"] for row in type_stats}
-        most_tasted_type = (
-            type_stats.first()["wine__type"] if type_stats else None
-        )
+    def conditional_validators(self):
+        version, changed_at = get_user_notes_version(self.request.user.pk)
+        return (version,), changed_at
 
-        region_stats = (
-            qs.values("wine__region")
-            .annotate(count=Count("id"))
-            .exclude(wine__region="")
-            .order_by("-count")
-        )
-        most_tasted_region = (
-            region_stats.first()["wine__region"] if region_stats else None
-        )
+    def get(self, request):
+        return self.cached_response(lambda: self.build(request))
 
-        twelve_months_ago = timezone.now().date() - timedelta(days=365)
-        monthly_qs = (
-            qs.filter(tasted_date__gte=twelve_months_ago)
-            .annotate(month=TruncMonth("tasted_date"))
-            .values("month")
-            .annotate(count=Count("id"))
-            .order_by("month")
-        )
-        monthly_trend = [
-            {"month": str(row["month"])[:7], "count": row["count"]}
-            for row in monthly_qs
-        ]
 
-        rating_distribution = {
-            str(i): qs.filter(rating=i).count() for i in range(1, 6)
-        }
+class StatsView(DashboardView):
+    """
+    대시보드 전체 통계.
+    GET /api/dashboard/stats/
+    Query: start_date, end_date (선택)
+    windows=1,3,12 (개월 수, 최대 6개) 이면 end_date(기본 오늘)까지 최근 n개월 창마다 같은 지표 →
+    {"windows": [{"months", "start_date", "end_date", ...}]} (monthly_trend 는 창 안의 월별 추이)
+    """
 
-        return Response(
-            {
-                "total_tastings": total_tastings,
-                "total_wines": total_wines,
-                "average_rating": average_rating,
-                "most_tasted_type": most_tasted_type,
-                "most_tasted_region": most_tasted_region,
-                "monthly_trend": monthly_trend,
-                "type_distribution": type_distribution,
-                "rating_distribution": rating_distribution,
+    def build(self, request):
+        # 계산은 tasting-notes statistics 와 공유 (apps.notes.analytics — 사용자 통계 롤업 합산, 쿼리 2회)
+        windows = parse_windows(request.query_params)
+        start_date, end_date = parse_date_range(request.query_params)
+        if windows:
+            return {
+                "windows": [
+                    {
+                        "months": stats["months"],
+                        "start_date": stats["start"].isoformat(),
+                        "end_date": stats["end"].isoformat(),
+                        **self._payload(stats),
+                    }
+                    for stats in note_statistics_windows(request.user.pk, windows, end_date)
+                ]
             }
-        )
+        return self._payload(note_statistics(request.user.pk, start_date, end_date, trend_days=365))
+
+    @staticmethod
+    def _payload(stats):
+        return {
+            "total_tastings": stats["total"],
+            "total_wines": stats["wine_count"],
+            "average_rating": stats["average_rating"],
+            "most_tasted_type": next(iter(stats["type_distribution"]), None),
+            "most_tasted_region": next((region for region in stats["region_distribution"] if region), None),
+            "monthly_trend": [{"month": month, "count": count} for month, count in stats["monthly"].items()],
+            "type_distribution": stats["type_distribution"],
+            "rating_distribution": stats["rating_distribution"],
+        }
 
 
-class CalendarView(APIView):
+class CalendarView(DashboardView):
     """
     달력용 데이터.
     GET /api/dashboard/calendar/?year=&month=
     """
 
-    permission_classes = [IsAuthenticated]
-
-    def get(self, request):
+    def build(self, request):
         user = request.user
         year = int(request.query_params.get("year", timezone.now().year))
         month = int(request.query_params.get("month", timezone.now().month))
@@ -125,7 +112,7 @@ class CalendarView(APIView):
                     "id": note.id,
                     "wine_name": note.wine.name,
                     "rating": note.rating,
-                    "photo": note.photos[0] if note.photos else None,
+                    "photo": photo_thumbnail(note.photos),
                 }
             )
 
@@ -133,18 +120,16 @@ class CalendarView(APIView):
             {"date": date, "count": len(notes), "notes": notes}
             for date, notes in sorted(by_date.items())
         ]
-        return Response({"year": year, "month": month, "days": days})
+        return {"year": year, "month": month, "days": days}
 
 
-class TopWinesView(APIView):
+class TopWinesView(DashboardView):
     """
     내가 가장 많이/높게 평가한 와인 Top 10.
     GET /api/dashboard/top-wines/?sort=count (기본) | sort=rating
     """
 
-    permission_classes = [IsAuthenticated]
-
-    def get(self, request):
+    def build(self, request):
         user = request.user
         sort_by = request.query_params.get("sort", "count")
 
@@ -193,4 +178,35 @@ class TopWinesView(APIView):
                     "avg_rating": round(float(row.get("avg_rating") or 0), 2),
                 }
             )
-        return Response(results)
+        return results
+
+
+class GrapeStatsView(DashboardView):
+    """
+    품종별 시음 통계 — 정규화된 품종 연결(wines.WineGrape)로 GROUP BY (JSON 스캔 없음).
+    GET /api/dashboard/grapes/?start_date=&end_date=
+    """
+
+    def build(self, request):
+        qs = TastingNote.objects.filter(user=request.user)
+        start_date, end_date = parse_date_range(request.query_params)
+        if start_date:
+            qs = qs.filter(tasted_date__gte=start_date)
+        if end_date:
+            qs = qs.filter(tasted_date__lte=end_date)
+
+        rows = (
+            qs.filter(wine__grape_links__isnull=False)
+            .values("wine__grape_links__grape_id", "wine__grape_links__grape__name")
+            .annotate(count=Count("id"), avg_rating=Avg("rating"))
+            .order_by("-count", "wine__grape_links__grape__name")
+        )
+        results = [
+            {
+                "grape": row["wine__grape_links__grape__name"],
+                "count": row["count"],
+                "avg_rating": round(float(row["avg_rating"] or 0), 2),
+            }
+            for row in rows
+        ]
+        return results
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Template, TastingNote
+from .models import AromaTag, PhotoBlob, Template, TastingNote
 
 
 @admin.register(Template)
@@ -26,3 +26,17 @@ class TastingNoteAdmin(admin.ModelAdmin):
     raw_id_fields = ("user", "wine", "template")
     date_hierarchy = "tasted_date"
     list_per_page = 20
+
+
+@admin.register(PhotoBlob)
+class PhotoBlobAdmin(admin.ModelAdmin):
+    list_display = ("name", "ref_count", "size", "created_at")
+    list_filter = ("ref_count",)
+    search_fields = ("digest", "name")
+    readonly_fields = ("digest", "name", "size", "ref_count", "renditions", "created_at")
+
+
+@admin.register(AromaTag)
+class AromaTagAdmin(admin.ModelAdmin):
+    list_display = ("name", "key")
+    search_fields = ("name", "key")
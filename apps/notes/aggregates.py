@@ -0,0 +1,149 @@
+"""
+와인별 시음 노트 집계(WineNoteStats) 유지 — 증분 갱신·전체 재구축·검증
+- 노트 1건의 (wine_id, rating, tasted_date) 변화를 F() 증감으로 반영 (와인 변경 시 양쪽 와인 갱신)
+- 최근 시음일은 늘어날 때만 바로 반영하고, 현재 최근일 노트가 빠지면 wine 인덱스로 MAX 재계산
+- 노트 일괄 생성(bulk_create)은 시그널이 없으므로 add_notes_to_stats 로 와인별 합산 후 한 번에 반영
+"""
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Case, Count, F, Max, Q, Sum, When
+
+from .models import TastingNote, WineNoteStats
+
+RATING_VALUES = range(1, 6)
+
+
+def _rating_field(rating):
+    return f"rating_{rating}" if rating in RATING_VALUES else None
+
+
+def _add(wine_id, rating, tasted_date, sign):
+    """wine_id 집계에 노트 1건을 더하거나(sign=1) 뺀다(sign=-1)."""
+    if sign > 0:
+        WineNoteStats.objects.get_or_create(wine_id=wine_id)
+    changes = {
+        "note_count": F("note_count") + sign,
+        "rating_sum": F("rating_sum") + sign * rating,
+    }
+    rating_field = _rating_field(rating)
+    if rating_field:
+        changes[rating_field] = F(rating_field) + sign
+    if sign > 0:
+        changes["last_tasted_date"] = Case(
+            When(
+                Q(last_tasted_date__isnull=True) | Q(last_tasted_date__lt=tasted_date),
+                then=tasted_date,
+            ),
+            default=F("last_tasted_date"),
+        )
+    WineNoteStats.objects.filter(wine_id=wine_id).update(**changes)
+
+
+def _refresh_last_tasted(wine_id):
+    last = TastingNote.objects.filter(wine_id=wine_id).aggregate(last=Max("tasted_date"))["last"]
+    WineNoteStats.objects.filter(wine_id=wine_id).update(last_tasted_date=last)
+
+
+def apply_note_change(old, new):
+    """
+    노트 상태 변화를 집계에 반영. old/new = (wine_id, rating, tasted_date) 또는 None(생성/삭제).
+    호출자는 노트 쓰기와 같은 트랜잭션 안에서 호출해야 한다.
+    """
+    if old == new:
+        return
+    with transaction.atomic():
+        if old is not None:
+            _add(*old, sign=-1)
+        if new is not None:
+            _add(*new, sign=1)
+        if old is not None and (new is None or new[0] != old[0] or new[2] < old[2]):
+            # 빠진 노트가 최근 시음일이었을 수 있으므로 해당 와인만 재계산
+            stats = WineNoteStats.objects.filter(wine_id=old[0]).values("last_tasted_date").first()
+            if stats and stats["last_tasted_date"] == old[2]:
+                _refresh_last_tasted(old[0])
+
+
+def add_notes_to_stats(states):
+    """
+    새로 생성한 노트들의 (wine_id, rating, tasted_date) 목록을 와인별로 합산해 집계에 반영.
+    와인 수와 무관하게 조회 1회 + 생성 1회 + 갱신 1회. 호출자의 트랜잭션 안에서 호출.
+    """
+    totals = defaultdict(lambda: {"note_count": 0, "rating_sum": 0, "last_tasted_date": None})
+    for wine_id, rating, tasted_date in states:
+        total = totals[wine_id]
+        total["note_count"] += 1
+        total["rating_sum"] += rating
+        rating_field = _rating_field(rating)
+        if rating_field:
+            total[rating_field] = total.get(rating_field, 0) + 1
+        if total["last_tasted_date"] is None or tasted_date > total["last_tasted_date"]:
+            total["last_tasted_date"] = tasted_date
+    if not totals:
+        return
+    counters = ["note_count", "rating_sum"] + [f"rating_{i}" for i in RATING_VALUES]
+    with transaction.atomic():
+        existing = WineNoteStats.objects.select_for_update().in_bulk(list(totals))
+        created = []
+        for wine_id, total in totals.items():
+            stats = existing.get(wine_id)
+            if stats is None:
+                created.append(WineNoteStats(wine_id=wine_id, **total))
+                continue
+            for field in counters:
+                setattr(stats, field, getattr(stats, field) + total.get(field, 0))
+            if stats.last_tasted_date is None or total["last_tasted_date"] > stats.last_tasted_date:
+                stats.last_tasted_date = total["last_tasted_date"]
+        WineNoteStats.objects.bulk_create(created)
+        WineNoteStats.objects.bulk_update(existing.values(), counters + ["last_tasted_date"])
+
+
+def compute_wine_stats(wine_ids=None):
+    """노트 테이블에서 와인별 집계를 GROUP BY 1회로 계산 → {wine_id: {필드: 값}}"""
+    qs = TastingNote.objects.order_by()
+    if wine_ids is not None:
+        qs = qs.filter(wine_id__in=wine_ids)
+    rows = qs.values("wine_id").annotate(
+        note_count=Count("id"),
+        rating_sum=Sum("rating"),
+        last_tasted_date=Max("tasted_date"),
+        **{f"rating_{i}": Count("id", filter=Q(rating=i)) for i in RATING_VALUES},
+    )
+    return {row.pop("wine_id"): row for row in rows}
+
+
+def rebuild_wine_stats(batch_size=1000):
+    """WineNoteStats 전체 재구축 (단일 트랜잭션). 재구축한 와인 수 반환."""
+    computed = compute_wine_stats()
+    with transaction.atomic():
+        WineNoteStats.objects.all().delete()
+        WineNoteStats.objects.bulk_create(
+            (WineNoteStats(wine_id=wine_id, **values) for wine_id, values in computed.items()),
+            batch_size=batch_size,
+        )
+    return len(computed)
+
+
+def rebuild_wine_stats_for(wine_ids):
+    """지정 와인들만 집계 재계산 (노트 FK 일괄 변경 등 시그널을 거치지 않은 쓰기 후)"""
+    wine_ids = list(wine_ids)
+    computed = compute_wine_stats(wine_ids)
+    with transaction.atomic():
+        WineNoteStats.objects.filter(wine_id__in=wine_ids).delete()
+        WineNoteStats.objects.bulk_create(
+            WineNoteStats(wine_id=wine_id, **values) for wine_id, values in computed.items()
+        )
+
+
+def verify_wine_stats():
+    """저장된 집계와 노트 테이블 재계산 결과 비교 → 불일치 와인 ID 목록"""
+    computed = compute_wine_stats()
+    fields = ["note_count", "rating_sum", "last_tasted_date"] + [f"rating_{i}" for i in RATING_VALUES]
+    stored = {
+        row.pop("wine_id"): row
+        for row in WineNoteStats.objects.values("wine_id", *fields)
+        if row["note_count"]
+    }
+    mismatched = set(computed) ^ set(stored)
+    mismatched.update(w for w in set(computed) & set(stored) if computed[w] != stored[w])
+    return sorted(mismatched)
@@ -0,0 +1,118 @@
+"""
+시음 통계 공통 계산 (tasting-notes statistics, dashboard StatsView)
+- note_statistics(): 기간 통계 지표 전체를 한 번에 — 사용자 통계 롤업(apps.notes.rollups) 버킷 조회 1회 +
+  와인 타입·지역 조회 1회. 최근 추이 구간(trend_days)은 같은 버킷 조회에서 잘라 합산
+- 두 엔드포인트는 응답 형식(키 이름, 추이 기간 180일/365일)만 다르고 계산은 이 모듈을 공유
+- note_statistics_windows(): 여러 기간 창(최근 1·3·12개월 등) 통계를 한 번에 — 창 시작일마다 구간을 나눈
+  버킷 조회 1회 + 창마다 메모리 합산 + 모든 창의 와인을 합친 타입·지역 조회 1회 (창 수와 무관하게 쿼리 2회)
+- NOTE_STATISTICS_QUERY_BUDGET: note_statistics·note_statistics_windows 쿼리 수 상한 (노트 수·창 수와 무관)
+  — apps.notes.tests 가 assertNumQueries 로 고정
+- summarize_notes(): 노트 쿼리셋 직접 집계 (노트 수·서로 다른 와인 수·평균·평점 분포를 조건부 집계 쿼리 1회).
+  롤업 검증용 기준값
+"""
+from datetime import date, timedelta
+
+from django.db.models import Avg, Count, Q
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from .rollups import (
+    RATING_VALUES,
+    load_rollups,
+    month_end,
+    summarize_rollups,
+    wine_dimension_counts,
+    wine_dimensions,
+)
+
+NOTE_STATISTICS_QUERY_BUDGET = 2
+STAT_WINDOWS_PARAM = "windows"
+MAX_STAT_WINDOWS = 6
+MAX_STAT_WINDOW_MONTHS = 120
+
+
+def _average(rating_sum, count):
+    return round(rating_sum / count, 2) if count else None
+
+
+def note_statistics(user_id, start=None, end=None, trend_days=365):
+    """
+    사용자 기간 통계 → {
+        total, wine_count, average_rating, rating_distribution {"1".."5"},
+        type_distribution {타입: 노트 수}, region_distribution {지역: 노트 수} (많은 순),
+        monthly {"YYYY-MM": 노트 수} (최근 trend_days 일과 기간의 교집합, 월 오름차순)
+    }
+    """
+    trend_start = timezone.now().date() - timedelta(days=trend_days)
+    rollups = load_rollups(user_id, start, end, cuts=[trend_start])
+    summary = summarize_rollups(rollups, start, end)
+    recent = summarize_rollups(rollups, max(start or trend_start, trend_start), end)
+    return _statistics(summary, recent["months"], wine_dimensions(summary["wines"]))
+
+
+def note_statistics_windows(user_id, windows, end=None):
+    """
+    최근 n개월 창들의 통계 → [{months, start, end, **note_statistics 지표}] (windows 순서).
+    창 = [end 의 n개월 전 다음 날, end] (end 기본 오늘), monthly 는 창 안의 월별 노트 수.
+    """
+    end = end or timezone.now().date()
+    spans = [(months, months_before(end, months) + timedelta(days=1)) for months in windows]
+    rollups = load_rollups(user_id, min(start for _, start in spans), end, cuts=[start for _, start in spans])
+    summaries = [summarize_rollups(rollups, start, end) for _, start in spans]
+    dimensions = wine_dimensions(set().union(*(summary["wines"] for summary in summaries)))
+    return [
+        {"months": months, "start": start, "end": end, **_statistics(summary, summary["months"], dimensions)}
+        for (months, start), summary in zip(spans, summaries)
+    ]
+
+
+def _statistics(summary, months, dimensions):
+    type_distribution, region_distribution = wine_dimension_counts(summary["wines"], dimensions)
+    return {
+        "total": summary["note_count"],
+        "wine_count": len(summary["wines"]),
+        "average_rating": _average(summary["rating_sum"], summary["note_count"]),
+        "rating_distribution": {str(i): summary["ratings"][i] for i in RATING_VALUES},
+        "type_distribution": type_distribution,
+        "region_distribution": region_distribution,
+        "monthly": dict(sorted(months.items())),
+    }
+
+
+def months_before(day, months):
+    """day 의 months 개월 전 같은 날 (그 달에 없는 날이면 말일)"""
+    year, month = divmod(day.year * 12 + day.month - 1 - months, 12)
+    first = date(year, month + 1, 1)
+    return first.replace(day=min(day.day, month_end(first).day))
+
+
+def parse_windows(params):
+    """query 의 windows (예: "1,3,12", 개월 수) → 중복 없는 정수 튜플, 없으면 None. 형식·범위가 틀리면 400"""
+    raw = params.get(STAT_WINDOWS_PARAM)
+    if raw is None:
+        return None
+    try:
+        windows = tuple(dict.fromkeys(int(part) for part in raw.split(",") if part.strip()))
+    except ValueError:
+        raise ValidationError({STAT_WINDOWS_PARAM: "쉼표로 구분한 개월 수여야 합니다. (예: 1,3,12)"}) from None
+    if not windows or len(windows) > MAX_STAT_WINDOWS:
+        raise ValidationError({STAT_WINDOWS_PARAM: f"기간 창은 1~{MAX_STAT_WINDOWS}개여야 합니다."})
+    if not all(1 <= months <= MAX_STAT_WINDOW_MONTHS for months in windows):
+        raise ValidationError({STAT_WINDOWS_PARAM: f"개월 수는 1~{MAX_STAT_WINDOW_MONTHS} 이어야 합니다."})
+    return windows
+
+
+def summarize_notes(queryset):
+    """노트 쿼리셋 → {total, wine_count, average_rating, rating_distribution} (조건부 집계 쿼리 1회)"""
+    row = queryset.order_by().aggregate(
+        total=Count("id"),
+        wine_count=Count("wine", distinct=True),
+        average=Avg("rating"),
+        **{f"rating_{i}": Count("id", filter=Q(rating=i)) for i in RATING_VALUES},
+    )
+    return {
+        "total": row["total"],
+        "wine_count": row["wine_count"],
+        "average_rating": round(float(row["average"]), 2) if row["average"] is not None else None,
+        "rating_distribution": {str(i): row[f"rating_{i}"] for i in RATING_VALUES},
+    }
@@ -5,3 +5,6 @@ class NotesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.notes"
     verbose_name = "시음 노트"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,247 @@
+"""
+아로마 태그 정규화·색인 (TastingNote.custom_fields["aroma_tags"] + aroma_notes → AromaTag / NoteAromaTag)
+- 정규화 키: apps.wines.search.normalize 후 구분자 → 공백, 꼬리말("향", "아로마", "notes" 등) 제거,
+  한·영 별칭 통일 (예: "체리향" → "cherry", "Cassis" → "blackcurrant")
+- aroma_notes 는 쉼표·세미콜론·슬래시·줄바꿈·"and"/"그리고" 로 나눠 짧은 조각(단어 3개 이하)만 태그로 본다
+  (문장형 서술은 전문 검색 대상)
+- 노트 저장 시 시그널, 일괄 생성 후 sync_note_aromas_bulk 호출. 노트 삭제는 FK CASCADE.
+  rebuild_aroma_index 관리 명령으로 전체 백필
+- ?tag= 필터는 (tag, note) 인덱스 서브쿼리, 태그 빈도는 (user, tag) 인덱스 순서 GROUP BY
+"""
+import re
+
+from django.db import transaction
+from django.db.models import Count
+from rest_framework.filters import BaseFilterBackend
+
+from apps.wines.search import normalize
+
+from .models import AromaTag, NoteAromaTag, TastingNote
+
+AROMA_TAGS_FIELD = "aroma_tags"
+AROMA_KEY_MAX_LENGTH = 50
+AROMA_MAX_WORDS = 3
+AROMA_TAGS_LIMIT = 50
+AROMA_TAGS_MAX_LIMIT = 200
+# 같은 아로마의 다른 표기 → 대표 정규화 키
+AROMA_ALIASES = {
+    "cassis": "blackcurrant",
+    "black currant": "blackcurrant",
+    "blackcurrant": "blackcurrant",
+    "citrus fruit": "citrus",
+    "toasty": "toast",
+    "oaky": "oak",
+    "peppery": "pepper",
+    "earthy": "earth",
+    "minerality": "mineral",
+    "liquorice": "licorice",
+    "체리": "cherry",
+    "블랙체리": "black cherry",
+    "블랙 체리": "black cherry",
+    "딸기": "strawberry",
+    "라즈베리": "raspberry",
+    "산딸기": "raspberry",
+    "블랙베리": "blackberry",
+    "자두": "plum",
+    "플럼": "plum",
+    "카시스": "blackcurrant",
+    "블랙커런트": "blackcurrant",
+    "레몬": "lemon",
+    "라임": "lime",
+    "자몽": "grapefruit",
+    "시트러스": "citrus",
+    "감귤": "citrus",
+    "사과": "apple",
+    "청사과": "green apple",
+    "배": "pear",
+    "복숭아": "peach",
+    "살구": "apricot",
+    "파인애플": "pineapple",
+    "열대과일": "tropical fruit",
+    "꿀": "honey",
+    "바닐라": "vanilla",
+    "오크": "oak",
+    "토스트": "toast",
+    "버터": "butter",
+    "초콜릿": "chocolate",
+    "초콜렛": "chocolate",
+    "커피": "coffee",
+    "모카": "mocha",
+    "담배": "tobacco",
+    "가죽": "leather",
+    "후추": "pepper",
+    "흑후추": "black pepper",
+    "계피": "cinnamon",
+    "시나몬": "cinnamon",
+    "정향": "clove",
+    "감초": "licorice",
+    "삼나무": "cedar",
+    "시더": "cedar",
+    "장미": "rose",
+    "제비꽃": "violet",
+    "바이올렛": "violet",
+    "민트": "mint",
+    "허브": "herbs",
+    "흙": "earth",
+    "미네랄": "mineral",
+    "버섯": "mushroom",
+}
+_SEPARATORS = re.compile(r"[\s\-_.'’]+")
+_SPLITTERS = re.compile(r"[,;/|·・\n\r]+|\s+(?:and|&|그리고|및)\s+", re.IGNORECASE)
+_PREFIXES = ("hints of ", "hint of ", "notes of ", "note of ", "aromas of ", "aroma of ")
+_SUFFIXES = (" aromas", " aroma", " notes", " note", "향기", "아로마", "향", "노트")
+
+
+def aroma_key(value):
+    """아로마 표기 → 정규화 키 (빈 값·너무 긴 서술이면 "")"""
+    if not isinstance(value, str):
+        return ""
+    key = _SEPARATORS.sub(" ", normalize(value)).strip(" #")
+    for prefix in _PREFIXES:
+        if key.startswith(prefix):
+            key = key[len(prefix):]
+    for suffix in _SUFFIXES:
+        if key.endswith(suffix) and len(key) > len(suffix):
+            key = key[: -len(suffix)].strip()
+            break
+    key = AROMA_ALIASES.get(key, key)
+    if not key or len(key) > AROMA_KEY_MAX_LENGTH or len(key.split()) > AROMA_MAX_WORDS:
+        return ""
+    return key
+
+
+def _display_name(key, raw):
+    """새 태그의 표시명 — 처음 들어온 표기 그대로, 별칭·꼬리말로 바뀐 경우 키를 제목 형식으로"""
+    if _SEPARATORS.sub(" ", normalize(raw)).strip(" #") == key:
+        return raw.strip(" #")[:AROMA_KEY_MAX_LENGTH]
+    return key.title() if key.isascii() else key
+
+
+def tokenize_aroma_notes(text):
+    """aroma_notes 자유 서술 → 아로마 표기 조각 목록"""
+    if not text:
+        return []
+    return [piece.strip() for piece in _SPLITTERS.split(text) if piece and piece.strip()]
+
+
+def note_aroma_values(aroma_notes, custom_fields):
+    """노트 1건의 아로마 표기 목록 (aroma_tags 커스텀 필드 먼저, 그다음 aroma_notes 조각)"""
+    values = []
+    tags = custom_fields.get(AROMA_TAGS_FIELD) if isinstance(custom_fields, dict) else None
+    if isinstance(tags, str):
+        tags = tags.replace("#", ",").split(",")
+    if isinstance(tags, list):
+        values.extend(tag for tag in tags if isinstance(tag, str))
+    values.extend(tokenize_aroma_notes(aroma_notes))
+    return values
+
+
+def resolve_aromas(raw_values):
+    """표기 목록 → {정규화 키: AromaTag} (없는 태그는 일괄 생성)"""
+    names = {}
+    for raw in raw_values:
+        key = aroma_key(raw)
+        if key and key not in names:
+            names[key] = _display_name(key, raw)
+    if not names:
+        return {}
+    tags = {tag.key: tag for tag in AromaTag.objects.filter(key__in=names)}
+    missing = [AromaTag(key=key, name=name) for key, name in names.items() if key not in tags]
+    if missing:
+        AromaTag.objects.bulk_create(missing, ignore_conflicts=True)
+        tags.update({tag.key: tag for tag in AromaTag.objects.filter(key__in=[tag.key for tag in missing])})
+    return tags
+
+
+def sync_note_aromas_bulk(rows):
+    """
+    rows: (note_id, user_id, aroma_notes, custom_fields) 목록 → NoteAromaTag 연결을 노트 내용과 일치시킴.
+    태그 조회 1회 + 생성 1회 + 기존 연결 삭제 1회 + 연결 생성 1회.
+    """
+    rows = [(note_id, user_id, note_aroma_values(aroma_notes, custom_fields))
+            for note_id, user_id, aroma_notes, custom_fields in rows]
+    if not rows:
+        return
+    tags = resolve_aromas(value for _, _, values in rows for value in values)
+    links = []
+    for note_id, user_id, values in rows:
+        keys = {aroma_key(value) for value in values} - {""}
+        links.extend(NoteAromaTag(note_id=note_id, tag=tags[key], user_id=user_id) for key in keys)
+    with transaction.atomic():
+        NoteAromaTag.objects.filter(note_id__in=[note_id for note_id, _, _ in rows]).delete()
+        NoteAromaTag.objects.bulk_create(links, ignore_conflicts=True)
+
+
+def sync_note_aromas(notes):
+    sync_note_aromas_bulk(
+        [(note.pk, note.user_id, note.aroma_notes, note.custom_fields) for note in notes if note.pk]
+    )
+
+
+def rebuild_aroma_index(batch_size=2000):
+    """전체 노트의 아로마 연결 재구축 → 처리한 노트 수"""
+    count = 0
+    batch = []
+    rows = TastingNote.objects.values_list("id", "user_id", "aroma_notes", "custom_fields").order_by("id")
+    for row in rows.iterator(chunk_size=batch_size):
+        batch.append(row)
+        if len(batch) >= batch_size:
+            sync_note_aromas_bulk(batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        sync_note_aromas_bulk(batch)
+        count += len(batch)
+    return count
+
+
+def _tag_labels(tag_ids):
+    """태그 ID → {tag: 정규화 키(?tag= 값), name: 표시명} (IN 조회 1회)"""
+    rows = AromaTag.objects.filter(id__in=set(tag_ids)).values_list("id", "key", "name")
+    return {pk: {"tag": key, "name": name} for pk, key, name in rows}
+
+
+def aroma_tag_counts(links, limit=None):
+    """
+    NoteAromaTag 쿼리셋 → [{tag, name, count}] (노트 수 내림차순).
+    tag_id 로 묶어 세고 표시명은 상위 태그만 IN 조회 1회.
+    """
+    rows = links.values("tag_id").annotate(count=Count("note_id")).order_by("-count", "tag_id")
+    if limit:
+        rows = rows[:limit]
+    rows = list(rows)
+    tags = _tag_labels(row["tag_id"] for row in rows)
+    return [{**tags[row["tag_id"]], "count": row["count"]} for row in rows]
+
+
+def aroma_tag_counts_by_wine_type(links, limit=None):
+    """NoteAromaTag 쿼리셋 → {와인 타입: [{tag, name, count}]} (타입마다 상위 limit 개)"""
+    rows = (
+        links.values("note__wine__type", "tag_id")
+        .annotate(count=Count("note_id"))
+        .order_by("note__wine__type", "-count", "tag_id")
+    )
+    grouped = {}
+    for row in rows:
+        bucket = grouped.setdefault(row["note__wine__type"], [])
+        if not limit or len(bucket) < limit:
+            bucket.append(row)
+    tags = _tag_labels(row["tag_id"] for bucket in grouped.values() for row in bucket)
+    return {
+        wine_type: [{**tags[row["tag_id"]], "count": row["count"]} for row in bucket]
+        for wine_type, bucket in grouped.items()
+    }
+
+
+class AromaTagFilter(BaseFilterBackend):
+    """?tag=cherry (표기 정규화, 여러 개면 모두 포함 — AND). 각 조건은 (tag, note) 인덱스 서브쿼리"""
+
+    def filter_queryset(self, request, queryset, view):
+        for raw in request.query_params.getlist("tag"):
+            if not raw.strip():
+                continue
+            key = aroma_key(raw)
+            queryset = queryset.filter(
+                id__in=NoteAromaTag.objects.filter(tag__key=key).values("note_id")
+            )
+        return queryset
@@ -0,0 +1,54 @@
+"""
+시음 노트 일괄 생성 (POST /api/tasting-notes/bulk/, CSV 가져오기 등)
+- 항목 검증 전에 와인·템플릿을 IN 조회 1회씩으로 미리 읽어 시리얼라이저 context 로 전달 (항목별 쿼리 없음)
+- 검증된 노트를 한 트랜잭션에서 bulk_create 후, 시그널이 하던 후속 작업을 한 번에 처리:
+  와인별 집계(add_notes_to_stats), 사용자 통계 롤업(add_notes_to_rollups), 사용자 노트 버전, 전문 검색 색인, 커스텀 필드 값 색인, 아로마 태그 연결
+"""
+from django.db import transaction
+
+from apps.wines.models import Wine
+
+from .aggregates import add_notes_to_stats
+from .aromas import sync_note_aromas
+from .fieldindex import index_note_fields
+from .fulltext import index_notes
+from .models import Template, TastingNote
+from .rollups import add_notes_to_rollups
+from .versions import bump_user_notes_version
+
+BULK_CREATE_MAX = 500
+
+
+def _ids(items, key):
+    ids = set()
+    for item in items:
+        value = item.get(key) if isinstance(item, dict) else None
+        if isinstance(value, int) and not isinstance(value, bool):
+            ids.add(value)
+        elif isinstance(value, str) and value.isdigit():
+            ids.add(int(value))
+    return ids
+
+
+def prefetch_related_objects(items):
+    """항목들이 참조하는 와인·템플릿을 IN 조회 1회씩 → 시리얼라이저 context"""
+    return {
+        "wines": Wine.objects.in_bulk(_ids(items, "wine")),
+        "templates": Template.objects.in_bulk(_ids(items, "template")),
+    }
+
+
+def create_notes_bulk(user, items):
+    """검증된 항목(validated_data) 목록으로 노트 일괄 생성 → 생성된 노트 목록 (ID 포함)"""
+    notes = [TastingNote(user=user, **item) for item in items]
+    if not notes:
+        return []
+    with transaction.atomic():
+        TastingNote.objects.bulk_create(notes)
+        add_notes_to_stats([note.stats_state() for note in notes])
+        add_notes_to_rollups(user.pk, [note.stats_state() for note in notes])
+        bump_user_notes_version(user.pk, public=any(note.is_public for note in notes))
+        index_notes(TastingNote.objects.filter(pk__in=[note.pk for note in notes]))
+        index_note_fields(notes)
+        sync_note_aromas(notes)
+    return notes
@@ -0,0 +1,144 @@
+"""
+시음 노트 내보내기 (GET /api/tasting-notes/export/{csv|ndjson|json}/)
+- values_list() 행(와인 JOIN)을 iterator(chunk_size) 로 읽어 청크 단위 문자열로 생성 → StreamingHttpResponse
+- 전체 결과를 메모리에 올리지 않으므로 노트 수와 무관하게 메모리 일정, 첫 바이트가 바로 전송됨
+- 열 이름은 노트 가져오기(apps.notes.importer)와 같아 내보낸 파일을 그대로 다시 가져올 수 있음
+- photos 는 API 응답과 같은 공개 형식(apps.notes.photos.photo_entry) — 저장소 내부 경로(name) 등은 내보내지 않음
+"""
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from rest_framework.renderers import BaseRenderer
+
+from .models import TastingNote
+from .photos import photo_entry
+
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+    "json": "application/json",
+}
+# (values() 필드, 내보낼 열 이름)
+EXPORT_COLUMNS = (
+    ("id", "id"),
+    ("tasted_date", "tasted_date"),
+    ("rating", "rating"),
+    ("wine__name", "wine_name"),
+    ("wine__winery", "wine_winery"),
+    ("wine__vintage", "wine_vintage"),
+    ("wine__type", "wine_type"),
+    ("wine__region", "wine_region"),
+    ("wine__country", "wine_country"),
+    ("location", "location"),
+    ("location_detail", "location_detail"),
+    ("appearance_clarity", "appearance_clarity"),
+    ("appearance_intensity", "appearance_intensity"),
+    ("color", "color"),
+    ("aroma_intensity", "aroma_intensity"),
+    ("aroma_notes", "aroma_notes"),
+    ("body", "body"),
+    ("acidity", "acidity"),
+    ("tannin", "tannin"),
+    ("sweetness", "sweetness"),
+    ("pairing", "pairing"),
+    ("notes", "notes"),
+    ("custom_fields", "custom_fields"),
+    ("photos", "photos"),
+    ("is_public", "is_public"),
+    ("created_at", "created_at"),
+    ("updated_at", "updated_at"),
+)
+CHUNK_SIZE = 2000
+# CSV에서 JSON 문자열로 담는 열
+JSON_COLUMNS = {"custom_fields", "photos"}
+
+
+class ExportRenderer(BaseRenderer):
+    """Accept: text/csv 등 내보내기 요청의 콘텐츠 협상용 (본문은 StreamingHttpResponse, 오류는 JSON)"""
+
+    media_type = "*/*"
+    format = "export"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False).encode("utf-8")
+
+
+def export_rows(user, chunk_size=CHUNK_SIZE):
+    """사용자의 노트를 최신순으로 한 행씩 (열 이름 → 값) — 서버 측 커서/청크 조회"""
+    fields = [field for field, _ in EXPORT_COLUMNS]
+    rows = (
+        TastingNote.objects.filter(user=user)
+        .order_by("-tasted_date", "-created_at", "id")
+        .values_list(*fields)
+        .iterator(chunk_size=chunk_size)
+    )
+    names = [name for _, name in EXPORT_COLUMNS]
+    for row in rows:
+        row = dict(zip(names, row))
+        row["photos"] = [photo_entry(entry) for entry in row["photos"] or []]
+        yield row
+
+
+class _Echo:
+    """csv.writer 가 쓴 한 줄을 그대로 돌려주는 의사 파일"""
+
+    def write(self, value):
+        return value
+
+
+def _chunked(lines, chunk_size):
+    buffer = []
+    for line in lines:
+        buffer.append(line)
+        if len(buffer) >= chunk_size:
+            yield "".join(buffer)
+            buffer = []
+    if buffer:
+        yield "".join(buffer)
+
+
+def _csv_lines(rows):
+    writer = csv.writer(_Echo())
+    # Excel에서 한글이 깨지지 않도록 BOM
+    yield "﻿" + writer.writerow([name for _, name in EXPORT_COLUMNS])
+    for row in rows:
+        yield writer.writerow(
+            [
+                json.dumps(value, ensure_ascii=False) if name in JSON_COLUMNS else _csv_value(value)
+                for name, value in row.items()
+            ]
+        )
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def _ndjson_lines(rows):
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder, ensure_ascii=False) + "\n"
+
+
+def _json_lines(rows):
+    yield "["
+    separator = "\n"
+    for row in rows:
+        yield separator + json.dumps(row, cls=DjangoJSONEncoder, ensure_ascii=False)
+        separator = ",\n"
+    yield "\n]\n"
+
+
+_WRITERS = {"csv": _csv_lines, "ndjson": _ndjson_lines, "json": _json_lines}
+
+
+def stream_notes(user, fmt, rows_per_chunk=200):
+    """형식별 내보내기 본문을 rows_per_chunk 행 단위 문자열 청크로 생성"""
+    return _chunked(_WRITERS[fmt](export_rows(user)), rows_per_chunk)
@@ -0,0 +1,181 @@
+"""
+커스텀 필드 값 색인 (?custom_fields__<name>[__lookup]=)
+- 노트 custom_fields 중 템플릿에 정의된 필드만 type 에 따라 NoteFieldValue 에 저장
+  number/integer/scale/boolean(1·0) → value_number, text/textarea/select/date → value_text(소문자, 255자 이하만),
+  tags → 태그마다 value_text 한 행
+- (name, value_number, note) / (name, value_text, note) 인덱스 범위 스캔 서브쿼리로 노트를 고르므로
+  JSON 디코딩 전체 스캔 없이 SQLite·PostgreSQL 모두 인덱스 사용
+- 갱신: 노트 저장(custom_fields·template 변경)·일괄 생성·템플릿 정의 변경 시 해당 노트 행 재작성,
+  노트 삭제는 FK CASCADE. 기존 데이터 백필은 rebuild_note_field_index
+"""
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+from .models import NoteFieldValue, Template, TastingNote
+from .schemas import SchemaError, get_template_schema
+
+NUMBER_TYPES = {"number", "integer", "scale", "boolean"}
+TEXT_TYPES = {"text", "textarea", "select", "date"}
+TEXT_MAX_LENGTH = 255
+FILTER_PREFIX = "custom_fields__"
+RANGE_LOOKUPS = ("gt", "gte", "lt", "lte")
+LOOKUPS = ("exact", "contains", *RANGE_LOOKUPS)
+BOOLEAN_WORDS = {"true": 1.0, "false": 0.0}
+
+
+def text_key(value):
+    return str(value).strip().casefold()
+
+
+def _number(value):
+    if isinstance(value, bool):
+        return float(value)
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).strip()
+    if text.lower() in BOOLEAN_WORDS:
+        return BOOLEAN_WORDS[text.lower()]
+    try:
+        number = float(text)
+    except ValueError:
+        return None
+    return number if number == number else None
+
+
+def field_value_rows(note_id, values, types):
+    """노트 1건의 custom_fields → NoteFieldValue 목록 (템플릿에 없는 키·알 수 없는 type 은 제외)"""
+    rows = []
+    if not isinstance(values, dict):
+        return rows
+    for name, value in values.items():
+        field_type = types.get(name)
+        if field_type is None or value is None or len(name) > 100:
+            continue
+        if field_type in NUMBER_TYPES:
+            number = _number(value)
+            if number is not None:
+                rows.append(NoteFieldValue(note_id=note_id, name=name, value_number=number))
+        elif field_type == "tags" and isinstance(value, list):
+            for tag in dict.fromkeys(text_key(tag) for tag in value if isinstance(tag, str)):
+                if tag and len(tag) <= TEXT_MAX_LENGTH:
+                    rows.append(NoteFieldValue(note_id=note_id, name=name, value_text=tag))
+        elif field_type in TEXT_TYPES and not isinstance(value, (dict, list)):
+            key = text_key(value)
+            if key and len(key) <= TEXT_MAX_LENGTH:
+                rows.append(NoteFieldValue(note_id=note_id, name=name, value_text=key))
+    return rows
+
+
+def _schema_types(template):
+    try:
+        return get_template_schema(template).types
+    except SchemaError:
+        return {}
+
+
+def index_note_fields(notes, batch_size=1000):
+    """노트들의 색인 행을 다시 쓴다 → 쓴 행 수 (템플릿은 로드된 것을 쓰고 없으면 IN 조회 1회)"""
+    notes = [note for note in notes if note.pk]
+    if not notes:
+        return 0
+    templates = {}
+    missing = set()
+    for note in notes:
+        if note.template_id is None:
+            continue
+        if TastingNote.template.is_cached(note) and note.template is not None:
+            templates[note.template_id] = note.template
+        else:
+            missing.add(note.template_id)
+    if missing - templates.keys():
+        templates.update(Template.objects.in_bulk(missing - templates.keys()))
+    types = {pk: _schema_types(template) for pk, template in templates.items()}
+    rows = []
+    for note in notes:
+        note_types = types.get(note.template_id)
+        if note_types:
+            rows.extend(field_value_rows(note.pk, note.custom_fields, note_types))
+    NoteFieldValue.objects.filter(note_id__in=[note.pk for note in notes]).delete()
+    NoteFieldValue.objects.bulk_create(rows, batch_size=batch_size)
+    return len(rows)
+
+
+def reindex_template_notes(template, batch_size=1000):
+    """템플릿 정의가 바뀌면 그 템플릿을 쓰는 노트 색인을 새 type 으로 재작성"""
+    notes = TastingNote.objects.filter(template=template).only("id", "template_id", "custom_fields")
+    batch = []
+    count = 0
+    for note in notes.iterator(chunk_size=batch_size):
+        note.template = template
+        batch.append(note)
+        if len(batch) >= batch_size:
+            count += index_note_fields(batch)
+            batch = []
+    if batch:
+        count += index_note_fields(batch)
+    return count
+
+
+def rebuild_note_field_index(batch_size=1000):
+    """전체 색인 재구축 → 쓴 행 수"""
+    NoteFieldValue.objects.all().delete()
+    notes = (
+        TastingNote.objects.filter(template__isnull=False)
+        .select_related("template")
+        .only("id", "template_id", "custom_fields", "template__id", "template__fields", "template__updated_at")
+        .order_by("id")
+    )
+    count = 0
+    batch = []
+    for note in notes.iterator(chunk_size=batch_size):
+        batch.append(note)
+        if len(batch) >= batch_size:
+            count += index_note_fields(batch, batch_size=batch_size)
+            batch = []
+    if batch:
+        count += index_note_fields(batch, batch_size=batch_size)
+    return count
+
+
+def parse_field_param(key):
+    """'custom_fields__pairing_score__gte' → ('pairing_score', 'gte'), 해당 없으면 None"""
+    if not key.startswith(FILTER_PREFIX):
+        return None
+    rest = key[len(FILTER_PREFIX):]
+    for lookup in LOOKUPS:
+        if rest.endswith(f"__{lookup}"):
+            return rest[: -len(lookup) - 2], lookup
+    return rest, "exact"
+
+
+def field_value_condition(name, lookup, raw):
+    """필터 값 → NoteFieldValue 조건. 숫자로 읽히면 숫자 열, 아니면 정규화한 문자 열 (날짜는 ISO 문자열 비교)"""
+    number = _number(raw)
+    if lookup in RANGE_LOOKUPS:
+        if number is not None:
+            return Q(name=name, **{f"value_number__{lookup}": number})
+        return Q(name=name, **{f"value_text__{lookup}": text_key(raw)})
+    condition = Q(value_text=text_key(raw))
+    if number is not None:
+        condition |= Q(value_number=number)
+    return Q(name=name) & condition
+
+
+class CustomFieldFilter(BaseFilterBackend):
+    """
+    ?custom_fields__<name>=값 (같음, tags 는 태그 포함), __contains=태그, __gt/__gte/__lt/__lte=값 (범위).
+    여러 개면 모두 만족 (AND). 각 조건은 색인 서브쿼리 (note_id IN ...)
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        for key, raw in request.query_params.items():
+            parsed = parse_field_param(key)
+            if parsed is None:
+                continue
+            name, lookup = parsed
+            if not name or not raw.strip():
+                raise ValidationError({key: "필드 이름과 값이 필요합니다."})
+            condition = field_value_condition(name, lookup, raw)
+            queryset = queryset.filter(id__in=NoteFieldValue.objects.filter(condition).values("note_id"))
+        return queryset
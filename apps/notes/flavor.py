@@ -0,0 +1,136 @@
+"""
+시음 노트 맛 프로필 (레이더 차트) — body, acidity, tannin, sweetness, aroma_intensity, appearance_intensity
+- 노트 쿼리셋에서 (평점, 6개 축, 와인 타입 코드) 를 values_list 조회 1회로 읽어 NumPy 배열로 적재.
+  행마다 값 8개 대신 SQL 에서 6진수 자릿수로 묶은 정수 1개를 읽고 NumPy 로 풀어 DB 드라이버의 값 생성 비용을 줄임
+  (NULL 은 0 = 미입력 — 축은 1~5, 와인 타입은 WINE_TYPES 순서 코드, 그 밖은 마지막 코드)
+- 축별 노트 수·평균·분산(모분산)·평점과의 상관계수(피어슨)는 충분 통계(개수, Σx, Σx², Σxr, Σr, Σr²)로 계산.
+  값이 0~5 정수이므로 (축, 와인 타입, 평점, 값) 히스토그램을 bincount 1회로 만들고 충분 통계는 그 위에서
+  (노트 수와 무관한 작은 배열 연산) — 타입별과 전체(타입 축 합)를 같은 연산으로
+- 미입력 값은 축마다 제외하고 상관계수도 그 축이 입력된 노트만으로 (값이 2개 미만이거나 분산이 0 이면 None)
+"""
+import numpy as np
+from django.db.models import Case, F, Value, When
+from django.db.models.functions import Coalesce
+
+from apps.wines.models import WINE_TYPES
+
+FLAVOR_FIELDS = ("body", "acidity", "tannin", "sweetness", "aroma_intensity", "appearance_intensity")
+WINE_TYPE_KEYS = tuple(key for key, _ in WINE_TYPES)
+MISSING = 0
+# 평점·축 값(0~5)을 6진수 한 자리씩, 와인 타입 코드는 최상위 자리
+BASE = 6
+UNKNOWN_TYPE = len(WINE_TYPE_KEYS)
+# 배열 열: 0 = 평점, 1..6 = 축, 마지막 = 와인 타입 코드
+AXES = slice(1, 1 + len(FLAVOR_FIELDS))
+# 분산 곱이 이보다 작으면 상관계수 없음 (값이 모두 같음)
+EPSILON = 1e-12
+
+
+def _packed_row():
+    packed = F("rating")
+    for digit, field in enumerate(FLAVOR_FIELDS, start=1):
+        packed = packed + Coalesce(field, Value(MISSING)) * BASE**digit
+    wine_type = Case(
+        *(When(wine__type=key, then=Value(code)) for code, key in enumerate(WINE_TYPE_KEYS)),
+        default=Value(UNKNOWN_TYPE),
+    )
+    return packed + wine_type * BASE ** (len(FLAVOR_FIELDS) + 1)
+
+
+def load_flavor_matrix(queryset):
+    """노트 쿼리셋 → (노트 수, 8) int8 배열 [평점, 6개 축(0=미입력), 와인 타입 코드] (조회 1회)"""
+    rows = list(
+        queryset.order_by()
+        .annotate(flavor_packed=_packed_row())
+        .values_list("flavor_packed", flat=True)
+    )
+    packed = np.fromiter(rows, dtype=np.int64, count=len(rows))
+    matrix = np.empty((len(rows), len(FLAVOR_FIELDS) + 2), dtype=np.int8)
+    for column in range(matrix.shape[1] - 1):
+        packed, matrix[:, column] = np.divmod(packed, BASE)
+    matrix[:, -1] = packed
+    return matrix
+
+
+def _histogram(matrix):
+    """
+    배열 → (축, 와인 타입 코드, 평점, 축 값) 노트 수 히스토그램 — bincount 1회.
+    값이 0~5 정수이므로 합계·제곱합·평점과의 곱의 합은 모두 이 작은 히스토그램에서 계산
+    """
+    type_codes = UNKNOWN_TYPE + 1
+    ratings = matrix[:, 0].astype(np.intp)
+    types = matrix[:, -1].astype(np.intp)
+    values = matrix[:, AXES].astype(np.intp)
+    cells = (types * BASE + ratings) * BASE
+    axes = np.arange(len(FLAVOR_FIELDS)) * (type_codes * BASE * BASE)
+    index = axes + cells[:, None] + values
+    shape = (len(FLAVOR_FIELDS), type_codes, BASE, BASE)
+    return np.bincount(index.ravel(), minlength=np.prod(shape)).reshape(shape)
+
+
+def _number(value, digits=3):
+    return None if np.isnan(value) else round(float(value), digits)
+
+
+def _statistics(histogram):
+    """
+    히스토그램 (축, 그룹, 평점, 값) → 그룹별 지표 배열 (축, 그룹) — 값 0(미입력)은 축마다 제외.
+    노트 수·평점 합계는 첫 축의 미입력 포함 전체에서
+    """
+    scale = np.arange(BASE, dtype=np.float64)
+    present = histogram[:, :, :, 1:].astype(np.float64)
+    x, r = scale[1:], scale[:, None]
+    counts = present.sum(axis=(2, 3))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = (present * x).sum(axis=(2, 3)) / counts
+        variances = np.maximum((present * x**2).sum(axis=(2, 3)) / counts - means**2, 0)
+        rating_means = (present * r).sum(axis=(2, 3)) / counts
+        rating_variances = np.maximum((present * r**2).sum(axis=(2, 3)) / counts - rating_means**2, 0)
+        covariances = (present * r * x).sum(axis=(2, 3)) / counts - means * rating_means
+        spread = variances * rating_variances
+        correlations = np.where(spread > EPSILON, covariances / np.sqrt(spread), np.nan)
+    notes = histogram[0].sum(axis=2)
+    return {
+        "note_count": notes.sum(axis=1),
+        "rating_sum": (notes * scale).sum(axis=1),
+        "count": counts,
+        "mean": means,
+        "variance": variances,
+        "rating_correlation": correlations,
+    }
+
+
+def _profile(stats, group):
+    """_statistics 결과의 그룹 1개 → {note_count, average_rating, axes: {축: {count, mean, variance, rating_correlation}}}"""
+    note_count = int(stats["note_count"][group])
+    return {
+        "note_count": note_count,
+        "average_rating": round(float(stats["rating_sum"][group] / note_count), 2) if note_count else None,
+        "axes": {
+            field: {
+                "count": int(stats["count"][i, group]),
+                "mean": _number(stats["mean"][i, group]),
+                "variance": _number(stats["variance"][i, group]),
+                "rating_correlation": _number(stats["rating_correlation"][i, group]),
+            }
+            for i, field in enumerate(FLAVOR_FIELDS)
+        },
+    }
+
+
+def flavor_profiles(matrix):
+    """배열 → (전체 프로필, {와인 타입: 프로필}) — 노트가 있는 타입만. 전체는 타입 축을 합친 히스토그램"""
+    histogram = _histogram(matrix)
+    by_type = _statistics(histogram)
+    overall = _statistics(histogram.sum(axis=1, keepdims=True))
+    return _profile(overall, 0), {
+        WINE_TYPE_KEYS[code]: _profile(by_type, code)
+        for code in range(UNKNOWN_TYPE)
+        if by_type["note_count"][code]
+    }
+
+
+def note_flavor_profile(queryset):
+    """노트 쿼리셋 → {axes: 축 이름 목록, overall: 프로필, by_wine_type: {타입: 프로필}} (조회 1회)"""
+    overall, by_type = flavor_profiles(load_flavor_matrix(queryset))
+    return {"axes": list(FLAVOR_FIELDS), "overall": overall, "by_wine_type": by_type}
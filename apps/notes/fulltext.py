@@ -0,0 +1,242 @@
+"""
+시음 노트 전문 검색 (?search=)
+- 문서: 와인 이름 + 메모(notes) + 아로마 노트 + 페어링을 토큰화해 별도 색인 테이블(tasting_note_fts)에 저장
+- 토큰화: 악센트·대소문자 정규화(apps.wines.search.normalize) 후 한글은 음절 bigram + 마지막 음절,
+  그 외 문자는 단어 단위 → 조사가 붙은 한글("체리향이")도 부분 일치, 라틴 단어는 접두 일치
+- 백엔드: SQLite FTS5 (bm25 순위) / PostgreSQL tsvector + GIN 인덱스 (ts_rank 순위). 그 밖의 DB나
+  색인 테이블이 없으면 기존 icontains 검색
+- 노트 저장/삭제·와인 이름 변경 시그널로 증분 갱신 (apps.notes.signals), 전체 재구축은 rebuild_note_search_index
+"""
+import re
+
+from django.db import connections
+from django.db.models import FloatField
+from django.db.models.expressions import RawSQL
+from rest_framework.filters import SearchFilter
+
+from apps.wines.search import normalize
+
+FTS_TABLE = "tasting_note_fts"
+DOCUMENT_FIELDS = ("wine__name", "notes", "aroma_notes", "pairing")
+_HANGUL = "가-힣"
+_WORD_RUNS = re.compile(rf"[{_HANGUL}]+|[^\W{_HANGUL}_]+")
+
+
+def _runs(text):
+    return _WORD_RUNS.findall(normalize(text))
+
+
+def document_tokens(text):
+    """색인용 토큰 — 한글 음절 bigram과 마지막 음절(한 글자 검색어 접두 일치용), 그 외 단어"""
+    tokens = []
+    for run in _runs(text):
+        if "가" <= run[0] <= "힣":
+            tokens.extend(run[i : i + 2] for i in range(len(run) - 1))
+            tokens.append(run[-1])
+        else:
+            tokens.append(run)
+    return tokens
+
+
+def query_terms(text):
+    """검색어 → [(토큰, 접두 일치 여부)] — 모든 토큰이 일치해야 검색 결과 (AND)"""
+    terms = []
+    for run in _runs(text):
+        if "가" <= run[0] <= "힣" and len(run) > 1:
+            terms.extend((run[i : i + 2], False) for i in range(len(run) - 1))
+        else:
+            terms.append((run, True))
+    return terms
+
+
+def document_text(*values):
+    return " ".join(token for value in values if value for token in document_tokens(value))
+
+
+class NoteSearchBackend:
+    """전문 검색 백엔드 공통 인터페이스 — DB별 색인 테이블 생성·갱신·검색 SQL"""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.table = connection.ops.quote_name(FTS_TABLE)
+
+    def create_schema(self, cursor):
+        raise NotImplementedError
+
+    def drop_schema(self, cursor):
+        cursor.execute(f"DROP TABLE IF EXISTS {self.table}")
+
+    def upsert(self, cursor, rows):
+        """rows: [(note_id, document_text), ...]"""
+        raise NotImplementedError
+
+    def delete(self, cursor, note_ids):
+        raise NotImplementedError
+
+    def match_query(self, terms):
+        """검색어 토큰 → 백엔드 질의 문자열"""
+        raise NotImplementedError
+
+    def match_sql(self):
+        """질의 문자열 1개를 받아 일치하는 노트 ID를 고르는 서브쿼리"""
+        raise NotImplementedError
+
+    def rank_sql(self, note_table):
+        """질의 문자열 1개를 받아 note_table 현재 행의 관련도(클수록 관련)를 계산하는 상관 서브쿼리"""
+        raise NotImplementedError
+
+
+class SQLiteNoteSearch(NoteSearchBackend):
+    """SQLite FTS5 가상 테이블 (rowid = 노트 ID)"""
+
+    def create_schema(self, cursor):
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.table} "
+            "USING fts5(document, tokenize = 'unicode61 remove_diacritics 2')"
+        )
+
+    def upsert(self, cursor, rows):
+        self.delete(cursor, [note_id for note_id, _ in rows])
+        cursor.executemany(f"INSERT INTO {self.table} (rowid, document) VALUES (%s, %s)", rows)
+
+    def delete(self, cursor, note_ids):
+        cursor.executemany(f"DELETE FROM {self.table} WHERE rowid = %s", [(pk,) for pk in note_ids])
+
+    def match_query(self, terms):
+        return " ".join(f'"{token}"*' if prefix else f'"{token}"' for token, prefix in terms)
+
+    def match_sql(self):
+        return f"SELECT rowid FROM {self.table} WHERE {self.table} MATCH %s"
+
+    def rank_sql(self, note_table):
+        return (
+            f"SELECT -bm25({self.table}) FROM {self.table} "
+            f"WHERE {self.table} MATCH %s AND rowid = {note_table}.id"
+        )
+
+
+class PostgresNoteSearch(NoteSearchBackend):
+    """PostgreSQL tsvector 컬럼 + GIN 인덱스 ('simple' 구성 — 토큰화는 document_tokens 에서 처리)"""
+
+    def create_schema(self, cursor):
+        cursor.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} ("
+            "note_id bigint PRIMARY KEY REFERENCES tasting_notes (id) ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED, "
+            "document tsvector NOT NULL)"
+        )
+        cursor.execute(
+            f"CREATE INDEX IF NOT EXISTS tasting_note_fts_document_gin ON {self.table} USING GIN (document)"
+        )
+
+    def upsert(self, cursor, rows):
+        cursor.executemany(
+            f"INSERT INTO {self.table} (note_id, document) VALUES (%s, to_tsvector('simple', %s)) "
+            "ON CONFLICT (note_id) DO UPDATE SET document = EXCLUDED.document",
+            rows,
+        )
+
+    def delete(self, cursor, note_ids):
+        cursor.execute(f"DELETE FROM {self.table} WHERE note_id = ANY(%s)", [list(note_ids)])
+
+    def match_query(self, terms):
+        # 토큰은 \w 문자로만 이루어져 있으므로 따옴표로 감싸면 tsquery 문법 오류가 없다
+        return " & ".join(f"'{token}':*" if prefix else f"'{token}'" for token, prefix in terms)
+
+    def match_sql(self):
+        return f"SELECT note_id FROM {self.table} WHERE document @@ to_tsquery('simple', %s)"
+
+    def rank_sql(self, note_table):
+        return (
+            f"SELECT ts_rank(document, to_tsquery('simple', %s)) FROM {self.table} "
+            f"WHERE note_id = {note_table}.id"
+        )
+
+
+BACKENDS = {
+    "sqlite": SQLiteNoteSearch,
+    "postgresql": PostgresNoteSearch,
+}
+_available = {}
+
+
+def get_backend(using="default", check_table=True):
+    """DB 별칭의 전문 검색 백엔드. 지원하지 않는 DB이거나 색인 테이블이 없으면 None."""
+    connection = connections[using]
+    backend_class = BACKENDS.get(connection.vendor)
+    if backend_class is None:
+        return None
+    if check_table:
+        if using not in _available:
+            _available[using] = FTS_TABLE in connection.introspection.table_names()
+        if not _available[using]:
+            return None
+    return backend_class(connection)
+
+
+def clear_backend_cache(using="default"):
+    """색인 테이블 생성·삭제 후 다음 get_backend 에서 테이블 존재 여부를 다시 확인"""
+    _available.pop(using, None)
+
+
+def index_notes(queryset, using="default", batch_size=1000):
+    """queryset 의 노트 문서를 색인에 반영 → 색인한 노트 수"""
+    backend = get_backend(using)
+    if backend is None:
+        return 0
+    rows = queryset.order_by().values_list("id", *DOCUMENT_FIELDS)
+    count = 0
+    batch = []
+    with backend.connection.cursor() as cursor:
+        for note_id, *values in rows.iterator(chunk_size=batch_size):
+            batch.append((note_id, document_text(*values)))
+            if len(batch) >= batch_size:
+                backend.upsert(cursor, batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            backend.upsert(cursor, batch)
+            count += len(batch)
+    return count
+
+
+def unindex_notes(note_ids, using="default"):
+    backend = get_backend(using)
+    if backend is not None and note_ids:
+        with backend.connection.cursor() as cursor:
+            backend.delete(cursor, note_ids)
+
+
+def rebuild_note_search_index(using="default", batch_size=1000):
+    """색인 테이블을 다시 만들고 전체 노트 색인 → 색인한 노트 수"""
+    from .models import TastingNote
+
+    backend = get_backend(using, check_table=False)
+    if backend is None:
+        return 0
+    with backend.connection.cursor() as cursor:
+        backend.drop_schema(cursor)
+        backend.create_schema(cursor)
+    clear_backend_cache(using)
+    return index_notes(TastingNote.objects.using(using).all(), using=using, batch_size=batch_size)
+
+
+class NoteFullTextSearchFilter(SearchFilter):
+    """
+    ?search= 를 전문 검색 색인으로 처리. ?ordering= 이 없으면 관련도 순 (동률은 뷰 기본 정렬).
+    OrderingFilter 뒤에 두어야 관련도 정렬이 기본 정렬로 덮이지 않는다.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        text = request.query_params.get(self.search_param, "")
+        backend = get_backend(queryset.db)
+        terms = query_terms(text)
+        if backend is None or not terms:
+            return super().filter_queryset(request, queryset, view)
+        query = backend.match_query(terms)
+        queryset = queryset.filter(id__in=RawSQL(backend.match_sql(), [query]))
+        if request.query_params.get("ordering"):
+            return queryset
+        note_table = backend.connection.ops.quote_name(queryset.model._meta.db_table)
+        rank = RawSQL(backend.rank_sql(note_table), [query], output_field=FloatField())
+        ordering = [f for f in (getattr(view, "ordering", None) or []) if f]
+        return queryset.annotate(search_rank=rank).order_by("-search_rank", *ordering)
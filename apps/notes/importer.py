@@ -0,0 +1,365 @@
+"""
+다른 앱에서 내보낸 시음 노트 CSV 가져오기 (POST /api/tasting-notes/import/)
+- 업로드 CSV를 한 행씩 스트리밍으로 읽어 batch_size 단위로 처리 (메모리 일정)
+- 열 이름 별칭으로 TastingNote 필드에 대응 (Wine/Score/Date/Comment, 한글 열 이름 등),
+  대응하지 않는 열은 custom_fields 에 원래 열 이름으로 저장. 이 앱의 내보내기 파일(apps.notes.export)도 그대로 가져옴
+- 와인은 (이름 대조 키, 빈티지)로 카탈로그와 대조 — 이름 키는 색인된 Wine.name_key (apps.wines.dedup.wine_name_key,
+  대소문자·악센트·구두점·약어 차이 무시). 작업 단위 캐시 + 배치마다 name_key IN 조회 1회, 없는 와인은 bulk_create
+- 항목 검증은 일괄 생성 시리얼라이저, 저장은 apps.notes.bulk.create_notes_bulk (배치마다 한 트랜잭션)
+- 백그라운드 스레드로 실행하고 진행 상황은 체크포인트(JSON)로 조회 (apps.wines.importer 와 같은 방식)
+"""
+import csv
+import io
+import json
+import logging
+import threading
+import time
+import uuid
+from datetime import date, datetime
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.wines.importer import read_checkpoint, write_checkpoint
+from apps.wines.models import Wine, WINE_TYPES
+from apps.wines.dedup import name_vintage, wine_name_key
+from apps.wines.search import normalize, record_wine_changes
+
+from .bulk import create_notes_bulk
+from .models import TastingNote
+from .serializers import TastingNoteBulkItemSerializer
+
+MAX_ERROR_SAMPLES = 100
+
+logger = logging.getLogger(__name__)
+
+# 정규화된 열 이름 → 필드 (wine_* 는 와인 대조·생성용)
+COLUMN_ALIASES = {
+    "wine_name": ("wine_name", "wine", "name", "wine_title", "와인", "와인명", "와인_이름"),
+    "wine_vintage": ("wine_vintage", "vintage", "year", "빈티지"),
+    "wine_winery": ("wine_winery", "winery", "producer", "와이너리", "생산자"),
+    "wine_type": ("wine_type", "type", "wine_color", "종류", "와인_종류"),
+    "wine_region": ("wine_region", "region", "appellation", "산지", "지역"),
+    "wine_country": ("wine_country", "country", "국가"),
+    "rating": ("rating", "score", "stars", "my_rating", "평점", "별점", "점수"),
+    "tasted_date": ("tasted_date", "date", "tasting_date", "drank_on", "drink_date", "시음일", "날짜"),
+    "notes": ("notes", "note", "comment", "comments", "review", "tasting_notes", "메모", "노트", "후기"),
+    "aroma_notes": ("aroma_notes", "aroma", "aromas", "nose", "아로마", "향"),
+    "pairing": ("pairing", "food_pairing", "food", "페어링", "음식"),
+    "location": ("location", "place_type", "장소", "장소_유형"),
+    "location_detail": ("location_detail", "place", "venue", "장소_상세"),
+    "appearance_clarity": ("appearance_clarity", "clarity", "투명도"),
+    "appearance_intensity": ("appearance_intensity", "color_intensity"),
+    "color": ("color", "colour", "색상"),
+    "aroma_intensity": ("aroma_intensity",),
+    "body": ("body", "바디"),
+    "acidity": ("acidity", "산도"),
+    "tannin": ("tannin", "tannins", "탄닌"),
+    "sweetness": ("sweetness", "당도"),
+    "is_public": ("is_public", "public", "공개"),
+    "custom_fields": ("custom_fields",),
+    "photos": ("photos",),
+}
+# 이 앱의 내보내기 파일에 있지만 가져오지 않는 열
+IGNORED_COLUMNS = {"id", "created_at", "updated_at", "user", "username"}
+DATE_FORMATS = ("%Y-%m-%d", "%Y/%m/%d", "%Y.%m.%d", "%Y%m%d", "%m/%d/%Y", "%d.%m.%Y")
+TRUE_VALUES = {"1", "true", "yes", "y", "t", "on", "공개", "예"}
+
+_COLUMN_LOOKUP = {alias: field for field, aliases in COLUMN_ALIASES.items() for alias in aliases}
+_WINE_TYPE_LOOKUP = {key: key for key, _ in WINE_TYPES}
+_WINE_TYPE_LOOKUP.update({label: key for key, label in WINE_TYPES})
+_LOCATION_LOOKUP = {key: key for key, _ in TastingNote.LOCATION_CHOICES}
+_LOCATION_LOOKUP.update({label: key for key, label in TastingNote.LOCATION_CHOICES})
+
+
+class NoteRowError(ValueError):
+    """노트 CSV 행 해석 실패"""
+
+
+def _column_key(header):
+    return "_".join(normalize(header or "").replace("-", " ").split())
+
+
+def map_columns(headers):
+    """CSV 헤더 → {원래 열 이름: 필드 이름 또는 None(custom_fields)}; 무시할 열은 제외"""
+    mapping = {}
+    used = set()
+    for header in headers:
+        key = _column_key(header)
+        if not key or key in IGNORED_COLUMNS:
+            continue
+        field = _COLUMN_LOOKUP.get(key)
+        if field in used:
+            field = None
+        if field:
+            used.add(field)
+        mapping[header] = field
+    return mapping
+
+
+def parse_rating(value):
+    """5점 척도로 변환 — 10점·100점 척도와 소수점(4.5) 허용"""
+    try:
+        number = Decimal(str(value).strip().rstrip("점★"))
+    except InvalidOperation:
+        raise NoteRowError(f"rating: 숫자가 아닙니다 ({value}).")
+    if number > 10:
+        number /= 20
+    elif number > 5:
+        number /= 2
+    rating = int(number.to_integral_value(rounding=ROUND_HALF_UP))
+    return min(max(rating, 1), 5)
+
+
+def parse_date(value):
+    value = str(value).strip()
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value[:10] if fmt == "%Y-%m-%d" else value, fmt).date()
+        except ValueError:
+            continue
+    raise NoteRowError(f"tasted_date: 날짜 형식을 알 수 없습니다 ({value}).")
+
+
+def _vintage(value):
+    value = str(value or "").strip()
+    if not value:
+        return None
+    try:
+        vintage = int(value)
+    except ValueError:
+        return None
+    return vintage if 1900 <= vintage <= date.today().year + 1 else None
+
+
+def _json(value, expected):
+    if isinstance(value, expected):
+        return value
+    try:
+        parsed = json.loads(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if isinstance(parsed, expected) else None
+
+
+def clean_row(row, mapping):
+    """CSV 행 1개 → (와인 키, 와인 생성용 값, 노트 필드 dict). 잘못된 행은 NoteRowError."""
+    wine_values = {}
+    note = {}
+    custom = {}
+    for header, field in mapping.items():
+        value = row.get(header)
+        value = value.strip() if isinstance(value, str) else value
+        if value in (None, ""):
+            continue
+        if field is None:
+            custom[header] = value
+        elif field.startswith("wine_"):
+            wine_values[field[5:]] = value
+        elif field == "custom_fields":
+            custom.update(_json(value, dict) or {})
+        else:
+            note[field] = value
+
+    name = wine_values.get("name", "")
+    if not name:
+        raise NoteRowError("와인 이름 열이 필요합니다.")
+    if "rating" not in note:
+        raise NoteRowError("rating이 필요합니다.")
+    if "tasted_date" not in note:
+        raise NoteRowError("tasted_date가 필요합니다.")
+    note["rating"] = parse_rating(note["rating"])
+    note["tasted_date"] = parse_date(note["tasted_date"]).isoformat()
+    if "is_public" in note:
+        note["is_public"] = str(note["is_public"]).lower() in TRUE_VALUES
+    if "location" in note:
+        location = _LOCATION_LOOKUP.get(str(note["location"]).lower()) or _LOCATION_LOOKUP.get(note["location"])
+        if location is None:
+            note.setdefault("location_detail", note["location"])
+            location = "other"
+        note["location"] = location
+    if "photos" in note:
+        note["photos"] = _json(note["photos"], list) or []
+    if custom:
+        note["custom_fields"] = custom
+
+    vintage = _vintage(wine_values.get("vintage"))
+    wine_type = str(wine_values.get("type", "")).lower()
+    wine = {
+        "name": name[:200],
+        "vintage": vintage,
+        "winery": str(wine_values.get("winery", ""))[:200],
+        "type": _WINE_TYPE_LOOKUP.get(wine_type) or _WINE_TYPE_LOOKUP.get(wine_values.get("type"), "other"),
+        "region": str(wine_values.get("region", ""))[:100],
+        "country": str(wine_values.get("country", ""))[:100],
+    }
+    wine["name_key"] = wine_name_key(wine["name"], vintage)
+    return (wine["name_key"], name_vintage(wine["name"], vintage)), wine, note
+
+
+class WineResolver:
+    """(이름 키, 빈티지) → 와인 ID. 작업 동안 캐시하고 배치마다 후보 조회 1회, 없는 와인은 일괄 생성."""
+
+    def __init__(self):
+        self.cache = {}
+        self.created = 0
+
+    def resolve(self, wines):
+        """wines: {키: 와인 생성용 값} → 모든 키가 cache 에 채워짐"""
+        missing = {key: values for key, values in wines.items() if key not in self.cache}
+        if not missing:
+            return
+        rows = (
+            Wine.objects.filter(name_key__in={name_key for name_key, _ in missing})
+            .order_by("id")
+            .values_list("id", "name", "name_key", "vintage")
+        )
+        for pk, name, name_key, vintage in rows:
+            # 빈티지가 비어 있으면 이름 속 연도 (중복 탐지와 같은 기준)
+            self.cache.setdefault((name_key, name_vintage(name, vintage)), pk)
+        new = {key: values for key, values in missing.items() if key not in self.cache}
+        if new:
+            with transaction.atomic():
+                created = Wine.objects.bulk_create(Wine(**values) for values in new.values())
+                # bulk_create는 post_save 시그널이 없으므로 검색 색인 변경 로그를 직접 기록
+                record_wine_changes([wine.pk for wine in created])
+            for key, wine in zip(new, created):
+                self.cache[key] = wine.pk
+            self.created += len(created)
+
+
+class NoteImporter:
+    """사용자 1명의 노트 CSV 파일 1개를 배치로 가져온다. checkpoint_path 가 있으면 배치마다 진행 상황 기록."""
+
+    def __init__(self, user, path, batch_size=500, checkpoint_path=None, progress=None):
+        self.user = user
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        self.progress = progress
+        self.wines = WineResolver()
+        self.state = {
+            "user_id": user.pk,
+            "status": "pending",
+            "rows_read": 0,
+            "notes_created": 0,
+            "wines_created": 0,
+            "rows_failed": 0,
+            "custom_columns": [],
+            "error_samples": [],
+            "started_at": timezone.now().isoformat(),
+            "updated_at": None,
+        }
+
+    def run(self):
+        self.state["status"] = "running"
+        started = time.perf_counter()
+        try:
+            with open(self.path, "rb") as fp:
+                reader = csv.DictReader(io.TextIOWrapper(fp, encoding="utf-8-sig", newline=""))
+                mapping = map_columns(reader.fieldnames or [])
+                self.state["custom_columns"] = [h for h, field in mapping.items() if field is None]
+                batch = []
+                # 헤더가 1행이므로 데이터 행 번호는 2부터
+                for line_no, row in enumerate(reader, start=2):
+                    batch.append((line_no, row))
+                    if len(batch) >= self.batch_size:
+                        self._flush(batch, mapping, started)
+                        batch = []
+                if batch:
+                    self._flush(batch, mapping, started)
+        except Exception as exc:
+            self.state["status"] = "failed"
+            self.state["error"] = str(exc)
+            self._save_checkpoint()
+            raise
+        self.state["status"] = "done"
+        self._save_checkpoint()
+        return self.state
+
+    def _error(self, line_no, message):
+        self.state["rows_failed"] += 1
+        if len(self.state["error_samples"]) < MAX_ERROR_SAMPLES:
+            self.state["error_samples"].append({"line": line_no, "error": message})
+
+    def _flush(self, batch, mapping, started):
+        parsed = []
+        for line_no, row in batch:
+            try:
+                parsed.append((line_no, *clean_row(row, mapping)))
+            except NoteRowError as exc:
+                self._error(line_no, str(exc))
+        self.wines.resolve({key: wine for _, key, wine, _ in parsed})
+
+        # 템플릿 열은 가져오지 않으므로 request 없이 와인만 미리 읽은 context
+        wine_ids = {self.wines.cache[key] for _, key, _, _ in parsed}
+        context = {"request": None, "wines": Wine.objects.in_bulk(wine_ids), "templates": {}}
+        valid = []
+        for line_no, key, _, note in parsed:
+            note["wine"] = self.wines.cache[key]
+            ser = TastingNoteBulkItemSerializer(data=note, context=context)
+            if ser.is_valid():
+                valid.append(ser.validated_data)
+            else:
+                self._error(line_no, json.dumps(ser.errors, ensure_ascii=False))
+        created = create_notes_bulk(self.user, valid)
+
+        self.state["rows_read"] += len(batch)
+        self.state["notes_created"] += len(created)
+        self.state["wines_created"] = self.wines.created
+        self._save_checkpoint()
+        if self.progress:
+            self.progress(self.state, time.perf_counter() - started)
+
+    def _save_checkpoint(self):
+        self.state["updated_at"] = timezone.now().isoformat()
+        if self.checkpoint_path:
+            write_checkpoint(self.checkpoint_path, self.state)
+
+
+# --- API 업로드용 백그라운드 작업 (작업 ID = 체크포인트 파일명) ---
+
+
+def _import_dir():
+    return Path(getattr(settings, "NOTE_IMPORT_DIR", Path(settings.BASE_DIR) / "var" / "note_imports"))
+
+
+def start_note_import_job(user, uploaded_file):
+    """업로드 CSV를 디스크에 청크 단위로 저장하고 백그라운드 스레드에서 가져오기 시작 → 작업 ID"""
+    job_id = uuid.uuid4().hex
+    directory = _import_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    source = directory / f"{job_id}.csv"
+    with open(source, "wb") as fp:
+        for chunk in uploaded_file.chunks():
+            fp.write(chunk)
+    importer = NoteImporter(user, source, checkpoint_path=directory / f"{job_id}.json")
+    importer._save_checkpoint()
+    threading.Thread(target=_run_note_import_job, args=(importer,), daemon=True).start()
+    return job_id
+
+
+def _run_note_import_job(importer):
+    try:
+        importer.run()
+    except Exception:  # noqa: BLE001 — 실패 상태는 체크포인트에 기록됨
+        logger.exception("시음 노트 가져오기 실패: %s", importer.path)
+    finally:
+        importer.path.unlink(missing_ok=True)
+        connection.close()
+
+
+def get_note_import_job(user, job_id):
+    """본인 작업의 진행 상황 (없거나 다른 사용자 작업이면 None)"""
+    if not job_id.isalnum():
+        return None
+    path = _import_dir() / f"{job_id}.json"
+    if not path.exists():
+        return None
+    state = read_checkpoint(path)
+    if state.get("user_id") != user.pk:
+        return None
+    return state
@@ -0,0 +1,119 @@
+"""
+맛 프로필 벤치마크 — 사용자 1명의 노트 --notes 건(기본 10만)으로 apps.notes.flavor 프로필을 "조회+적재"와
+"계산"으로 나눠 측정하고 --target-ms 와 비교한다. 결과는 순수 파이썬 계산(미입력 제외 평균·모분산·피어슨)과 대조.
+임시 데이터(와인·노트)를 트랜잭션 안에서 생성하고 측정 후 롤백한다 (DB에 남지 않음). 불일치 시 실패 종료.
+
+사용: python manage.py benchmark_flavor_profile [--notes 100000] [--repeat 10] [--target-ms 100]
+"""
+import math
+import random
+import statistics
+import time
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.notes.flavor import FLAVOR_FIELDS, flavor_profiles, load_flavor_matrix, note_flavor_profile
+from apps.notes.models import TastingNote
+from apps.wines.models import Wine
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "사용자 노트 맛 프로필(NumPy 벡터 연산)의 조회·계산 시간을 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--notes", type=int, default=100_000)
+        parser.add_argument("--repeat", type=int, default=10)
+        parser.add_argument("--target-ms", type=float, default=100.0)
+
+    def handle(self, *args, **options):
+        self.repeat = options["repeat"]
+        try:
+            with transaction.atomic():
+                user = self._seed(options["notes"])
+                notes = TastingNote.objects.filter(user=user)
+                matrix = load_flavor_matrix(notes)
+                load = self._measure("조회+적재", lambda: load_flavor_matrix(notes))
+                compute = self._measure("계산(전체+타입별)", lambda: flavor_profiles(matrix))
+                total = self._measure("합계", lambda: note_flavor_profile(notes))
+                self._verify(notes, *flavor_profiles(matrix))
+                raise _Rollback
+        except _Rollback:
+            pass
+        style = self.style.SUCCESS if total < options["target_ms"] else self.style.WARNING
+        self.stdout.write(
+            style(
+                f"노트 {options['notes']:,}건: 조회+적재 {load:.1f}ms + 계산 {compute:.1f}ms, "
+                f"합계 {total:.1f}ms (목표 {options['target_ms']:.0f}ms)"
+            )
+        )
+
+    def _seed(self, count):
+        rnd = random.Random(0)
+        user, _ = get_user_model().objects.get_or_create(
+            username="__bench_flavor__", defaults={"email": "bench-flavor@example.invalid"}
+        )
+        Wine.objects.bulk_create(
+            Wine(name=f"Bench Flavor Wine {i:03d}", type=rnd.choice(["red", "white", "rose", "sparkling"]))
+            for i in range(200)
+        )
+        wine_ids = list(Wine.objects.filter(name__startswith="Bench Flavor Wine").values_list("id", flat=True))
+
+        def scale():
+            # 일부는 미입력 (null-aware 경로 포함)
+            return rnd.randint(1, 5) if rnd.random() < 0.8 else None
+
+        for offset in range(0, count, 5000):
+            TastingNote.objects.bulk_create(
+                TastingNote(
+                    user=user,
+                    wine_id=rnd.choice(wine_ids),
+                    rating=rnd.randint(1, 5),
+                    tasted_date=date(2020, 1, 1) + timedelta(days=rnd.randrange(2000)),
+                    **{field: scale() for field in FLAVOR_FIELDS},
+                )
+                for _ in range(min(5000, count - offset))
+            )
+        return user
+
+    def _verify(self, notes, overall, by_type):
+        """NumPy 결과(전체·와인 타입별)를 순수 파이썬 계산과 대조"""
+        rows = list(notes.values_list("wine__type", "rating", *FLAVOR_FIELDS))
+        failures = []
+        groups = {"전체": (overall, rows)}
+        for wine_type, profile in by_type.items():
+            groups[wine_type] = (profile, [row for row in rows if row[0] == wine_type])
+        for label, (profile, group_rows) in groups.items():
+            if profile["note_count"] != len(group_rows):
+                failures.append(f"{label}: 노트 수 {profile['note_count']} ≠ {len(group_rows)}")
+            for i, field in enumerate(FLAVOR_FIELDS, start=2):
+                pairs = [(row[i], row[1]) for row in group_rows if row[i] is not None]
+                values = [value for value, _ in pairs]
+                expected = {
+                    "count": len(values),
+                    "mean": statistics.fmean(values),
+                    "variance": statistics.pvariance(values),
+                    "rating_correlation": statistics.correlation(values, [rating for _, rating in pairs]),
+                }
+                actual = profile["axes"][field]
+                if any(not math.isclose(actual[key], expected[key], abs_tol=1e-3) for key in expected):
+                    failures.append(f"{label} {field}: {actual} ≠ {expected}")
+        if failures:
+            raise CommandError("\n".join(failures))
+        self.stdout.write("  순수 파이썬 계산과 일치")
+
+    def _measure(self, label, func):
+        timings = []
+        for _ in range(self.repeat):
+            started = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - started) * 1000)
+        median = statistics.median(timings)
+        self.stdout.write(f"  {label:<20} median {median:8.2f} ms")
+        return median
@@ -0,0 +1,129 @@
+"""
+목록 직렬화 벤치마크 — DRF 시리얼라이저(모델 인스턴스 + 중첩 WineListSerializer) vs values() 행 빠른 직렬화
+(config.fastlist). 시음 노트 목록·와인 목록 한 페이지를 "조회 + 직렬화"와 "직렬화만"으로 나눠 측정한다.
+임시 데이터(와인·노트 --page-size 건)를 트랜잭션 안에서 생성하고 측정 후 롤백한다 (DB에 남지 않음).
+
+사용: python manage.py benchmark_list_serialization [--page-size 100] [--repeat 20] [--fields id,rating,wine.name]
+"""
+import random
+import statistics
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.notes.models import TastingNote
+from apps.notes.serializers import TastingNoteListSerializer
+from apps.wines.models import Wine
+from apps.wines.serializers import WineSearchSerializer
+from config.fastlist import FastListSerializer, parse_fields
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "목록 한 페이지의 DRF 직렬화와 values() 빠른 직렬화 비용을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--page-size", type=int, default=100)
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument("--fields", default="", help="선택 필드 (?fields= 형식) — 빠른 경로에 추가로 측정")
+
+    def handle(self, *args, **options):
+        self.repeat = options["repeat"]
+        try:
+            with transaction.atomic():
+                note_ids, wine_ids = self._seed(options["page_size"])
+                self._compare(
+                    "시음 노트 목록",
+                    TastingNoteListSerializer,
+                    TastingNote.objects.select_related("user", "wine"),
+                    TastingNote.objects,
+                    note_ids,
+                    options["fields"],
+                )
+                self._compare(
+                    "와인 목록",
+                    WineSearchSerializer,
+                    Wine.objects.select_related("note_stats"),
+                    Wine.objects,
+                    wine_ids,
+                    "",
+                )
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _seed(self, count):
+        rnd = random.Random(0)
+        user, _ = get_user_model().objects.get_or_create(
+            username="__bench_serialization__", defaults={"email": "bench@example.invalid"}
+        )
+        Wine.objects.bulk_create(
+            Wine(
+                name=f"Bench Serialization Wine {i:04d}",
+                type=rnd.choice(["red", "white", "sparkling"]),
+                region="Bordeaux",
+                country="France",
+                vintage=2000 + i % 20,
+                grape_varieties=["Cabernet Sauvignon", "Merlot"],
+                alcohol_content=Decimal("13.5"),
+                average_price=Decimal("45000.00"),
+                winery="Bench Winery",
+            )
+            for i in range(count)
+        )
+        wine_ids = list(
+            Wine.objects.filter(name__startswith="Bench Serialization Wine").values_list("id", flat=True)
+        )
+        TastingNote.objects.bulk_create(
+            TastingNote(
+                user=user,
+                wine_id=rnd.choice(wine_ids),
+                rating=rnd.randint(1, 5),
+                tasted_date=date(2024, 1, 1) + timedelta(days=rnd.randrange(600)),
+                location=rnd.choice(["home", "restaurant", "bar"]),
+                pairing="스테이크",
+                photos=[{"url": "/media/tasting_notes/photos/ab/ab.jpg", "name": "tasting_notes/photos/ab/ab.jpg"}],
+                is_public=True,
+            )
+            for _ in range(count)
+        )
+        note_ids = list(TastingNote.objects.filter(user=user).values_list("id", flat=True))
+        return note_ids, wine_ids
+
+    def _compare(self, title, serializer_class, instances, queryset, ids, fields):
+        self.stdout.write(self.style.MIGRATE_HEADING(f"{title} ({len(ids)}건)"))
+        rows = list(instances.filter(pk__in=ids))
+        fast = FastListSerializer(serializer_class)
+        values = fast.fetch(queryset, ids)
+        drf_only = self._measure("DRF 직렬화만", lambda: serializer_class(rows, many=True).data)
+        fast_only = self._measure("빠른 직렬화만", lambda: fast.serialize(values))
+        drf_total = self._measure(
+            "DRF 조회+직렬화", lambda: serializer_class(list(instances.filter(pk__in=ids)), many=True).data
+        )
+        fast_total = self._measure("빠른 조회+직렬화", lambda: fast.serialize(fast.fetch(queryset, ids)))
+        if fields:
+            sparse = FastListSerializer(serializer_class, parse_fields(fields))
+            self._measure(f"fields={fields}", lambda: sparse.serialize(sparse.fetch(queryset, ids)))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"  직렬화 {drf_only / fast_only:.1f}배, 조회 포함 {drf_total / fast_total:.1f}배 빠름 "
+                f"(행당 {drf_only / len(ids) * 1000:.1f}µs → {fast_only / len(ids) * 1000:.1f}µs)"
+            )
+        )
+
+    def _measure(self, label, func):
+        timings = []
+        for _ in range(self.repeat):
+            started = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - started) * 1000)
+        median = statistics.median(timings)
+        self.stdout.write(f"  {label:<24} median {median:8.2f} ms")
+        return median
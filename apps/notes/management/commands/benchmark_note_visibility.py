@@ -0,0 +1,113 @@
+"""
+시음 노트 목록 가시성 쿼리 벤치마크 — 기존 OR + DISTINCT 쿼리 vs 두 인덱스 스트림 병합(apps.notes.visibility).
+임시 데이터(기본 노트 1,000만 건)를 트랜잭션 안에서 생성하고 측정 후 롤백한다 (DB에 남지 않음).
+
+사용: python manage.py benchmark_note_visibility [--notes 10000000] [--users 1000] [--public-ratio 0.5]
+      [--pages 1 50] [--page-size 20] [--repeat 5]
+"""
+import random
+import statistics
+import time
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.core.paginator import Paginator
+from django.db import transaction
+from django.db.models import Q
+
+from apps.notes.models import TastingNote
+from apps.notes.visibility import VisibleNotes, visible_note_streams
+from apps.notes.views import TastingNoteViewSet
+from apps.wines.models import Wine
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "시음 노트 목록의 OR + DISTINCT 쿼리와 스트림 병합 쿼리 지연을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--notes", type=int, default=10_000_000)
+        parser.add_argument("--users", type=int, default=1000)
+        parser.add_argument("--public-ratio", type=float, default=0.5)
+        parser.add_argument("--pages", nargs="+", type=int, default=[1, 50])
+        parser.add_argument("--page-size", type=int, default=20)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--batch-size", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        self.repeat = options["repeat"]
+        page_size = options["page_size"]
+        try:
+            with transaction.atomic():
+                user = self._seed(options)
+                ordering = TastingNoteViewSet.ordering
+                legacy = (
+                    TastingNote.objects.filter(Q(user=user) | Q(is_public=True))
+                    .select_related("user", "wine", "template")
+                    .distinct()
+                    .order_by(*ordering)
+                )
+                merged = VisibleNotes(qs.order_by(*ordering) for qs in visible_note_streams(user))
+                for page in options["pages"]:
+                    self.stdout.write(self.style.MIGRATE_HEADING(f"page {page} (page_size {page_size})"))
+                    self._measure("OR + DISTINCT", lambda: self._page(legacy, page, page_size))
+                    self._measure("스트림 병합", lambda: self._page(merged, page, page_size))
+                self.stdout.write(self.style.MIGRATE_HEADING("첫 페이지 행만 (COUNT 없음, 키셋 커서 모드)"))
+                self._measure("OR + DISTINCT", lambda: list(legacy[:page_size]))
+                self._measure("스트림 병합", lambda: merged[:page_size])
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _seed(self, options):
+        notes, users = options["notes"], options["users"]
+        batch_size = options["batch_size"]
+        self.stdout.write(f"임시 데이터 생성: 사용자 {users}명, 시음 노트 {notes}건 ...")
+        started = time.perf_counter()
+        User = get_user_model()
+        User.objects.bulk_create(
+            User(username=f"__bench_visibility_{i}__", email=f"bench{i}@example.invalid")
+            for i in range(users)
+        )
+        user_ids = list(
+            User.objects.filter(username__startswith="__bench_visibility_").values_list("id", flat=True)
+        )
+        wine_ids = list(Wine.objects.values_list("id", flat=True)[:1000])
+        if not wine_ids:
+            Wine.objects.bulk_create(Wine(name=f"Bench Wine {i:04d}", type="red") for i in range(1000))
+            wine_ids = list(Wine.objects.values_list("id", flat=True)[:1000])
+        rnd = random.Random(0)
+        start = date(2000, 1, 1)
+        public_ratio = options["public_ratio"]
+        for offset in range(0, notes, batch_size):
+            TastingNote.objects.bulk_create(
+                [
+                    TastingNote(
+                        user_id=rnd.choice(user_ids),
+                        wine_id=rnd.choice(wine_ids),
+                        rating=rnd.randint(1, 5),
+                        tasted_date=start + timedelta(days=rnd.randrange(9000)),
+                        is_public=rnd.random() < public_ratio,
+                    )
+                    for _ in range(min(batch_size, notes - offset))
+                ]
+            )
+        self.stdout.write(f"  생성 완료 ({time.perf_counter() - started:.1f}s)")
+        return User.objects.get(pk=user_ids[0])
+
+    @staticmethod
+    def _page(queryset, page, page_size):
+        paginator = Paginator(queryset, page_size)
+        return list(paginator.page(page).object_list), paginator.count
+
+    def _measure(self, label, func):
+        timings = []
+        for _ in range(self.repeat):
+            started = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - started) * 1000)
+        self.stdout.write(f"  {label:<14} median {statistics.median(timings):9.2f} ms")
@@ -0,0 +1,105 @@
+"""
+페이지네이션 벤치마크 — 페이지 번호(COUNT + OFFSET) vs 키셋 커서 모드의 페이지별 지연 비교.
+임시 데이터를 트랜잭션 안에서 생성하고 측정 후 롤백한다 (DB에 남지 않음).
+
+사용: python manage.py benchmark_pagination [--pages 1 5000] [--page-size 20] [--repeat 5]
+"""
+import statistics
+import time
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.notes.models import TastingNote
+from apps.notes.views import TastingNoteViewSet
+from apps.wines.models import Wine
+from apps.wines.views import WineViewSet
+from config.pagination import KeysetPagination
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "페이지 번호/키셋 커서 페이지네이션의 얕은·깊은 페이지 지연을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--pages", nargs="+", type=int, default=[1, 5000])
+        parser.add_argument("--page-size", type=int, default=20)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        self.page_size = options["page_size"]
+        self.repeat = options["repeat"]
+        pages = options["pages"]
+        rows = max(pages) * self.page_size
+        try:
+            with transaction.atomic():
+                user = self._seed(rows)
+                self._run("와인 /api/wines/", WineViewSet, Wine.objects.order_by("name", "id"), user, pages)
+                notes = TastingNote.objects.order_by(*TastingNoteViewSet.cursor_ordering)
+                self._run("시음 노트 /api/tasting-notes/", TastingNoteViewSet, notes, user, pages)
+                self._run(
+                    "내 시음 노트 /api/tasting-notes/my_notes/",
+                    TastingNoteViewSet,
+                    notes,
+                    user,
+                    pages,
+                    action="my_notes",
+                )
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _seed(self, rows):
+        self.stdout.write(f"임시 데이터 생성: 와인 {rows}건, 시음 노트 {rows}건 ...")
+        user = get_user_model().objects.create(username="__bench__", email="bench@example.invalid")
+        Wine.objects.bulk_create(
+            (Wine(name=f"Bench Wine {i:08d}", type="red") for i in range(rows)),
+            batch_size=2000,
+        )
+        wine = Wine.objects.first()
+        start = date(2000, 1, 1)
+        TastingNote.objects.bulk_create(
+            (
+                TastingNote(user=user, wine=wine, rating=i % 5 + 1, tasted_date=start + timedelta(days=i % 9000))
+                for i in range(rows)
+            ),
+            batch_size=2000,
+        )
+        return user
+
+    def _run(self, label, viewset, ordered_qs, user, pages, action="list"):
+        view = viewset.as_view({"get": action})
+        factory = APIRequestFactory()
+        paginator = KeysetPagination()
+        paginator.ordering = viewset.cursor_ordering
+        self.stdout.write(self.style.MIGRATE_HEADING(label))
+        for page in pages:
+            offset = (page - 1) * self.page_size
+            if offset:
+                anchor = ordered_qs[offset - 1]
+                cursor = paginator.encode_cursor(
+                    [getattr(anchor, f.lstrip("-")) for f in viewset.cursor_ordering]
+                )
+                cursor_params = {"cursor": cursor}
+            else:
+                cursor_params = {"pagination": "cursor"}
+            modes = (("page", {"page": page}), ("cursor", cursor_params))
+            for mode, params in modes:
+                timings = []
+                for _ in range(self.repeat):
+                    request = factory.get("/", params)
+                    force_authenticate(request, user=user)
+                    started = time.perf_counter()
+                    response = view(request)
+                    response.render()
+                    timings.append((time.perf_counter() - started) * 1000)
+                self.stdout.write(
+                    f"  page {page:>6}  {mode:<6}  median {statistics.median(timings):8.2f} ms"
+                    f"  (status {response.status_code})"
+                )
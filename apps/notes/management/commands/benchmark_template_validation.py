@@ -0,0 +1,73 @@
+"""
+템플릿 custom_fields 검증 마이크로벤치마크 — 쓰기마다 템플릿 JSON을 해석하는 방식 vs 컴파일된 스키마 캐시
+(apps.notes.schemas). 템플릿 필드 수를 늘려도 노트 1건 검증 비용이 일정한지 확인한다 (DB 사용 안 함).
+
+사용: python manage.py benchmark_template_validation [--fields 5 20 80 320] [--values 5] [--notes 20000]
+"""
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.notes.models import Template
+from apps.notes.schemas import compile_template_schema, get_template_schema
+
+# 순환해 쓰는 필드 정의 (type, 추가 키, 노트 값)
+FIELD_SAMPLES = (
+    ("text", {}, "블랙베리와 삼나무"),
+    ("tags", {}, "cherry, vanilla, oak"),
+    ("scale", {}, "4"),
+    ("number", {"min": 0, "max": 100}, "92.5"),
+    ("select", {"options": ["decanted", "bottle", "glass"]}, "Decanted"),
+    ("boolean", {}, "yes"),
+    ("date", {}, "2026-10-01"),
+)
+
+
+class Command(BaseCommand):
+    help = "템플릿 필드 수별 custom_fields 검증 비용(노트 1건당)을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--fields", nargs="+", type=int, default=[5, 20, 80, 320])
+        parser.add_argument("--values", type=int, default=5, help="노트 1건이 채운 커스텀 필드 수")
+        parser.add_argument("--notes", type=int, default=20000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"{'필드 수':>8} {'매번 해석 (µs/건)':>20} {'컴파일 캐시 (µs/건)':>22}")
+        for field_count in options["fields"]:
+            template = self._template(field_count)
+            values = self._values(template, options["values"])
+            naive = self._measure(
+                lambda: compile_template_schema(template.fields).validate(values), options
+            )
+            cached = self._measure(lambda: get_template_schema(template).validate(values), options)
+            self.stdout.write(f"{field_count:>8} {naive:>20.2f} {cached:>22.2f}")
+
+    @staticmethod
+    def _template(field_count):
+        fields = []
+        for i in range(field_count):
+            field_type, extra, _ = FIELD_SAMPLES[i % len(FIELD_SAMPLES)]
+            fields.append({"name": f"field_{i}", "type": field_type, "label": f"필드 {i}", **extra})
+        # 저장하지 않은 템플릿 — 캐시 키용 ID·수정 시각만 지정
+        return Template(pk=-field_count, fields={"fields": fields}, updated_at=timezone.now())
+
+    @staticmethod
+    def _values(template, count):
+        return {
+            spec["name"]: FIELD_SAMPLES[i % len(FIELD_SAMPLES)][2]
+            for i, spec in enumerate(template.fields["fields"][:count])
+        }
+
+    @staticmethod
+    def _measure(func, options):
+        notes = options["notes"]
+        timings = []
+        for _ in range(options["repeat"]):
+            started = time.perf_counter()
+            for _ in range(notes):
+                func()
+            timings.append((time.perf_counter() - started) / notes * 1_000_000)
+        return statistics.median(timings)
@@ -0,0 +1,105 @@
+"""
+시음 통계 롤업 일관성 검사 — apps.notes.analytics.note_statistics·note_statistics_windows(기간 창 여러 개)의
+롤업 합산 결과를 노트 직접 집계(summarize_notes)와 대조하고, 기간 창 결과를 단일 기간 통계와 비교한다.
+임시 사용자·노트를 트랜잭션 안에서 생성하고 검사 후 롤백한다 (DB에 남지 않음). 불일치 시 실패 종료.
+쿼리 수 상한(NOTE_STATISTICS_QUERY_BUDGET)은 apps.notes.tests 가 고정.
+
+사용: python manage.py check_note_rollups [--notes 10 2000]
+"""
+import random
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from apps.notes.analytics import note_statistics, note_statistics_windows, summarize_notes
+from apps.notes.models import TastingNote
+from apps.notes.rollups import rebuild_user_rollups
+from apps.wines.models import Wine
+
+# (start_date, end_date) 오늘 기준 일 수 — None 은 열린 끝
+PERIODS = ((None, None), (400, None), (700, 37), (90, 0))
+WINDOWS = (1, 3, 12, 24)
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "시음 통계 롤업 합산 결과를 노트 직접 집계와 대조합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--notes", nargs="+", type=int, default=[10, 2000], help="사용자별 노트 수 (규모별 비교)")
+
+    def handle(self, *args, **options):
+        self.failures = []
+        self.today = timezone.now().date()
+        try:
+            with transaction.atomic():
+                for index, count in enumerate(options["notes"]):
+                    self._check_user(self._seed(index, count), count)
+                raise _Rollback
+        except _Rollback:
+            pass
+        if self.failures:
+            raise CommandError("\n".join(self.failures))
+        self.stdout.write(self.style.SUCCESS("롤업 일관성 검사 통과"))
+
+    def _seed(self, index, count):
+        rnd = random.Random(index)
+        user = get_user_model().objects.create(
+            username=f"__rollup_check_{index}__", email=f"rollup-check{index}@example.invalid"
+        )
+        wine_ids = list(Wine.objects.values_list("id", flat=True)[:200])
+        if not wine_ids:
+            Wine.objects.bulk_create(Wine(name=f"Rollup Check Wine {i}", type="red") for i in range(20))
+            wine_ids = list(Wine.objects.values_list("id", flat=True)[:200])
+        TastingNote.objects.bulk_create(
+            TastingNote(
+                user=user,
+                wine_id=rnd.choice(wine_ids),
+                rating=rnd.randint(1, 5),
+                tasted_date=self.today - timedelta(days=rnd.randrange(900)),
+            )
+            for _ in range(count)
+        )
+        rebuild_user_rollups([user.pk])
+        return user
+
+    def _period(self, start_days, end_days):
+        start = self.today - timedelta(days=start_days) if start_days is not None else None
+        end = self.today - timedelta(days=end_days) if end_days is not None else None
+        return start, end
+
+    def _check_user(self, user, count):
+        for start_days, end_days in PERIODS:
+            start, end = self._period(start_days, end_days)
+            stats = note_statistics(user.pk, start, end)
+            label = f"노트 {count}건, 기간 {start}~{end}"
+            qs = TastingNote.objects.filter(user=user)
+            if start:
+                qs = qs.filter(tasted_date__gte=start)
+            if end:
+                qs = qs.filter(tasted_date__lte=end)
+            expected = summarize_notes(qs)
+            actual = {key: stats[key] for key in expected}
+            if actual != expected:
+                self.failures.append(f"{label}: 롤업 합산 {actual} ≠ 직접 집계 {expected}")
+
+        windows = note_statistics_windows(user.pk, WINDOWS)
+        label = f"노트 {count}건, 기간 창 {WINDOWS}"
+        for stats in windows:
+            expected = summarize_notes(
+                TastingNote.objects.filter(user=user, tasted_date__gte=stats["start"], tasted_date__lte=stats["end"])
+            )
+            actual = {key: stats[key] for key in expected}
+            if actual != expected:
+                self.failures.append(f"{label} {stats['months']}개월: 롤업 합산 {actual} ≠ 직접 집계 {expected}")
+            single = note_statistics(user.pk, stats["start"], stats["end"])
+            if any(stats[key] != single[key] for key in single if key != "monthly"):
+                self.failures.append(f"{label} {stats['months']}개월: 단일 기간 통계와 다름")
+
+        self.stdout.write(f"  노트 {count}건: 기간 {len(PERIODS)}개·기간 창 {len(WINDOWS)}개 대조")
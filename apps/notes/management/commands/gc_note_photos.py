@@ -0,0 +1,96 @@
+"""
+시음 노트 사진 가비지 컬렉션
+1) --min-age 시간보다 오래된 원본 행을 잠근 뒤(select_for_update) 노트 photos 에서 참조 수를 다시 세어 보정
+   — 잠금 뒤에 세므로 동시에 진행 중인 노트 쓰기의 증감(F 표현식)은 잠금이 풀린 뒤 보정값 위에 더해짐
+2) 그중 참조 수 0인 원본 행과 파일(렌디션 포함) 삭제
+3) 저장소 tasting_notes/ 아래에서 어떤 노트·원본 행도 가리키지 않는 파일 삭제
+   (업로드 도중 파일 등을 지우지 않도록 --min-age 시간보다 오래된 것만)
+4) 만료된 사진 이어 올리기 세션의 스풀 파일 삭제 (apps.notes.uploads)
+
+사용: python manage.py gc_note_photos [--dry-run] [--min-age 24]
+"""
+from collections import Counter
+from datetime import timedelta
+
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from apps.notes.models import PhotoBlob, TastingNote
+from apps.notes.photos import delete_files, delete_unreferenced_blobs, photo_names, rendition_names, storage_name
+from apps.notes.uploads import cleanup_expired_uploads
+
+STORAGE_ROOT = "tasting_notes"
+
+
+class Command(BaseCommand):
+    help = "사진 원본 참조 수를 보정하고 참조가 없는 사진 파일을 삭제합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 대상만 출력")
+        parser.add_argument("--min-age", type=float, default=24, help="이 시간(시)보다 오래된 파일·원본만 삭제")
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        cutoff = timezone.now() - timedelta(hours=options["min_age"])
+
+        with transaction.atomic():
+            old_blobs = PhotoBlob.objects.filter(created_at__lt=cutoff)
+            blobs = list(old_blobs.select_for_update().values_list("digest", "name", "ref_count"))
+            refs, referenced = self._count_references()
+            referenced.update(PhotoBlob.objects.values_list("name", flat=True))
+            fixed = 0
+            unreferenced = 0
+            for digest, name, ref_count in blobs:
+                unreferenced += not refs[name]
+                if refs[name] != ref_count:
+                    fixed += 1
+                    if not dry_run:
+                        PhotoBlob.objects.filter(digest=digest).update(ref_count=refs[name])
+            if not dry_run:
+                unreferenced = delete_unreferenced_blobs(old_blobs)
+        self.stdout.write(f"참조 수 보정 {fixed}건, 참조 없는 원본 {unreferenced}건")
+
+        keep = set(referenced)
+        for name in referenced:
+            keep.update(rendition_names(name))
+        stray = [name for name in self._walk(STORAGE_ROOT) if name not in keep and self._older(name, cutoff)]
+        if not dry_run:
+            delete_files(stray)
+        for name in stray[:20]:
+            self.stdout.write(f"  {name}")
+        verb = "삭제 대상" if dry_run else "삭제"
+        self.stdout.write(self.style.SUCCESS(f"참조 없는 파일 {len(stray)}개 {verb}"))
+        if not dry_run:
+            self.stdout.write(f"만료된 이어 올리기 세션 {cleanup_expired_uploads()}건 삭제")
+
+    @staticmethod
+    def _count_references():
+        """노트 photos 전체 → (원본 경로별 참조 수, 노트가 가리키는 저장소 경로 집합)"""
+        refs = Counter()
+        referenced = set()
+        for photos in TastingNote.objects.exclude(photos=[]).values_list("photos", flat=True).iterator(chunk_size=2000):
+            names = photo_names(photos)
+            refs.update(names)
+            referenced.update(names)
+            referenced.update(storage_name(entry) or "" for entry in photos if isinstance(entry, str))
+        referenced.discard("")
+        return refs, referenced
+
+    def _walk(self, path):
+        try:
+            directories, files = default_storage.listdir(path)
+        except (FileNotFoundError, NotImplementedError):
+            return
+        for file in files:
+            yield f"{path}/{file}"
+        for directory in directories:
+            yield from self._walk(f"{path}/{directory}")
+
+    @staticmethod
+    def _older(name, cutoff):
+        try:
+            return default_storage.get_modified_time(name) < cutoff
+        except (FileNotFoundError, NotImplementedError):
+            return False
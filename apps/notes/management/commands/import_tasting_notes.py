@@ -0,0 +1,47 @@
+"""
+다른 앱에서 내보낸 시음 노트 CSV 가져오기 — 열 이름 별칭 대응, 와인 카탈로그 대조, 배치 bulk_create.
+열 예: wine_name|Wine, vintage, rating|Score(5·10·100점), tasted_date|Date, notes|Comment ... (나머지는 custom_fields)
+
+사용: python manage.py import_tasting_notes <username> notes.csv [--batch-size 500]
+"""
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.notes.importer import NoteImporter
+
+
+class Command(BaseCommand):
+    help = "시음 노트 CSV를 지정한 사용자의 노트로 가져옵니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("username")
+        parser.add_argument("path", help="CSV 파일 경로")
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        try:
+            user = get_user_model().objects.get(username=options["username"])
+        except get_user_model().DoesNotExist:
+            raise CommandError(f"사용자가 없습니다: {options['username']}")
+        importer = NoteImporter(user, options["path"], batch_size=options["batch_size"], progress=self._progress)
+        try:
+            state = importer.run()
+        except OSError as exc:
+            raise CommandError(str(exc))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"완료: {state['rows_read']}행 읽음, 노트 {state['notes_created']}건 생성, "
+                f"와인 {state['wines_created']}건 추가, {state['rows_failed']}행 오류"
+            )
+        )
+        if state["custom_columns"]:
+            self.stdout.write(f"custom_fields 로 저장한 열: {', '.join(state['custom_columns'])}")
+        for sample in state["error_samples"][:10]:
+            self.stdout.write(self.style.WARNING(f"  {sample['line']}행: {sample['error']}"))
+
+    def _progress(self, state, elapsed):
+        rate = state["rows_read"] / elapsed if elapsed else 0
+        self.stdout.write(
+            f"  {state['rows_read']:>10}행  노트 {state['notes_created']:>10}  "
+            f"오류 {state['rows_failed']:>6}  ({rate:,.0f}행/초)"
+        )
@@ -0,0 +1,52 @@
+"""
+시음 노트 사진 렌디션 일괄 생성 — 렌디션이 없는 사진(파이프라인 이전에 올린 URL 문자열 항목,
+처리 중 서버가 내려가 processing 으로 남은 항목)을 동기로 처리한다. 기본 저장소에 없는 외부 URL은 건너뜀.
+
+사용: python manage.py process_note_photos [--retry-failed] [--user USERNAME]
+"""
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+
+from apps.notes.models import TastingNote
+from apps.notes.photos import FAILED, PROCESSING, READY, run_photo_job, storage_name
+
+
+class Command(BaseCommand):
+    help = "렌디션(썸네일·중간·WebP)이 없는 시음 노트 사진을 처리합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--retry-failed", action="store_true", help="처리에 실패했던 사진도 다시 처리")
+        parser.add_argument("--user", help="이 사용자의 노트만")
+
+    def handle(self, *args, **options):
+        skip = {READY} if options["retry_failed"] else {READY, FAILED}
+        notes = TastingNote.objects.exclude(photos=[]).order_by("id")
+        if options["user"]:
+            notes = notes.filter(user__username=options["user"])
+        processed = failed = 0
+        for note in notes.only("id", "photos").iterator(chunk_size=500):
+            names = []
+            photos = []
+            for entry in note.photos or []:
+                if isinstance(entry, str):
+                    name = storage_name(entry)
+                    if name and default_storage.exists(name):
+                        entry = {"url": entry, "name": name, "status": PROCESSING}
+                if isinstance(entry, dict) and entry.get("name") and entry.get("status") not in skip:
+                    names.append(entry["name"])
+                photos.append(entry)
+            if not names:
+                continue
+            if photos != note.photos:
+                note.photos = photos
+                note.save(update_fields=["photos"])
+            for name in names:
+                run_photo_job(note.pk, name)
+            note.refresh_from_db(fields=["photos"])
+            for entry in note.photos:
+                if isinstance(entry, dict) and entry.get("name") in names:
+                    if entry.get("status") == READY:
+                        processed += 1
+                    else:
+                        failed += 1
+        self.stdout.write(self.style.SUCCESS(f"사진 {processed}장 처리 완료, 실패 {failed}장"))
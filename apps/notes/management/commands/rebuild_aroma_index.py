@@ -0,0 +1,22 @@
+"""
+아로마 태그 사전·노트↔태그 연결 색인 백필 (custom_fields["aroma_tags"]·aroma_notes 기준 전체 재구축).
+
+사용: python manage.py rebuild_aroma_index [--batch-size 2000]
+"""
+from django.core.management.base import BaseCommand
+
+from apps.notes.aromas import rebuild_aroma_index
+from apps.notes.models import AromaTag
+
+
+class Command(BaseCommand):
+    help = "시음 노트의 aroma_tags 커스텀 필드·aroma_notes 로부터 아로마 태그 사전과 노트↔태그 연결을 재구축합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        count = rebuild_aroma_index(batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(f"노트 {count}건 아로마 연결 완료 (태그 {AromaTag.objects.count()}종)")
+        )
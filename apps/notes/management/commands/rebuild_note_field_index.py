@@ -0,0 +1,21 @@
+"""
+커스텀 필드 값 색인 백필 (템플릿이 지정된 노트의 custom_fields 기준 전체 재구축).
+
+사용: python manage.py rebuild_note_field_index [--batch-size 1000]
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.notes.fieldindex import rebuild_note_field_index
+
+
+class Command(BaseCommand):
+    help = "템플릿 커스텀 필드 값 색인(NoteFieldValue)을 재구축합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            count = rebuild_note_field_index(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"커스텀 필드 값 {count}건 색인 완료"))
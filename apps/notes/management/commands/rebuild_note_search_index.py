@@ -0,0 +1,23 @@
+"""
+시음 노트 전문 검색 색인 재구축 (SQLite FTS5 / PostgreSQL tsvector).
+
+사용: python manage.py rebuild_note_search_index [--batch-size 1000]
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from apps.notes.fulltext import BACKENDS, rebuild_note_search_index
+
+
+class Command(BaseCommand):
+    help = "시음 노트 전문 검색 색인 테이블을 다시 만들고 전체 노트를 색인합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        if connection.vendor not in BACKENDS:
+            raise CommandError(f"{connection.vendor} DB는 전문 검색 색인을 지원하지 않습니다 (icontains 검색 사용).")
+        with transaction.atomic():
+            count = rebuild_note_search_index(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"시음 노트 {count}건 색인 완료"))
@@ -0,0 +1,32 @@
+"""
+사용자별 시음 통계 롤업(UserNoteRollup, 일·월 버킷) 재구축·검증.
+
+사용: python manage.py rebuild_user_rollups            # 재구축 후 검증
+      python manage.py rebuild_user_rollups --user 3   # 해당 사용자만 재구축
+      python manage.py rebuild_user_rollups --verify-only
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.notes.rollups import rebuild_user_rollups, verify_user_rollups
+
+
+class Command(BaseCommand):
+    help = "사용자별 시음 통계 롤업을 노트 테이블에서 재구축하고 검증합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", type=int, action="append", help="재구축할 사용자 ID (여러 번 지정 가능)")
+        parser.add_argument(
+            "--verify-only",
+            action="store_true",
+            help="재구축하지 않고 저장된 롤업과 재계산 결과만 비교",
+        )
+
+    def handle(self, *args, **options):
+        if not options["verify_only"]:
+            count = rebuild_user_rollups(options["user"])
+            self.stdout.write(f"롤업 버킷 {count}개 재구축")
+        mismatched = verify_user_rollups()
+        if mismatched:
+            preview = ", ".join(str(pk) for pk in mismatched[:20])
+            raise CommandError(f"롤업 불일치 사용자 {len(mismatched)}명: {preview}")
+        self.stdout.write(self.style.SUCCESS("롤업 검증 완료: 불일치 없음"))
@@ -0,0 +1,30 @@
+"""
+와인별 시음 노트 집계(WineNoteStats) 재구축·검증.
+
+사용: python manage.py rebuild_wine_stats            # 재구축 후 검증
+      python manage.py rebuild_wine_stats --verify-only
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.notes.aggregates import rebuild_wine_stats, verify_wine_stats
+
+
+class Command(BaseCommand):
+    help = "와인별 시음 노트 집계를 노트 테이블에서 재구축하고 검증합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--verify-only",
+            action="store_true",
+            help="재구축하지 않고 저장된 집계와 재계산 결과만 비교",
+        )
+
+    def handle(self, *args, **options):
+        if not options["verify_only"]:
+            count = rebuild_wine_stats()
+            self.stdout.write(f"와인 {count}건 집계 재구축")
+        mismatched = verify_wine_stats()
+        if mismatched:
+            preview = ", ".join(str(pk) for pk in mismatched[:20])
+            raise CommandError(f"집계 불일치 와인 {len(mismatched)}건: {preview}")
+        self.stdout.write(self.style.SUCCESS("집계 검증 완료: 불일치 없음"))
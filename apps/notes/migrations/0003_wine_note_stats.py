@@ -0,0 +1,68 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Max, Q, Sum
+
+
+def backfill_wine_note_stats(apps, schema_editor):
+    """기존 노트로 와인별 집계 채우기 (GROUP BY 1회)"""
+    TastingNote = apps.get_model("notes", "TastingNote")
+    WineNoteStats = apps.get_model("notes", "WineNoteStats")
+    rows = (
+        TastingNote.objects.order_by()
+        .values("wine_id")
+        .annotate(
+            note_count=Count("id"),
+            rating_sum=Sum("rating"),
+            last_tasted_date=Max("tasted_date"),
+            **{f"rating_{i}": Count("id", filter=Q(rating=i)) for i in range(1, 6)},
+        )
+    )
+    WineNoteStats.objects.bulk_create(
+        (WineNoteStats(**row) for row in rows.iterator()),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notes", "0002_initial"),
+        ("wines", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WineNoteStats",
+            fields=[
+                (
+                    "wine",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="note_stats",
+                        serialize=False,
+                        to="wines.wine",
+                    ),
+                ),
+                ("note_count", models.IntegerField(default=0, verbose_name="노트 수")),
+                ("rating_sum", models.IntegerField(default=0, verbose_name="평점 합계")),
+                ("rating_1", models.IntegerField(default=0, verbose_name="1점 수")),
+                ("rating_2", models.IntegerField(default=0, verbose_name="2점 수")),
+                ("rating_3", models.IntegerField(default=0, verbose_name="3점 수")),
+                ("rating_4", models.IntegerField(default=0, verbose_name="4점 수")),
+                ("rating_5", models.IntegerField(default=0, verbose_name="5점 수")),
+                (
+                    "last_tasted_date",
+                    models.DateField(blank=True, null=True, verbose_name="최근 시음일"),
+                ),
+            ],
+            options={
+                "verbose_name": "와인 노트 집계",
+                "verbose_name_plural": "와인 노트 집계",
+                "db_table": "wine_note_stats",
+            },
+        ),
+        migrations.RunPython(backfill_wine_note_stats, migrations.RunPython.noop),
+    ]
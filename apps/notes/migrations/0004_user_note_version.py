@@ -0,0 +1,46 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:21
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0001_initial"),
+        ("notes", "0003_wine_note_stats"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserNoteVersion",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="note_version",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "version",
+                    models.BigIntegerField(default=0, verbose_name="변경 카운터"),
+                ),
+                (
+                    "changed_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="최근 변경"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "사용자 노트 버전",
+                "verbose_name_plural": "사용자 노트 버전",
+                "db_table": "user_note_versions",
+            },
+        ),
+    ]
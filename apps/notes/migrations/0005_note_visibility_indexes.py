@@ -0,0 +1,36 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notes", "0004_user_note_version"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="tastingnote",
+            name="tasting_not_user_id_4432ee_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="tastingnote",
+            name="tasting_not_is_publ_57cc77_idx",
+        ),
+        migrations.AddIndex(
+            model_name="tastingnote",
+            index=models.Index(
+                fields=["user", "-tasted_date", "-created_at", "id"],
+                name="note_user_recent_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="tastingnote",
+            index=models.Index(
+                condition=models.Q(("is_public", True)),
+                fields=["-tasted_date", "-created_at", "id"],
+                name="note_public_recent_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,37 @@
+from django.db import migrations
+
+from apps.notes import fulltext
+
+
+def create_note_search_index(apps, schema_editor):
+    """DB별 전문 검색 색인 테이블 생성 후 기존 노트 색인 (지원하지 않는 DB는 건너뜀)"""
+    alias = schema_editor.connection.alias
+    backend = fulltext.get_backend(alias, check_table=False)
+    if backend is None:
+        return
+    with schema_editor.connection.cursor() as cursor:
+        backend.create_schema(cursor)
+    fulltext.clear_backend_cache(alias)
+    TastingNote = apps.get_model("notes", "TastingNote")
+    fulltext.index_notes(TastingNote.objects.using(alias).all(), using=alias)
+
+
+def drop_note_search_index(apps, schema_editor):
+    alias = schema_editor.connection.alias
+    backend = fulltext.get_backend(alias, check_table=False)
+    if backend is not None:
+        with schema_editor.connection.cursor() as cursor:
+            backend.drop_schema(cursor)
+    fulltext.clear_backend_cache(alias)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notes", "0005_note_visibility_indexes"),
+        ("wines", "0002_grape_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_note_search_index, drop_note_search_index),
+    ]
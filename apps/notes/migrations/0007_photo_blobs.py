@@ -0,0 +1,56 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notes", "0006_note_fulltext"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PhotoBlob",
+            fields=[
+                (
+                    "digest",
+                    models.CharField(
+                        max_length=64,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="SHA-256",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(
+                        max_length=255, unique=True, verbose_name="저장소 경로"
+                    ),
+                ),
+                (
+                    "size",
+                    models.PositiveIntegerField(default=0, verbose_name="업로드 크기"),
+                ),
+                ("ref_count", models.IntegerField(default=0, verbose_name="참조 수")),
+                (
+                    "renditions",
+                    models.JSONField(
+                        blank=True,
+                        default=dict,
+                        help_text="렌디션 URL·원본 크기·status (photos 항목에 병합)",
+                        verbose_name="처리 결과",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일"),
+                ),
+            ],
+            options={
+                "verbose_name": "사진 원본",
+                "verbose_name_plural": "사진 원본",
+                "db_table": "note_photo_blobs",
+            },
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:49
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notes", "0007_photo_blobs"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NoteFieldValue",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=100, verbose_name="필드 이름")),
+                (
+                    "value_number",
+                    models.FloatField(blank=True, null=True, verbose_name="숫자 값"),
+                ),
+                (
+                    "value_text",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        null=True,
+                        verbose_name="문자 값(정규화)",
+                    ),
+                ),
+                (
+                    "note",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="field_values",
+                        to="notes.tastingnote",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "커스텀 필드 값 색인",
+                "verbose_name_plural": "커스텀 필드 값 색인",
+                "db_table": "note_field_values",
+                "indexes": [
+                    models.Index(
+                        fields=["name", "value_number", "note"],
+                        name="note_field_number_idx",
+                    ),
+                    models.Index(
+                        fields=["name", "value_text", "note"],
+                        name="note_field_text_idx",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,98 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:52
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("notes", "0008_note_field_values"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AromaTag",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "key",
+                    models.CharField(
+                        max_length=50, unique=True, verbose_name="정규화 키"
+                    ),
+                ),
+                ("name", models.CharField(max_length=50, verbose_name="아로마")),
+            ],
+            options={
+                "verbose_name": "아로마 태그",
+                "verbose_name_plural": "아로마 태그",
+                "db_table": "aroma_tags",
+                "ordering": ["name"],
+            },
+        ),
+        migrations.CreateModel(
+            name="NoteAromaTag",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "note",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="aroma_links",
+                        to="notes.tastingnote",
+                    ),
+                ),
+                (
+                    "tag",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="note_links",
+                        to="notes.aromatag",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "노트 아로마",
+                "verbose_name_plural": "노트 아로마",
+                "db_table": "note_aroma_tags",
+                "indexes": [
+                    models.Index(fields=["tag", "note"], name="note_aroma_tag_idx"),
+                    models.Index(
+                        fields=["user", "tag"], name="note_aroma_user_tag_idx"
+                    ),
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="notearomatag",
+            constraint=models.UniqueConstraint(
+                fields=("note", "tag"), name="uniq_note_aroma_tag"
+            ),
+        ),
+    ]
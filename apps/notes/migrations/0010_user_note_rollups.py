@@ -0,0 +1,72 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:58
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("notes", "0009_aroma_tags"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserNoteRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "period",
+                    models.CharField(
+                        choices=[("D", "일"), ("M", "월")],
+                        max_length=1,
+                        verbose_name="단위",
+                    ),
+                ),
+                ("bucket", models.DateField(verbose_name="버킷")),
+                ("note_count", models.IntegerField(default=0, verbose_name="노트 수")),
+                (
+                    "rating_sum",
+                    models.IntegerField(default=0, verbose_name="평점 합계"),
+                ),
+                ("rating_1", models.IntegerField(default=0, verbose_name="1점 수")),
+                ("rating_2", models.IntegerField(default=0, verbose_name="2점 수")),
+                ("rating_3", models.IntegerField(default=0, verbose_name="3점 수")),
+                ("rating_4", models.IntegerField(default=0, verbose_name="4점 수")),
+                ("rating_5", models.IntegerField(default=0, verbose_name="5점 수")),
+                (
+                    "wine_counts",
+                    models.JSONField(default=dict, verbose_name="와인별 노트 수"),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "사용자 노트 롤업",
+                "verbose_name_plural": "사용자 노트 롤업",
+                "db_table": "user_note_rollups",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="usernoterollup",
+            constraint=models.UniqueConstraint(
+                fields=("user", "period", "bucket"), name="uniq_user_note_rollup"
+            ),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.30 on 2026-10-18 13:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notes", "0010_user_note_rollups"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PublicNoteVersion",
+            fields=[
+                (
+                    "id",
+                    models.PositiveSmallIntegerField(
+                        default=1, primary_key=True, serialize=False
+                    ),
+                ),
+                (
+                    "version",
+                    models.BigIntegerField(default=0, verbose_name="변경 카운터"),
+                ),
+                (
+                    "changed_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="최근 변경"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "공개 노트 버전",
+                "verbose_name_plural": "공개 노트 버전",
+                "db_table": "public_note_version",
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-18 13:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notes", "0011_public_note_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="photoblob",
+            name="processing_started_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="렌디션 생성을 맡은 작업이 시작한 시각 (같은 원본의 중복 처리 방지, apps.notes.photos)",
+                null=True,
+                verbose_name="처리 시작",
+            ),
+        ),
+    ]
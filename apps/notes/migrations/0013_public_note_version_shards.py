@@ -0,0 +1,20 @@
+# Generated by Django 4.2.30 on 2026-10-18 13:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notes", "0012_photo_blob_processing"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="publicnoteversion",
+            name="id",
+            field=models.PositiveSmallIntegerField(
+                primary_key=True, serialize=False, verbose_name="샤드"
+            ),
+        ),
+    ]
@@ -3,11 +3,19 @@
 - wines.Wine 참조: 시음 노트는 와인 FK로 연결, 외관/아로마/맛 스케일 정리
 - TastingNote: user, wine, template, rating, tasted_date, location, 시각/아로마/맛, notes, custom_fields, photos, is_public
 - Template: user, name, fields(JSON), is_default
+- WineNoteStats: 와인별 노트 집계 (wine 1:1, 노트 저장/삭제 시 증분 갱신)
+- UserNoteVersion: 사용자별 노트 변경 카운터 (조건부 GET ETag/Last-Modified)
+- PhotoBlob: 내용 주소(SHA-256) 사진 원본, 노트 photos 참조 수
+- NoteFieldValue: 템플릿 커스텀 필드 값 색인 (custom_fields 필터)
+- AromaTag / NoteAromaTag: 아로마 태그 사전·노트 연결 색인 (tag 필터, 태그 빈도)
+- UserNoteRollup: 사용자별 일·월 통계 버킷 (통계 API 기간 합산)
 """
-from django.db import models
+from django.db import models, transaction
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.conf import settings
 
+from .photos import photo_names
+
 # 1~5 스케일 공통 (와인 시음 — 바디/산도/탄닌/당도, mywine 참조)
 TASTING_SCALE_1_5 = [
     (1, "매우 낮음"),
@@ -171,15 +179,279 @@ class TastingNote(models.Model):
         verbose_name = "시음 노트"
         verbose_name_plural = "시음 노트"
         indexes = [
-            models.Index(fields=["user", "-tasted_date"]),
+            # 목록 가시성 스트림 (apps.notes.visibility) — 기본 정렬 키 순서 그대로 스캔
+            models.Index(fields=["user", "-tasted_date", "-created_at", "id"], name="note_user_recent_idx"),
+            models.Index(
+                fields=["-tasted_date", "-created_at", "id"],
+                name="note_public_recent_idx",
+                condition=models.Q(is_public=True),
+            ),
             models.Index(fields=["wine"]),
-            models.Index(fields=["is_public"]),
         ]
 
     def __str__(self):
         return f"{self.wine.name} — {self.tasted_date}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 집계 증분 갱신용 — DB에 저장된 (wine, rating, tasted_date) 기억
+        instance._stats_state = instance.stats_state()
+        # 공개 노트 세대 갱신 여부 판단용 (비공개 → 공개 전환도 감지)
+        instance._loaded_public = None if "is_public" in instance.get_deferred_fields() else instance.is_public
+        # 사진 원본 참조 수 갱신용 — 저장된 photos 의 원본 경로
+        if "photos" not in instance.get_deferred_fields():
+            instance._loaded_photo_names = photo_names(instance.photos)
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None):
+        super().refresh_from_db(using=using, fields=fields)
+        if fields is None or "photos" in fields:
+            self._loaded_photo_names = photo_names(self.photos)
+
+    def stats_state(self):
+        """집계에 영향을 주는 값. 지연 로딩 필드가 있으면 None."""
+        if self.get_deferred_fields() & {"wine_id", "rating", "tasted_date"}:
+            return None
+        return (self.wine_id, self.rating, self.tasted_date)
+
+    def save(self, *args, **kwargs):
+        # 노트 저장과 WineNoteStats 갱신(post_save)을 한 트랜잭션으로
+        with transaction.atomic(using=kwargs.get("using")):
+            super().save(*args, **kwargs)
+
     @property
     def wine_display(self):
         """와인 표기 문자열 (wines.Wine.__str__와 동일)"""
         return str(self.wine)
+
+
+class WineNoteStats(models.Model):
+    """와인별 시음 노트 집계 (노트 수·평점 합계·평점 분포·최근 시음일).
+    TastingNote 저장/삭제 시 같은 트랜잭션에서 증분 갱신 (apps.notes.aggregates)."""
+
+    wine = models.OneToOneField(
+        "wines.Wine",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="note_stats",
+    )
+    note_count = models.IntegerField("노트 수", default=0)
+    rating_sum = models.IntegerField("평점 합계", default=0)
+    rating_1 = models.IntegerField("1점 수", default=0)
+    rating_2 = models.IntegerField("2점 수", default=0)
+    rating_3 = models.IntegerField("3점 수", default=0)
+    rating_4 = models.IntegerField("4점 수", default=0)
+    rating_5 = models.IntegerField("5점 수", default=0)
+    last_tasted_date = models.DateField("최근 시음일", null=True, blank=True)
+
+    class Meta:
+        db_table = "wine_note_stats"
+        verbose_name = "와인 노트 집계"
+        verbose_name_plural = "와인 노트 집계"
+
+    def __str__(self):
+        return f"{self.wine_id} — {self.note_count}건"
+
+    @property
+    def average_rating(self):
+        if not self.note_count:
+            return None
+        return round(self.rating_sum / self.note_count, 2)
+
+    @property
+    def rating_histogram(self):
+        return {str(i): getattr(self, f"rating_{i}") for i in range(1, 6)}
+
+
+class UserNoteVersion(models.Model):
+    """사용자별 시음 노트 변경 카운터 — 노트 저장/삭제마다 증가 (조건부 GET 검증자, apps.notes.versions)"""
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="note_version",
+    )
+    version = models.BigIntegerField("변경 카운터", default=0)
+    changed_at = models.DateTimeField("최근 변경", null=True, blank=True)
+
+    class Meta:
+        db_table = "user_note_versions"
+        verbose_name = "사용자 노트 버전"
+        verbose_name_plural = "사용자 노트 버전"
+
+    def __str__(self):
+        return f"{self.user_id} — v{self.version}"
+
+
+class PublicNoteVersion(models.Model):
+    """공개 노트 전체 변경 카운터 — 공개 노트 또는 공개 여부가 바뀐 노트의 저장/삭제마다 증가.
+    DB 에 두어 모든 프로세스가 같은 값을 본다. 쓰기가 한 행에 몰리지 않도록 사용자 ID % SHARDS 행으로 나누고
+    읽을 때 합산 (공개 노트 목록 조건부 GET 검증자, apps.notes.versions)"""
+
+    SHARDS = 64
+
+    id = models.PositiveSmallIntegerField("샤드", primary_key=True)
+    version = models.BigIntegerField("변경 카운터", default=0)
+    changed_at = models.DateTimeField("최근 변경", null=True, blank=True)
+
+    class Meta:
+        db_table = "public_note_version"
+        verbose_name = "공개 노트 버전"
+        verbose_name_plural = "공개 노트 버전"
+
+    def __str__(self):
+        return f"#{self.pk} v{self.version}"
+
+
+class PhotoBlob(models.Model):
+    """시음 노트 사진 원본 (내용 주소 저장) — 업로드 SHA-256 으로 한 번만 저장하고
+    노트 photos 항목의 참조 수를 관리 (마지막 참조가 사라지면 파일 삭제, apps.notes.photos)"""
+
+    digest = models.CharField("SHA-256", max_length=64, primary_key=True)
+    name = models.CharField("저장소 경로", max_length=255, unique=True)
+    size = models.PositiveIntegerField("업로드 크기", default=0)
+    ref_count = models.IntegerField("참조 수", default=0)
+    renditions = models.JSONField(
+        "처리 결과",
+        default=dict,
+        blank=True,
+        help_text="렌디션 URL·원본 크기·status (photos 항목에 병합)",
+    )
+    processing_started_at = models.DateTimeField(
+        "처리 시작",
+        null=True,
+        blank=True,
+        help_text="렌디션 생성을 맡은 작업이 시작한 시각 (같은 원본의 중복 처리 방지, apps.notes.photos)",
+    )
+    created_at = models.DateTimeField("생성일", auto_now_add=True)
+
+    class Meta:
+        db_table = "note_photo_blobs"
+        verbose_name = "사진 원본"
+        verbose_name_plural = "사진 원본"
+
+    def __str__(self):
+        return f"{self.name} — 참조 {self.ref_count}"
+
+
+class NoteFieldValue(models.Model):
+    """커스텀 필드 값 색인 (custom_fields 사이드카) — 템플릿 필드 type 에 따라 숫자/문자 열에 한 행,
+    tags 는 태그마다 한 행. 노트 저장 시 다시 쓰고 노트 삭제 시 함께 삭제 (apps.notes.fieldindex)"""
+
+    note = models.ForeignKey(
+        TastingNote,
+        on_delete=models.CASCADE,
+        related_name="field_values",
+    )
+    name = models.CharField("필드 이름", max_length=100)
+    value_number = models.FloatField("숫자 값", null=True, blank=True)
+    value_text = models.CharField("문자 값(정규화)", max_length=255, null=True, blank=True)
+
+    class Meta:
+        db_table = "note_field_values"
+        verbose_name = "커스텀 필드 값 색인"
+        verbose_name_plural = "커스텀 필드 값 색인"
+        indexes = [
+            # ?custom_fields__<name>__gte= 등 — (이름, 값) 범위 스캔으로 노트 ID만 읽음
+            models.Index(fields=["name", "value_number", "note"], name="note_field_number_idx"),
+            models.Index(fields=["name", "value_text", "note"], name="note_field_text_idx"),
+        ]
+
+    def __str__(self):
+        value = self.value_text if self.value_number is None else self.value_number
+        return f"{self.note_id} {self.name}={value}"
+
+
+class AromaTag(models.Model):
+    """아로마 태그 사전 — 표기 정규화된 아로마 (aroma_tags 커스텀 필드·aroma_notes 를 apps.notes.aromas 로 정규화)"""
+
+    key = models.CharField("정규화 키", max_length=50, unique=True)
+    name = models.CharField("아로마", max_length=50)
+
+    class Meta:
+        db_table = "aroma_tags"
+        verbose_name = "아로마 태그"
+        verbose_name_plural = "아로마 태그"
+        ordering = ["name"]
+
+    def __str__(self):
+        return self.name
+
+
+class NoteAromaTag(models.Model):
+    """노트 ↔ 아로마 태그 연결 색인 — 노트 저장 시 동기화. user 는 사용자별 태그 빈도 집계용 (노트 작성자)"""
+
+    note = models.ForeignKey(
+        TastingNote,
+        on_delete=models.CASCADE,
+        related_name="aroma_links",
+    )
+    tag = models.ForeignKey(
+        AromaTag,
+        on_delete=models.CASCADE,
+        related_name="note_links",
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+
+    class Meta:
+        db_table = "note_aroma_tags"
+        verbose_name = "노트 아로마"
+        verbose_name_plural = "노트 아로마"
+        constraints = [
+            models.UniqueConstraint(fields=["note", "tag"], name="uniq_note_aroma_tag"),
+        ]
+        indexes = [
+            # ?tag= 필터 (태그 → 노트)
+            models.Index(fields=["tag", "note"], name="note_aroma_tag_idx"),
+            # 사용자별 태그 빈도 — (user, tag) 순서로 읽으며 GROUP BY
+            models.Index(fields=["user", "tag"], name="note_aroma_user_tag_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.note_id} — {self.tag_id}"
+
+
+class UserNoteRollup(models.Model):
+    """사용자별 시음 통계 롤업 버킷 (일·월) — 노트 수, 평점 합계·분포, 와인별 노트 수.
+    TastingNote 저장/삭제 시 같은 트랜잭션에서 증분 갱신 (apps.notes.rollups)."""
+
+    PERIOD_DAY = "D"
+    PERIOD_MONTH = "M"
+    PERIOD_CHOICES = [
+        (PERIOD_DAY, "일"),
+        (PERIOD_MONTH, "월"),
+    ]
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    period = models.CharField("단위", max_length=1, choices=PERIOD_CHOICES)
+    bucket = models.DateField("버킷")  # 일: 시음일, 월: 그 달 1일
+    note_count = models.IntegerField("노트 수", default=0)
+    rating_sum = models.IntegerField("평점 합계", default=0)
+    rating_1 = models.IntegerField("1점 수", default=0)
+    rating_2 = models.IntegerField("2점 수", default=0)
+    rating_3 = models.IntegerField("3점 수", default=0)
+    rating_4 = models.IntegerField("4점 수", default=0)
+    rating_5 = models.IntegerField("5점 수", default=0)
+    wine_counts = models.JSONField("와인별 노트 수", default=dict)  # {wine_id: 노트 수}
+
+    class Meta:
+        db_table = "user_note_rollups"
+        verbose_name = "사용자 노트 롤업"
+        verbose_name_plural = "사용자 노트 롤업"
+        constraints = [
+            # 기간 조회도 이 인덱스 (user, period, bucket 범위)
+            models.UniqueConstraint(fields=["user", "period", "bucket"], name="uniq_user_note_rollup"),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} {self.period} {self.bucket} — {self.note_count}건"
@@ -0,0 +1,367 @@
+"""
+시음 노트 사진 처리 파이프라인
+- 업로드 요청은 원본을 저장소에 저장하고 photos 항목({"url", "status": "processing"})만 추가한 뒤 바로 응답
+- Pillow 작업(방향 정규화·EXIF 제거한 원본 크기 렌디션 full, 썸네일·중간·WebP 변환)은 커밋 후 워커 스레드 풀에서 처리.
+  원본 파일은 내용 주소(digest)이므로 다시 쓰지 않는다
+  (Pillow 디코드·리사이즈는 GIL을 놓으므로 스레드로 병렬 처리됨, 동시 작업 수 = settings.PHOTO_WORKERS)
+- 처리 결과는 노트의 해당 항목에 렌디션 URL로 기록 (update_fields=["photos"] → 노트 버전·ETag 갱신)
+- photos 항목 형식: 예전 데이터는 URL 문자열, 새 데이터는 dict. 응답·달력은 photo_entry()/photo_thumbnail()로 통일
+- 내용 주소 저장: 원본은 업로드 바이트의 SHA-256(청크 단위 스트리밍 해시)으로 tasting_notes/photos/ab/<digest>.<ext>
+  에 한 번만 저장 (PhotoBlob). 같은 이미지를 여러 노트에 올려도 파일·렌디션은 하나, 처리도 한 번
+  (PhotoBlob.processing_started_at 을 조건부 UPDATE 로 선점한 작업만 렌디션을 쓰고, 나머지는 결과를 기다려 재사용)
+- 참조 수: 노트 저장/삭제 시그널이 photos 의 원본 경로 변화만큼 PhotoBlob.ref_count 증감 (노트 쓰기와 같은 트랜잭션),
+  0이 되면 커밋 후 행을 다시 잠그고 여전히 0일 때만 원본·렌디션 파일과 행 삭제 (그사이 같은 내용이 다시 올라오면 유지).
+  어긋난 참조 수·고아 파일은 gc_note_photos 로 정리
+"""
+import hashlib
+import logging
+import threading
+import time
+from datetime import timedelta
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from PIL import Image, ImageOps
+
+logger = logging.getLogger(__name__)
+
+# 렌디션 키 → (긴 변 최대 px, Pillow 형식, 파일 접미사)
+RENDITIONS = {
+    "medium": (1280, "JPEG", "medium.jpg"),
+    "webp": (1280, "WEBP", "webp"),
+    "thumbnail": (320, "JPEG", "thumb.jpg"),
+}
+# 방향 정규화·메타데이터 제거한 원본 크기 렌디션 (원본과 같은 형식, 파일 이름은 full.<원본 확장자>)
+FULL = "full"
+# 응답에 노출하는 항목 키 (name 은 저장소 내부 경로라 제외)
+PUBLIC_KEYS = ("url", FULL, "thumbnail", "medium", "webp", "width", "height", "status")
+# 항목에서 URL 인 키 — 원본과 렌디션
+URL_KEYS = ("url", FULL, *RENDITIONS)
+SAVE_OPTIONS = {
+    "JPEG": {"quality": 85, "optimize": True, "progressive": True},
+    "WEBP": {"quality": 80, "method": 4},
+    "PNG": {"optimize": True},
+}
+PROCESSING, READY, FAILED = "processing", "ready", "failed"
+# 처리를 맡은 작업이 이 시간 안에 끝내지 못하면(프로세스 종료 등) 다른 작업이 다시 맡음
+PROCESS_CLAIM_TIMEOUT = timedelta(minutes=10)
+# 다른 작업이 처리 중인 원본의 결과를 기다리는 최대 시간(초) — 넘으면 processing 으로 두고 process_note_photos 가 마무리
+PROCESS_WAIT = 60
+PROCESS_POLL_INTERVAL = 0.5
+PHOTO_ROOT = "tasting_notes/photos"
+# 업로드 content_type → 저장 확장자 (같은 내용은 같은 경로가 되도록 파일 이름의 확장자는 쓰지 않음)
+EXTENSIONS = {"image/jpeg": "jpg", "image/jpg": "jpg", "image/png": "png"}
+
+_executor = None
+_executor_lock = threading.Lock()
+# 같은 원본을 동시에 처리하지 않도록 (원본 덮어쓰기 경합 방지) — 경로 해시로 고른 고정 개수 잠금
+_name_locks = [threading.Lock() for _ in range(64)]
+
+
+def photo_entry(entry):
+    """저장된 photos 항목(URL 문자열 또는 dict) → 응답용 dict. 렌디션이 없으면 None."""
+    if isinstance(entry, str):
+        entry = {"url": entry}
+    return {key: entry.get(key) for key in PUBLIC_KEYS}
+
+
+def photo_url(entry):
+    return entry if isinstance(entry, str) else entry.get("url")
+
+
+def photo_urls(entry):
+    """photos 항목의 원본·렌디션 URL 집합 (status·width·height 같은 값은 제외)"""
+    if isinstance(entry, str):
+        return {entry}
+    return {entry[key] for key in URL_KEYS if entry.get(key)}
+
+
+def photo_thumbnail(photos):
+    """첫 사진의 썸네일 URL (아직 처리 전이거나 예전 데이터면 원본 URL)"""
+    if not photos:
+        return None
+    entry = photos[0]
+    if isinstance(entry, str):
+        return entry
+    return entry.get("thumbnail") or entry.get("url")
+
+
+def rendition_name(name, suffix):
+    """tasting_notes/1/abc.jpg → tasting_notes/1/abc.<suffix>"""
+    base = name.rsplit(".", 1)[0] if "." in name.rsplit("/", 1)[-1] else name
+    return f"{base}.{suffix}"
+
+
+def storage_name(url):
+    """기본 저장소 URL → 저장소 내부 경로 (다른 저장소·외부 URL이면 None)"""
+    base_url = default_storage.base_url or ""
+    if base_url and url.startswith(base_url):
+        return url[len(base_url):]
+    return None
+
+
+def photo_names(photos):
+    """photos 중 이 앱 저장소에 올린 원본 경로 목록 (참조 수 계산용, 중복 포함)"""
+    return [entry["name"] for entry in photos or [] if isinstance(entry, dict) and entry.get("name")]
+
+
+def full_name(name):
+    """원본 크기 렌디션 경로 — tasting_notes/1/abc.png → tasting_notes/1/abc.full.png"""
+    ext = name.rsplit(".", 1)[-1].lower() if "." in name.rsplit("/", 1)[-1] else "jpg"
+    return rendition_name(name, f"{FULL}.{ext}")
+
+
+def rendition_names(name):
+    return [full_name(name), *(rendition_name(name, suffix) for _, _, suffix in RENDITIONS.values())]
+
+
+def blob_entry(blob):
+    """PhotoBlob → photos 항목 (처리가 끝났으면 렌디션 포함, 아니면 status=processing)"""
+    entry = {"url": default_storage.url(blob.name), "name": blob.name, "status": PROCESSING}
+    entry.update(blob.renditions or {})
+    return entry
+
+
+def file_digest(upload):
+    """업로드 파일 SHA-256 — 메모리에 전체를 올리지 않고 청크 단위로"""
+    digest = hashlib.sha256()
+    for chunk in upload.chunks():
+        digest.update(chunk)
+    upload.seek(0)
+    return digest.hexdigest()
+
+
+def store_photo(upload, digest=None):
+    """
+    업로드를 내용 주소 경로에 저장 (같은 내용이 이미 있으면 재사용) → PhotoBlob.
+    참조 수는 노트 저장 시그널이 올리므로 호출한 쪽이 같은 트랜잭션에서 노트 photos 에 blob_entry 를 추가해야 한다.
+    """
+    from .models import PhotoBlob
+
+    digest = digest or file_digest(upload)
+    ext = EXTENSIONS.get(getattr(upload, "content_type", None), "jpg")
+    with transaction.atomic():
+        blob = PhotoBlob.objects.select_for_update().filter(digest=digest).first()
+        if blob is not None and default_storage.exists(blob.name):
+            return blob
+        name = blob.name if blob is not None else f"{PHOTO_ROOT}/{digest[:2]}/{digest}.{ext}"
+        saved = _replace(name, upload)
+        if blob is None:
+            blob = PhotoBlob.objects.create(digest=digest, name=saved, size=upload.size or 0)
+        else:
+            # 행은 있는데 파일이 사라진 경우 — 다시 저장하고 렌디션도 다시 만든다
+            blob.name, blob.renditions, blob.processing_started_at = saved, {}, None
+            blob.save(update_fields=["name", "renditions", "processing_started_at"])
+        return blob
+
+
+def add_note_photo(note, upload):
+    """업로드 → 노트 photos 에 추가 (내용 주소 저장, 렌디션은 커밋 후 워커 풀) → 추가한 항목"""
+    with transaction.atomic():
+        entry = blob_entry(store_photo(upload, digest=getattr(upload, "digest", None)))
+        note.photos = [*(note.photos or []), entry]
+        note.save(update_fields=["photos"])
+        if entry["status"] != READY:
+            schedule_photo_processing(note.pk, entry["name"])
+    return entry
+
+
+def update_photo_refs(old_names, new_names):
+    """노트 photos 원본 경로 변화만큼 참조 수 증감, 참조가 없어진 원본은 삭제 (호출자 트랜잭션 안에서)"""
+    from .models import PhotoBlob
+
+    delta = Counter(new_names)
+    delta.subtract(old_names)
+    names_by_delta = defaultdict(list)
+    for name, change in delta.items():
+        if change:
+            names_by_delta[change].append(name)
+    for change, names in names_by_delta.items():
+        PhotoBlob.objects.filter(name__in=names).update(ref_count=F("ref_count") + change)
+    released = [name for name, change in delta.items() if change < 0]
+    if released:
+        delete_unreferenced_blobs(PhotoBlob.objects.filter(name__in=released))
+
+
+def delete_unreferenced_blobs(queryset):
+    """참조 수 0 이하인 원본을 커밋 후 삭제하도록 예약 (_delete_released_blobs) → 대상 원본 수"""
+    digests = list(queryset.select_for_update().filter(ref_count__lte=0).values_list("digest", flat=True))
+    if digests:
+        transaction.on_commit(lambda: _delete_released_blobs(digests))
+    return len(digests)
+
+
+def _delete_released_blobs(digests):
+    """
+    커밋 후 — 행을 잠그고 여전히 참조 수 0 인 원본만 파일(렌디션 포함)과 행 삭제.
+    그사이 같은 내용을 다시 올린 store_photo 는 행 잠금을 기다리므로 삭제된 파일을 가리키는 원본이 생기지 않고,
+    이미 다시 참조된 원본(참조 수 > 0)은 그대로 둔다
+    """
+    from .models import PhotoBlob
+
+    for digest in digests:
+        with transaction.atomic():
+            blob = PhotoBlob.objects.select_for_update().filter(digest=digest, ref_count__lte=0).first()
+            if blob is None:
+                continue
+            delete_files([blob.name, *rendition_names(blob.name)])
+            blob.delete()
+
+
+def delete_files(names):
+    for name in names:
+        try:
+            default_storage.delete(name)
+        except OSError:
+            logger.warning("사진 파일 삭제 실패: %s", name, exc_info=True)
+
+
+def _encode(image, fmt, **extra):
+    buffer = BytesIO()
+    image.save(buffer, fmt, **SAVE_OPTIONS.get(fmt, {}), **extra)
+    return ContentFile(buffer.getvalue())
+
+
+def _replace(name, content):
+    """같은 이름으로 덮어쓰기 (기본 저장소는 이름이 겹치면 새 이름을 붙이므로 먼저 삭제)"""
+    if default_storage.exists(name):
+        default_storage.delete(name)
+    return default_storage.save(name, content)
+
+
+def _flatten(image):
+    """JPEG용 RGB — 투명 배경은 흰색으로"""
+    if image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info):
+        image = image.convert("RGBA")
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel("A"))
+        return background
+    return image.convert("RGB") if image.mode != "RGB" else image
+
+
+def process_photo(name):
+    """
+    저장된 원본(읽기만)을 EXIF 방향대로 회전해 메타데이터 없는 원본 크기 렌디션(full)과 축소 렌디션 생성
+    → photos 항목에 병합할 dict (렌디션 URL, 원본 크기, status)
+    """
+    with default_storage.open(name, "rb") as fh:
+        image = Image.open(fh)
+        image.load()
+    icc_profile = image.info.get("icc_profile")
+    # 방향 정규화 — 렌디션은 회전된 상태로 저장하므로 EXIF(위치 정보 등)는 모두 버린다
+    image = ImageOps.exif_transpose(image)
+    extra = {"icc_profile": icc_profile} if icc_profile else {}
+    full = full_name(name)
+    fmt = "PNG" if full.endswith(".png") else "JPEG"
+    saved = _replace(full, _encode(_flatten(image) if fmt == "JPEG" else image, fmt, **extra))
+
+    result = {FULL: default_storage.url(saved), "width": image.width, "height": image.height, "status": READY}
+    source = image
+    # 큰 것부터 만들고 작은 렌디션은 직전 결과에서 줄여 리사이즈 비용을 줄인다
+    for key, (size, rendition_format, suffix) in RENDITIONS.items():
+        source = source.copy()
+        source.thumbnail((size, size), Image.LANCZOS)
+        rendered = _flatten(source) if rendition_format == "JPEG" else source
+        saved = _replace(rendition_name(name, suffix), _encode(rendered, rendition_format, **extra))
+        result[key] = default_storage.url(saved)
+    return result
+
+
+def attach_renditions(note_id, name, result):
+    """노트 photos 중 name 항목에 처리 결과 병합 (동시 수정과 겹치지 않도록 행 잠금)"""
+    from .models import TastingNote
+
+    with transaction.atomic():
+        note = TastingNote.objects.select_for_update().filter(pk=note_id).first()
+        if note is None:
+            return False
+        changed = False
+        photos = []
+        for entry in note.photos or []:
+            if isinstance(entry, dict) and entry.get("name") == name:
+                entry = {**entry, **result}
+                changed = True
+            photos.append(entry)
+        if changed:
+            note.photos = photos
+            note.save(update_fields=["photos"])
+        return changed
+
+
+def _process(name):
+    try:
+        return process_photo(name)
+    except Exception:  # noqa: BLE001 — 손상·미지원 이미지도 노트는 유지
+        logger.exception("사진 처리 실패: %s", name)
+        return {"status": FAILED}
+
+
+def _claim(name):
+    """원본 처리 선점 (조건부 UPDATE — 프로세스 사이에서도 한 작업만 성공)"""
+    from .models import PhotoBlob
+
+    now = timezone.now()
+    unclaimed = Q(processing_started_at__isnull=True) | Q(processing_started_at__lt=now - PROCESS_CLAIM_TIMEOUT)
+    return PhotoBlob.objects.filter(unclaimed, name=name).update(processing_started_at=now) == 1
+
+
+def _processed(name):
+    """
+    원본 처리 결과 — 이미 처리된 원본이면 재사용, 처리를 선점하면 렌디션을 만들어 PhotoBlob 에 기록,
+    다른 작업이 처리 중이면 결과를 기다림 (PROCESS_WAIT 초를 넘기면 status=processing).
+    실패했던 원본은 다시 처리 (기다린 작업의 결과가 실패면 그대로 사용)
+    """
+    from .models import PhotoBlob
+
+    with _name_locks[hash(name) % len(_name_locks)]:
+        deadline = time.monotonic() + PROCESS_WAIT
+        waited = False
+        while True:
+            renditions = PhotoBlob.objects.filter(name=name).values_list("renditions", flat=True).first()
+            if renditions is None:
+                # 내용 주소 이전에 올린 사진 (공유되지 않음)
+                return _process(name)
+            if renditions.get("status") == READY or (waited and renditions.get("status") == FAILED):
+                return renditions
+            if _claim(name):
+                result = _process(name)
+                if not PhotoBlob.objects.filter(name=name).update(renditions=result, processing_started_at=None):
+                    # 처리하는 사이 참조가 모두 사라져 원본이 삭제됨 — 방금 만든 렌디션도 정리
+                    delete_files(rendition_names(name))
+                return result
+            if time.monotonic() >= deadline:
+                return {"status": PROCESSING}
+            waited = True
+            time.sleep(PROCESS_POLL_INTERVAL)
+
+
+def run_photo_job(note_id, name):
+    """사진 1장 처리 + 결과 기록 (실패하면 status=failed, 원본 URL은 그대로 사용)"""
+    try:
+        return attach_renditions(note_id, name, _processed(name))
+    finally:
+        if threading.current_thread() is not threading.main_thread():
+            connection.close()
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, "PHOTO_WORKERS", 2),
+                thread_name_prefix="note-photo",
+            )
+        return _executor
+
+
+def schedule_photo_processing(note_id, name):
+    """현재 트랜잭션 커밋 후 워커 풀에서 처리 (롤백되면 실행하지 않음)"""
+    transaction.on_commit(lambda: _get_executor().submit(run_photo_job, note_id, name))
@@ -0,0 +1,284 @@
+"""
+사용자별 시음 통계 롤업(UserNoteRollup) 유지·조회
+- 노트 1건 = 시음일의 일 버킷 + 그 달의 월 버킷에 (노트 수, 평점 합계, 평점 분포, 와인별 노트 수) 가산
+- 기간 [start, end] 조회: 통째로 들어가는 달은 월 버킷, 양 끝의 걸친 달은 일 버킷으로 덮어 조회 1회
+  (버킷 수는 기간의 달 수 + 양 끝 며칠 — 노트 수와 무관)
+- 와인 타입·지역은 버킷에 두지 않고 조회 시 와인별 노트 수에 와인 (type, region) 을 IN 조회 1회로 붙여 합산
+  → 와인 정보 수정이 롤업 재계산 없이 반영, 서로 다른 와인 수도 정확
+- 갱신: 노트 저장·삭제 시그널(노트 쓰기와 같은 트랜잭션), 일괄 생성은 add_notes_to_rollups,
+  노트 FK 일괄 변경(와인 병합)은 rebuild_user_rollups(해당 사용자), 전체는 rebuild_user_rollups 관리 명령
+"""
+from collections import Counter, defaultdict
+from datetime import date, timedelta
+from functools import reduce
+from operator import or_
+
+from django.db import transaction
+from django.db.models import Count, Q
+from rest_framework.exceptions import ValidationError
+
+from apps.wines.models import Wine
+
+from .models import TastingNote, UserNoteRollup
+
+RATING_VALUES = range(1, 6)
+COUNTERS = ["note_count", "rating_sum"] + [f"rating_{i}" for i in RATING_VALUES]
+DAY = UserNoteRollup.PERIOD_DAY
+MONTH = UserNoteRollup.PERIOD_MONTH
+
+
+def month_start(day):
+    return day.replace(day=1)
+
+
+def next_month(day):
+    return (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def month_end(day):
+    return next_month(day) - timedelta(days=1)
+
+
+def bucket_keys(tasted_date):
+    """노트가 속하는 (period, bucket) 두 개"""
+    return (DAY, tasted_date), (MONTH, month_start(tasted_date))
+
+
+def bucket_span(period, bucket):
+    """버킷이 덮는 [첫날, 마지막 날]"""
+    return (bucket, bucket) if period == DAY else (bucket, month_end(bucket))
+
+
+def _empty_delta():
+    return {**{field: 0 for field in COUNTERS}, "wines": Counter()}
+
+
+def _add_state(deltas, state, sign):
+    wine_id, rating, tasted_date = state
+    for key in bucket_keys(tasted_date):
+        delta = deltas[key]
+        delta["note_count"] += sign
+        delta["rating_sum"] += sign * rating
+        if rating in RATING_VALUES:
+            delta[f"rating_{rating}"] += sign
+        delta["wines"][str(wine_id)] += sign
+
+
+def _apply(user_id, deltas):
+    """버킷별 증감을 반영 (없는 버킷 생성 → 잠금 조회 → 일괄 갱신, 빈 버킷 삭제). 조회·쓰기 횟수는 버킷 수와 무관"""
+    deltas = {
+        key: delta
+        for key, delta in deltas.items()
+        if any(delta[field] for field in COUNTERS) or any(delta["wines"].values())
+    }
+    if not deltas:
+        return
+    keys = reduce(or_, (Q(period=period, bucket=bucket) for period, bucket in deltas))
+    with transaction.atomic():
+        UserNoteRollup.objects.bulk_create(
+            [UserNoteRollup(user_id=user_id, period=period, bucket=bucket) for period, bucket in deltas],
+            ignore_conflicts=True,
+        )
+        rows = list(UserNoteRollup.objects.select_for_update().filter(keys, user_id=user_id))
+        empty = []
+        for row in rows:
+            delta = deltas[(row.period, row.bucket)]
+            for field in COUNTERS:
+                setattr(row, field, getattr(row, field) + delta[field])
+            wines = Counter(row.wine_counts)
+            wines.update(delta["wines"])
+            row.wine_counts = {wine_id: count for wine_id, count in wines.items() if count > 0}
+            if row.note_count <= 0:
+                empty.append(row.pk)
+        UserNoteRollup.objects.bulk_update([row for row in rows if row.pk not in empty], COUNTERS + ["wine_counts"])
+        if empty:
+            UserNoteRollup.objects.filter(pk__in=empty).delete()
+
+
+def apply_rollup_change(user_id, old, new):
+    """
+    노트 상태 변화를 사용자 롤업에 반영. old/new = (wine_id, rating, tasted_date) 또는 None(생성/삭제).
+    호출자는 노트 쓰기와 같은 트랜잭션 안에서 호출해야 한다.
+    """
+    if old == new:
+        return
+    deltas = defaultdict(_empty_delta)
+    if old is not None:
+        _add_state(deltas, old, -1)
+    if new is not None:
+        _add_state(deltas, new, 1)
+    _apply(user_id, deltas)
+
+
+def add_notes_to_rollups(user_id, states):
+    """새로 생성한 노트들의 (wine_id, rating, tasted_date) 목록을 버킷별로 합산해 반영 (호출자의 트랜잭션 안에서)"""
+    deltas = defaultdict(_empty_delta)
+    for state in states:
+        _add_state(deltas, state, 1)
+    _apply(user_id, deltas)
+
+
+def compute_user_rollups(user_ids=None):
+    """노트 테이블에서 (사용자, 시음일, 와인, 평점) GROUP BY 1회로 버킷 계산 → {(user_id, period, bucket): 값}"""
+    qs = TastingNote.objects.order_by()
+    if user_ids is not None:
+        qs = qs.filter(user_id__in=user_ids)
+    buckets = defaultdict(_empty_delta)
+    rows = qs.values_list("user_id", "tasted_date", "wine_id", "rating").annotate(count=Count("id"))
+    for user_id, tasted_date, wine_id, rating, count in rows.iterator(chunk_size=5000):
+        for period, bucket in bucket_keys(tasted_date):
+            values = buckets[(user_id, period, bucket)]
+            values["note_count"] += count
+            values["rating_sum"] += rating * count
+            if rating in RATING_VALUES:
+                values[f"rating_{rating}"] += count
+            values["wines"][str(wine_id)] += count
+    return buckets
+
+
+def _rollup_rows(computed):
+    for (user_id, period, bucket), values in computed.items():
+        yield UserNoteRollup(
+            user_id=user_id,
+            period=period,
+            bucket=bucket,
+            wine_counts=dict(values["wines"]),
+            **{field: values[field] for field in COUNTERS},
+        )
+
+
+def rebuild_user_rollups(user_ids=None, batch_size=1000):
+    """롤업 재구축 (user_ids 가 없으면 전체, 단일 트랜잭션) → 버킷 수"""
+    computed = compute_user_rollups(user_ids)
+    with transaction.atomic():
+        existing = UserNoteRollup.objects.all()
+        if user_ids is not None:
+            existing = existing.filter(user_id__in=user_ids)
+        existing.delete()
+        UserNoteRollup.objects.bulk_create(_rollup_rows(computed), batch_size=batch_size)
+    return len(computed)
+
+
+def verify_user_rollups():
+    """저장된 롤업과 노트 테이블 재계산 결과 비교 → 불일치 사용자 ID 목록"""
+    computed = {
+        key: ({field: values[field] for field in COUNTERS}, dict(values["wines"]))
+        for key, values in compute_user_rollups().items()
+    }
+    stored = {
+        (row["user_id"], row["period"], row["bucket"]): (
+            {field: row[field] for field in COUNTERS},
+            row["wine_counts"],
+        )
+        for row in UserNoteRollup.objects.values("user_id", "period", "bucket", "wine_counts", *COUNTERS)
+    }
+    mismatched = {key[0] for key in set(computed) ^ set(stored)}
+    mismatched.update(key[0] for key in set(computed) & set(stored) if computed[key] != stored[key])
+    return sorted(mismatched)
+
+
+# --- 조회 ---
+
+
+def _cover(start, end):
+    """[start, end] (None 은 열린 끝) 을 겹치지 않게 덮는 버킷 조건"""
+    if start is not None and end is not None and start > end:
+        return None
+    first_full = start if start is None or start.day == 1 else next_month(start)
+    last_full = end if end is None or end == month_end(end) else month_start(end) - timedelta(days=1)
+    if first_full is not None and last_full is not None and first_full > last_full:
+        return Q(period=DAY, bucket__gte=start, bucket__lte=end)
+    months = Q(period=MONTH)
+    if first_full is not None:
+        months &= Q(bucket__gte=first_full)
+    if last_full is not None:
+        months &= Q(bucket__lte=month_start(last_full))
+    conditions = [months]
+    if start is not None and start < first_full:
+        conditions.append(Q(period=DAY, bucket__gte=start, bucket__lt=first_full))
+    if end is not None and last_full < end:
+        conditions.append(Q(period=DAY, bucket__gt=last_full, bucket__lte=end))
+    return reduce(or_, conditions)
+
+
+def load_rollups(user_id, start=None, end=None, cuts=()):
+    """
+    [start, end] 를 덮는 버킷 목록 (조회 1회). cuts 의 각 날짜에서 구간을 나눠 덮으므로
+    summarize_rollups 로 [cut, end] 같은 하위 기간도 같은 버킷으로 합산할 수 있다.
+    """
+    bounds = sorted({cut for cut in cuts if cut and (start is None or cut > start) and (end is None or cut <= end)})
+    segments = []
+    lower = start
+    for cut in bounds:
+        segments.append((lower, cut - timedelta(days=1)))
+        lower = cut
+    segments.append((lower, end))
+    conditions = [c for c in (_cover(a, b) for a, b in segments) if c is not None]
+    if not conditions:
+        return []
+    return list(
+        UserNoteRollup.objects.filter(reduce(or_, conditions), user_id=user_id).values_list(
+            "period", "bucket", "wine_counts", *COUNTERS
+        )
+    )
+
+
+def summarize_rollups(rollups, start=None, end=None):
+    """
+    load_rollups 결과 중 [start, end] 에 들어가는 버킷 합산 →
+    {note_count, rating_sum, ratings{1..5}, wines Counter(wine_id), months Counter("YYYY-MM")}
+    """
+    summary = {"note_count": 0, "rating_sum": 0, "ratings": Counter(), "wines": Counter(), "months": Counter()}
+    for period, bucket, wine_counts, note_count, rating_sum, *ratings in rollups:
+        first, last = bucket_span(period, bucket)
+        if (start is not None and first < start) or (end is not None and last > end):
+            continue
+        summary["note_count"] += note_count
+        summary["rating_sum"] += rating_sum
+        summary["ratings"].update(dict(zip(RATING_VALUES, ratings)))
+        summary["wines"].update({int(wine_id): count for wine_id, count in wine_counts.items()})
+        summary["months"][bucket.strftime("%Y-%m")] += note_count
+    return summary
+
+
+def wine_dimensions(wine_ids):
+    """와인 ID 목록 → {wine_id: (type, region)} (IN 조회 1회)"""
+    return {
+        wine_id: (wine_type, region or "")
+        for wine_id, wine_type, region in Wine.objects.filter(pk__in=list(wine_ids)).values_list(
+            "id", "type", "region"
+        )
+    }
+
+
+def wine_dimension_counts(wine_counts, dimensions=None):
+    """
+    와인별 노트 수 → (타입별 노트 수, 지역별 노트 수), 많은 순.
+    dimensions(wine_dimensions 결과)를 넘기면 조회 없이, 아니면 와인 IN 조회 1회
+    """
+    if dimensions is None:
+        dimensions = wine_dimensions(wine_counts)
+    types = Counter()
+    regions = Counter()
+    for wine_id, count in wine_counts.items():
+        if wine_id in dimensions:
+            wine_type, region = dimensions[wine_id]
+            types[wine_type] += count
+            regions[region] += count
+    return _ranked(types), _ranked(regions)
+
+
+def _ranked(counter):
+    return dict(sorted(counter.items(), key=lambda item: (-item[1], item[0] or "")))
+
+
+def parse_date_range(params):
+    """query 의 start_date, end_date (YYYY-MM-DD, 선택) → (date|None, date|None). 형식이 틀리면 400"""
+    dates = []
+    for key in ("start_date", "end_date"):
+        raw = params.get(key)
+        try:
+            dates.append(date.fromisoformat(raw) if raw else None)
+        except ValueError:
+            raise ValidationError({key: "YYYY-MM-DD 형식이어야 합니다."}) from None
+    return tuple(dates)
@@ -0,0 +1,258 @@
+"""
+템플릿 커스텀 필드 스키마 컴파일 (Template.fields → custom_fields 검증·변환기)
+- Template.fields = {"fields": [{name, type, label, required?, options?, min?, max?, max_length?}, ...]}
+- compile_template_schema(): 필드 정의를 한 번 해석해 이름 → 변환 함수 사전(TemplateSchema)으로 만든다
+  → 노트 검증은 입력된 값만 순회 (사전 조회 + 변환 1회), 템플릿 필드 수와 무관하게 일정한 비용
+- get_template_schema(): (템플릿 ID, updated_at) 키로 프로세스 내 캐시. 템플릿 저장·삭제 시그널이 해당 항목 제거,
+  다른 프로세스의 낡은 항목은 updated_at 이 달라 쓰이지 않음
+- 지원 type: text, textarea, number, integer, scale(1~5), boolean, date, select(options), tags.
+  알 수 없는 type 과 템플릿에 없는 키는 값을 그대로 둔다 (템플릿이 바뀌기 전에 저장된 값, 가져오기 열 등)
+"""
+import threading
+from collections import OrderedDict
+from datetime import date
+
+SCHEMA_CACHE_SIZE = 1024
+TEXT_MAX_LENGTH = 2000
+TAG_MAX_LENGTH = 50
+TAGS_MAX_COUNT = 50
+TRUE_VALUES = {"true", "1", "yes", "y", "on", "예"}
+FALSE_VALUES = {"false", "0", "no", "n", "off", "아니오"}
+
+
+class SchemaError(ValueError):
+    """템플릿 필드 정의 오류"""
+
+
+class FieldValueError(ValueError):
+    """custom_fields 값 오류"""
+
+
+def _text(spec):
+    max_length = int(spec.get("max_length") or TEXT_MAX_LENGTH)
+
+    def coerce(value):
+        if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+            raise FieldValueError("문자열이어야 합니다.")
+        value = str(value).strip()
+        if len(value) > max_length:
+            raise FieldValueError(f"{max_length}자를 초과할 수 없습니다.")
+        return value
+
+    return coerce
+
+
+def _bounded(cast, spec, default_min=None, default_max=None):
+    minimum = spec.get("min", default_min)
+    maximum = spec.get("max", default_max)
+    for bound in (minimum, maximum):
+        if bound is not None and (isinstance(bound, bool) or not isinstance(bound, (int, float))):
+            raise SchemaError(f"{spec['name']}: min/max는 숫자여야 합니다.")
+    if minimum is not None and maximum is not None and minimum > maximum:
+        raise SchemaError(f"{spec['name']}: min이 max보다 큽니다.")
+
+    def coerce(value):
+        if isinstance(value, bool):
+            raise FieldValueError("숫자여야 합니다.")
+        try:
+            value = cast(value.strip() if isinstance(value, str) else value)
+        except (TypeError, ValueError):
+            raise FieldValueError("숫자여야 합니다.") from None
+        if minimum is not None and value < minimum:
+            raise FieldValueError(f"{minimum} 이상이어야 합니다.")
+        if maximum is not None and value > maximum:
+            raise FieldValueError(f"{maximum} 이하여야 합니다.")
+        return value
+
+    return coerce
+
+
+def _to_number(value):
+    number = float(value)
+    if number != number or number in (float("inf"), float("-inf")):
+        raise ValueError(value)
+    return int(number) if number.is_integer() and not isinstance(value, float) else number
+
+
+def _to_integer(value):
+    number = float(value)
+    if not number.is_integer():
+        raise ValueError(value)
+    return int(number)
+
+
+def _number(spec):
+    return _bounded(_to_number, spec)
+
+
+def _integer(spec):
+    return _bounded(_to_integer, spec)
+
+
+def _scale(spec):
+    return _bounded(_to_integer, spec, default_min=1, default_max=5)
+
+
+def _boolean(spec):
+    def coerce(value):
+        if isinstance(value, bool):
+            return value
+        text = str(value).strip().lower()
+        if text in TRUE_VALUES:
+            return True
+        if text in FALSE_VALUES:
+            return False
+        raise FieldValueError("true 또는 false여야 합니다.")
+
+    return coerce
+
+
+def _date(spec):
+    def coerce(value):
+        try:
+            return date.fromisoformat(str(value).strip()[:10]).isoformat()
+        except ValueError:
+            raise FieldValueError("YYYY-MM-DD 형식이어야 합니다.") from None
+
+    return coerce
+
+
+def _select(spec):
+    options = spec.get("options") or spec.get("choices")
+    if not isinstance(options, list) or not options:
+        raise SchemaError(f"{spec['name']}: select 필드에는 options 리스트가 필요합니다.")
+    allowed = {}
+    for option in options:
+        value = option.get("value") if isinstance(option, dict) else option
+        allowed[str(value)] = value
+    lowered = {key.lower(): value for key, value in allowed.items()}
+
+    def coerce(value):
+        key = str(value).strip()
+        if key in allowed:
+            return allowed[key]
+        if key.lower() in lowered:
+            return lowered[key.lower()]
+        raise FieldValueError(f"{', '.join(allowed)} 중 하나여야 합니다.")
+
+    return coerce
+
+
+def _tags(spec):
+    max_count = int(spec.get("max_count") or TAGS_MAX_COUNT)
+
+    def coerce(value):
+        if isinstance(value, str):
+            value = value.replace("#", ",").split(",")
+        if not isinstance(value, list):
+            raise FieldValueError("태그 리스트 또는 쉼표로 구분한 문자열이어야 합니다.")
+        tags = []
+        for tag in value:
+            if not isinstance(tag, str):
+                raise FieldValueError("태그는 문자열이어야 합니다.")
+            tag = tag.strip()
+            if len(tag) > TAG_MAX_LENGTH:
+                raise FieldValueError(f"태그는 {TAG_MAX_LENGTH}자를 초과할 수 없습니다.")
+            if tag and tag not in tags:
+                tags.append(tag)
+        if len(tags) > max_count:
+            raise FieldValueError(f"태그는 최대 {max_count}개까지 가능합니다.")
+        return tags
+
+    return coerce
+
+
+FIELD_TYPES = {
+    "text": _text,
+    "textarea": _text,
+    "number": _number,
+    "integer": _integer,
+    "scale": _scale,
+    "boolean": _boolean,
+    "date": _date,
+    "select": _select,
+    "tags": _tags,
+}
+
+
+class TemplateSchema:
+    """컴파일된 템플릿 스키마 — types: 이름 → type, validate(): custom_fields 검증·변환"""
+
+    def __init__(self, coercers, types, required):
+        self.coercers = coercers
+        self.types = types
+        self.required = required
+
+    def validate(self, values):
+        """custom_fields → (변환된 값, {이름: 오류})"""
+        if values is None:
+            values = {}
+        if not isinstance(values, dict):
+            return values, {"non_field_errors": "custom_fields는 딕셔너리여야 합니다."}
+        cleaned = {}
+        errors = {}
+        coercers = self.coercers
+        for name, value in values.items():
+            coerce = coercers.get(name)
+            if coerce is None or value is None or value == "" or value == []:
+                cleaned[name] = value
+                continue
+            try:
+                cleaned[name] = coerce(value)
+            except FieldValueError as exc:
+                errors[name] = str(exc)
+        if self.required:
+            for name in self.required:
+                if name not in errors and cleaned.get(name) in (None, "", []):
+                    errors[name] = "필수 항목입니다."
+        return cleaned, errors
+
+
+def compile_template_schema(definition):
+    """Template.fields → TemplateSchema (정의 오류는 SchemaError)"""
+    fields = definition.get("fields") if isinstance(definition, dict) else None
+    if not isinstance(fields, list):
+        raise SchemaError("'fields'는 리스트여야 합니다.")
+    coercers = {}
+    types = {}
+    required = []
+    for spec in fields:
+        if not isinstance(spec, dict) or not isinstance(spec.get("name"), str) or not spec["name"]:
+            raise SchemaError("각 필드에는 이름(name)이 필요합니다.")
+        name = spec["name"]
+        if name in types:
+            raise SchemaError(f"{name}: 필드 이름이 중복됩니다.")
+        field_type = spec.get("type") or "text"
+        types[name] = field_type
+        factory = FIELD_TYPES.get(field_type)
+        if factory is not None:
+            coercers[name] = factory(spec)
+        if spec.get("required"):
+            required.append(name)
+    return TemplateSchema(coercers, types, tuple(required))
+
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def get_template_schema(template):
+    """템플릿의 컴파일된 스키마 ((ID, updated_at) 키 LRU 캐시). 정의가 잘못된 템플릿은 SchemaError."""
+    key = (template.pk, template.updated_at)
+    with _cache_lock:
+        schema = _cache.get(key)
+        if schema is not None:
+            _cache.move_to_end(key)
+            return schema
+    schema = compile_template_schema(template.fields)
+    with _cache_lock:
+        _cache[key] = schema
+        while len(_cache) > SCHEMA_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return schema
+
+
+def invalidate_template_schema(template_id):
+    with _cache_lock:
+        for key in [key for key in _cache if key[0] == template_id]:
+            del _cache[key]
@@ -2,10 +2,24 @@
 시음 노트·템플릿 API 시리얼라이저 (PRD 8.2.3, 8.2.4)
 - Template: CRUD, fields JSON 검증
 - TastingNote: 목록/상세/생성·수정, wines.Wine 중첩, choices display 필드
+- 일괄 생성: 와인·템플릿을 미리 읽은 context 에서 조회 (항목별 쿼리 없음, apps.notes.bulk)
+- custom_fields: 템플릿 필드 정의를 컴파일한 스키마로 검증·변환 (apps.notes.schemas)
+- photos: 응답은 항목마다 {url, full, thumbnail, medium, webp, width, height, status} (apps.notes.photos)
 """
 from rest_framework import serializers
+from apps.wines.models import Wine
 from apps.wines.serializers import WineListSerializer
 from .models import Template, TastingNote
+from .photos import photo_entry, photo_url
+from .schemas import SchemaError, compile_template_schema, get_template_schema
+from .uploads import ALLOWED_CONTENT_TYPES, MAX_UPLOAD_SIZE
+
+
+class PhotoListField(serializers.ReadOnlyField):
+    """photos 응답 — 예전 URL 문자열 항목도 렌디션 키를 갖춘 dict로 (렌디션이 없으면 None)"""
+
+    def to_representation(self, value):
+        return [photo_entry(entry) for entry in value or []]
 
 
 class TemplateSerializer(serializers.ModelSerializer):
@@ -39,6 +53,10 @@ class TemplateSerializer(serializers.ModelSerializer):
                 raise serializers.ValidationError(
                     f"각 필드에는 {required_keys}가 필요합니다."
                 )
+        try:
+            compile_template_schema(value)
+        except SchemaError as exc:
+            raise serializers.ValidationError(str(exc))
         return value
 
     def create(self, validated_data):
@@ -51,6 +69,7 @@ class TastingNoteListSerializer(serializers.ModelSerializer):
 
     wine = WineListSerializer(read_only=True)
     user_username = serializers.CharField(source="user.username", read_only=True)
+    photos = PhotoListField()
     location_display = serializers.CharField(
         source="get_location_display", read_only=True
     )
@@ -78,6 +97,7 @@ class TastingNoteDetailSerializer(serializers.ModelSerializer):
     wine = WineListSerializer(read_only=True)
     template_name = serializers.CharField(source="template.name", read_only=True)
     user_username = serializers.CharField(source="user.username", read_only=True)
+    photos = PhotoListField()
     location_display = serializers.CharField(
         source="get_location_display", read_only=True
     )
@@ -166,27 +186,109 @@ class TastingNoteCreateUpdateSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("photos는 리스트여야 합니다.")
         if len(value) > 5:
             raise serializers.ValidationError("최대 5장까지 등록 가능합니다.")
-        return value
+        # 항목은 URL 문자열 또는 응답에서 받은 dict. 이미 있던 사진은 저장된 항목(렌디션 포함)을 유지하고
+        # 새 URL은 문자열로만 저장한다 (클라이언트가 저장소 경로·렌디션을 지정할 수 없음)
+        existing = {photo_url(entry): entry for entry in (self.instance.photos if self.instance else None) or []}
+        photos = []
+        for item in value:
+            url = item.get("url") if isinstance(item, dict) else item
+            if not isinstance(url, str) or not url:
+                raise serializers.ValidationError("사진 항목은 URL 문자열 또는 url 키가 있는 객체여야 합니다.")
+            photos.append(existing.get(url, url))
+        return photos
+
+    def validate(self, attrs):
+        # 템플릿 커스텀 필드 정의로 custom_fields 검증·변환 (컴파일된 스키마 캐시, apps.notes.schemas)
+        instance = self.instance
+        template = attrs["template"] if "template" in attrs else getattr(instance, "template", None)
+        template_changed = "template" in attrs and (instance is None or template != instance.template)
+        if template is None or ("custom_fields" not in attrs and not template_changed):
+            return attrs
+        try:
+            schema = get_template_schema(template)
+        except SchemaError:
+            # 검증 도입 전에 저장된 잘못된 정의의 템플릿은 값을 그대로 둔다
+            return attrs
+        values = attrs["custom_fields"] if "custom_fields" in attrs else getattr(instance, "custom_fields", None)
+        cleaned, errors = schema.validate(values)
+        if errors:
+            raise serializers.ValidationError({"custom_fields": errors})
+        attrs["custom_fields"] = cleaned
+        return attrs
 
     def create(self, validated_data):
         validated_data["user"] = self.context["request"].user
         return super().create(validated_data)
 
 
+class PrefetchedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """context[cache_key] 의 {pk: 객체} 에서 조회하는 PK 필드 (일괄 생성 시 항목별 쿼리 방지)"""
+
+    def __init__(self, cache_key, **kwargs):
+        self.cache_key = cache_key
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        if isinstance(data, bool):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        obj = self.context[self.cache_key].get(pk)
+        if obj is None:
+            self.fail("does_not_exist", pk_value=data)
+        return obj
+
+
+class TastingNoteBulkItemSerializer(TastingNoteCreateUpdateSerializer):
+    """일괄 생성 항목 1개. context: request, wines, templates (apps.notes.bulk.prefetch_related_objects)"""
+
+    wine = PrefetchedPrimaryKeyRelatedField("wines", queryset=Wine.objects.all())
+    template = PrefetchedPrimaryKeyRelatedField(
+        "templates", queryset=Template.objects.all(), required=False, allow_null=True
+    )
+
+    def validate_wine(self, value):
+        # context 에서 찾았으므로 존재 확인 쿼리 불필요
+        return value
+
+
 class TastingNotePhotoUploadSerializer(serializers.Serializer):
     """사진 업로드 요청용 — 단일 이미지, 크기·형식 검증."""
 
     photo = serializers.ImageField(required=True)
 
     def validate_photo(self, value):
-        if value.size > 5 * 1024 * 1024:
+        if value.size > MAX_UPLOAD_SIZE:
             raise serializers.ValidationError("파일 크기는 5MB를 초과할 수 없습니다.")
-        allowed = ("image/jpeg", "image/png", "image/jpg")
-        if value.content_type not in allowed:
+        if value.content_type not in ALLOWED_CONTENT_TYPES:
             raise serializers.ValidationError("JPEG 또는 PNG 형식만 업로드 가능합니다.")
         return value
 
 
+class TastingNotePhotoUploadSessionSerializer(serializers.Serializer):
+    """사진 이어 올리기 세션 생성 요청용 — 전체 크기·형식 검증 (apps.notes.uploads)."""
+
+    size = serializers.IntegerField(min_value=1)
+    content_type = serializers.CharField(max_length=50)
+    filename = serializers.CharField(max_length=200, required=False, allow_blank=True, default="")
+    sha256 = serializers.RegexField(r"^[0-9a-fA-F]{64}$", required=False, allow_blank=True, default="")
+
+    def validate_size(self, value):
+        if value > MAX_UPLOAD_SIZE:
+            raise serializers.ValidationError("파일 크기는 5MB를 초과할 수 없습니다.")
+        return value
+
+    def validate_content_type(self, value):
+        if value not in ALLOWED_CONTENT_TYPES:
+            raise serializers.ValidationError("JPEG 또는 PNG 형식만 업로드 가능합니다.")
+        return value
+
+    def validate_sha256(self, value):
+        return value.lower()
+
+
 class TastingNoteStatisticsSerializer(serializers.Serializer):
     """시음 노트 통계 API 응답용 (읽기 전용)."""
 
@@ -0,0 +1,160 @@
+"""
+시음 노트 시그널 — 와인별 집계(WineNoteStats)·사용자 통계 롤업 증분 갱신 (apps.notes.aggregates, apps.notes.rollups),
+사용자별 노트 변경 버전 증가 (apps.notes.versions, 조건부 GET·대시보드 응답 캐시 — 와인 변경 포함), 전문 검색 색인 갱신 (apps.notes.fulltext),
+사진 원본 참조 수 증감 (apps.notes.photos), 템플릿 스키마 캐시 무효화 (apps.notes.schemas),
+커스텀 필드 값 색인 갱신 (apps.notes.fieldindex), 아로마 태그 연결 동기화 (apps.notes.aromas)
+TastingNote.save()가 트랜잭션으로 감싸고, 삭제는 Django Collector가 트랜잭션으로 처리하므로
+노트 쓰기와 집계 갱신은 함께 커밋/롤백된다.
+"""
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from apps.wines.models import Wine
+
+from .aggregates import apply_note_change
+from .aromas import sync_note_aromas
+from .fieldindex import index_note_fields, reindex_template_notes
+from .fulltext import index_notes, unindex_notes
+from .models import Template, TastingNote
+from .photos import photo_names, update_photo_refs
+from .rollups import apply_rollup_change
+from .schemas import invalidate_template_schema
+from .versions import bump_user_notes_version, bump_wine_notes_versions
+
+STATS_FIELDS = {"wine", "wine_id", "rating", "tasted_date"}
+SEARCH_FIELDS = {"wine", "wine_id", "notes", "aroma_notes", "pairing"}
+CUSTOM_FIELD_FIELDS = {"custom_fields", "template", "template_id"}
+AROMA_FIELDS = {"aroma_notes", "custom_fields"}
+
+
+def _ensure_stored_state(instance):
+    """DB에 저장된 (wine_id, rating, tasted_date)를 instance._stats_state에 확보"""
+    if getattr(instance, "_stats_state", None) is None and instance.pk and not instance._state.adding:
+        instance._stats_state = (
+            TastingNote.objects.filter(pk=instance.pk)
+            .values_list("wine_id", "rating", "tasted_date")
+            .first()
+        )
+
+
+@receiver(pre_save, sender=TastingNote)
+def capture_note_state_before_save(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not STATS_FIELDS & set(update_fields):
+        return
+    _ensure_stored_state(instance)
+
+
+@receiver(post_save, sender=TastingNote)
+def update_wine_stats_on_save(sender, instance, created, update_fields=None, **kwargs):
+    if update_fields is not None and not STATS_FIELDS & set(update_fields):
+        return
+    old = None if created else getattr(instance, "_stats_state", None)
+    new = (instance.wine_id, instance.rating, instance.tasted_date)
+    apply_note_change(old, new)
+    apply_rollup_change(instance.user_id, old, new)
+    instance._stats_state = new
+
+
+@receiver(post_save, sender=TastingNote)
+def bump_notes_version_on_save(sender, instance, created, **kwargs):
+    # 불러올 때 공개 여부를 모르면(지연 로딩 등) 공개였던 것으로 간주
+    was_public = False if created else getattr(instance, "_loaded_public", None) is not False
+    bump_user_notes_version(instance.user_id, public=instance.is_public or was_public)
+    instance._loaded_public = instance.is_public
+
+
+@receiver(pre_delete, sender=TastingNote)
+def capture_note_state_before_delete(sender, instance, **kwargs):
+    _ensure_stored_state(instance)
+
+
+@receiver(post_delete, sender=TastingNote)
+def update_wine_stats_on_delete(sender, instance, **kwargs):
+    old = getattr(instance, "_stats_state", None)
+    if old is not None:
+        apply_note_change(old, None)
+        apply_rollup_change(instance.user_id, old, None)
+
+
+@receiver(post_delete, sender=TastingNote)
+def bump_notes_version_on_delete(sender, instance, **kwargs):
+    bump_user_notes_version(instance.user_id, public=instance.is_public)
+
+
+@receiver(post_save, sender=TastingNote)
+def index_note_on_save(sender, instance, using, update_fields=None, **kwargs):
+    if update_fields is not None and not SEARCH_FIELDS & set(update_fields):
+        return
+    index_notes(TastingNote.objects.using(using).filter(pk=instance.pk), using=using)
+
+
+@receiver(post_delete, sender=TastingNote)
+def unindex_note_on_delete(sender, instance, using, **kwargs):
+    unindex_notes([instance.pk], using=using)
+
+
+@receiver(post_save, sender=Wine)
+def bump_notes_versions_on_wine_save(sender, instance, created, **kwargs):
+    """와인 정보는 노트 응답(대시보드 등)에 포함되므로 그 와인에 노트를 쓴 사용자들의 버전 증가"""
+    if not created:
+        bump_wine_notes_versions([instance.pk])
+
+
+@receiver(post_save, sender=Wine)
+def reindex_notes_on_wine_rename(sender, instance, created, using, update_fields=None, **kwargs):
+    """와인 이름은 노트 검색 문서에 포함되므로 이름이 바뀌었을 수 있으면 해당 와인의 노트 재색인"""
+    if created or (update_fields is not None and "name" not in update_fields):
+        return
+    index_notes(TastingNote.objects.using(using).filter(wine_id=instance.pk), using=using)
+
+
+@receiver(pre_save, sender=TastingNote)
+def capture_photo_names_before_save(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and "photos" not in update_fields:
+        return
+    if not hasattr(instance, "_loaded_photo_names") and instance.pk and not instance._state.adding:
+        photos = TastingNote.objects.filter(pk=instance.pk).values_list("photos", flat=True).first()
+        instance._loaded_photo_names = photo_names(photos)
+
+
+@receiver(post_save, sender=TastingNote)
+def update_photo_refs_on_save(sender, instance, created, update_fields=None, **kwargs):
+    if update_fields is not None and "photos" not in update_fields:
+        return
+    old = [] if created else getattr(instance, "_loaded_photo_names", [])
+    new = photo_names(instance.photos)
+    update_photo_refs(old, new)
+    instance._loaded_photo_names = new
+
+
+@receiver(post_delete, sender=TastingNote)
+def release_photos_on_delete(sender, instance, **kwargs):
+    update_photo_refs(getattr(instance, "_loaded_photo_names", photo_names(instance.photos)), [])
+
+
+@receiver(post_save, sender=Template)
+@receiver(post_delete, sender=Template)
+def invalidate_template_schema_on_change(sender, instance, **kwargs):
+    invalidate_template_schema(instance.pk)
+
+
+@receiver(post_save, sender=TastingNote)
+def index_custom_fields_on_save(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not CUSTOM_FIELD_FIELDS & set(update_fields):
+        return
+    index_note_fields([instance])
+
+
+@receiver(post_save, sender=Template)
+def reindex_custom_fields_on_template_change(sender, instance, created, update_fields=None, **kwargs):
+    """필드 type 이 바뀌었을 수 있으므로 템플릿을 쓰는 노트 색인 재작성"""
+    if created or (update_fields is not None and "fields" not in update_fields):
+        return
+    reindex_template_notes(instance)
+
+
+@receiver(post_save, sender=TastingNote)
+def sync_aroma_tags_on_save(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not AROMA_FIELDS & set(update_fields):
+        return
+    sync_note_aromas([instance])
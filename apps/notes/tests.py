@@ -0,0 +1,99 @@
+"""
+시음 통계 쿼리 수 회귀 테스트 — apps.notes.analytics.NOTE_STATISTICS_QUERY_BUDGET 고정
+- note_statistics·note_statistics_windows: 노트 수·기간·창 수와 무관하게 예산과 같은 쿼리 수
+- tasting-notes statistics·dashboard stats(windows 포함) 엔드포인트: 예산 + 조건부 GET 검증자 조회
+  (사용자 노트 버전, tasting-notes 는 카탈로그 세대 번호도)
+
+실행: python manage.py test apps.notes
+"""
+import random
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.dashboard.views import StatsView
+from apps.wines.models import Wine
+
+from .analytics import NOTE_STATISTICS_QUERY_BUDGET, note_statistics, note_statistics_windows
+from .models import TastingNote
+from .rollups import rebuild_user_rollups
+from .views import TastingNoteViewSet
+
+# 엔드포인트 검증자 조회 수 (apps.notes.versions.get_user_notes_version, 와인 검색 색인 세대 번호)
+USER_VERSION_QUERIES = 1
+CATALOG_GENERATION_QUERIES = 1
+
+
+class NoteStatisticsQueryBudgetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        rnd = random.Random(0)
+        cls.today = timezone.now().date()
+        wines = Wine.objects.bulk_create(
+            Wine(name=f"Budget Wine {i}", type=rnd.choice(["red", "white"]), region=f"Region {i % 4}")
+            for i in range(20)
+        )
+        cls.users = []
+        for index, count in enumerate((10, 500)):
+            user = get_user_model().objects.create(username=f"budget{index}", email=f"budget{index}@example.invalid")
+            # 최근 900일에 고르게 — 모든 기간·창에 노트가 있도록 (빈 기간은 와인 조회를 건너뛰어 쿼리가 적음)
+            TastingNote.objects.bulk_create(
+                TastingNote(
+                    user=user,
+                    wine=rnd.choice(wines),
+                    rating=rnd.randint(1, 5),
+                    tasted_date=cls.today - timedelta(days=i * 900 // count),
+                )
+                for i in range(count)
+            )
+            rebuild_user_rollups([user.pk])
+            cls.users.append(user)
+
+    def setUp(self):
+        # 대시보드 응답 캐시(config.responsecache)가 이전 테스트 결과를 돌려주지 않도록
+        cache.clear()
+        self.factory = APIRequestFactory()
+
+    def test_note_statistics(self):
+        periods = ((None, None), (self.today - timedelta(days=400), None), (None, self.today - timedelta(days=37)))
+        for user in self.users:
+            for start, end in periods:
+                with self.subTest(user=user.username, start=start, end=end):
+                    with self.assertNumQueries(NOTE_STATISTICS_QUERY_BUDGET):
+                        note_statistics(user.pk, start, end)
+
+    def test_note_statistics_windows(self):
+        for user in self.users:
+            for windows in ((1,), (1, 3, 12), (1, 3, 12, 24, 60, 120)):
+                with self.subTest(user=user.username, windows=windows):
+                    with self.assertNumQueries(NOTE_STATISTICS_QUERY_BUDGET):
+                        note_statistics_windows(user.pk, windows)
+
+    def _get(self, view, path, user, queries):
+        request = self.factory.get(path)
+        force_authenticate(request, user=user)
+        with self.assertNumQueries(queries):
+            response = view(request)
+        self.assertEqual(response.status_code, 200)
+
+    def test_tasting_notes_statistics_endpoint(self):
+        view = TastingNoteViewSet.as_view({"get": "statistics"})
+        for user in self.users:
+            with self.subTest(user=user.username):
+                self._get(
+                    view,
+                    "/api/tasting-notes/statistics/",
+                    user,
+                    NOTE_STATISTICS_QUERY_BUDGET + USER_VERSION_QUERIES + CATALOG_GENERATION_QUERIES,
+                )
+
+    def test_dashboard_stats_endpoint(self):
+        view = StatsView.as_view()
+        for user in self.users:
+            for path in ("/api/dashboard/stats/", "/api/dashboard/stats/?windows=1,3,12"):
+                with self.subTest(user=user.username, path=path):
+                    self._get(view, path, user, NOTE_STATISTICS_QUERY_BUDGET + USER_VERSION_QUERIES)
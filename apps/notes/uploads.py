@@ -0,0 +1,211 @@
+"""
+시음 노트 사진 이어 올리기 (세션 생성 → 청크 업로드 → 완료)
+- POST   /api/tasting-notes/{id}/photo_uploads/                     {size, content_type, filename, sha256?} → 세션
+- GET    /api/tasting-notes/{id}/photo_uploads/{upload_id}/          받은 바이트 수 (끊긴 뒤 이어 올릴 위치)
+- PUT    /api/tasting-notes/{id}/photo_uploads/{upload_id}/          본문 = 청크 (application/octet-stream),
+                                                                    Content-Range: bytes start-end/size
+- POST   /api/tasting-notes/{id}/photo_uploads/{upload_id}/finalize/ 검증 후 노트에 사진 추가 (upload_photo 와 동일)
+- 청크는 로컬 스풀 파일(settings.PHOTO_UPLOAD_DIR/<upload_id>.part)의 해당 위치에 블록 단위로 바로 기록
+  → 요청 하나가 작업자를 잡는 시간은 청크 1개 분량, 같은 청크 재전송은 같은 위치 덮어쓰기라 안전
+- 세션 정보는 같은 이름의 .json (apps.wines.importer.write_checkpoint), 받은 바이트 수는 스풀 파일 크기
+- 완료 시 스풀 파일을 임시 업로드 파일로 감싸 이미지 검증·해시·저장 (FileSystemStorage 는 파일 이동, 메모리 적재 없음)
+- 만료(PHOTO_UPLOAD_TTL)된 세션은 gc_note_photos 가 정리
+"""
+import hashlib
+import re
+import time
+import uuid
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from rest_framework.parsers import BaseParser
+
+from apps.wines.importer import read_checkpoint, write_checkpoint
+
+UPLOAD_CHUNK_SIZE = 256 * 1024
+MAX_CHUNK_SIZE = 1024 * 1024
+MAX_UPLOAD_SIZE = 5 * 1024 * 1024
+PHOTO_UPLOAD_TTL = timedelta(hours=24)
+COPY_BLOCK_SIZE = 64 * 1024
+ALLOWED_CONTENT_TYPES = ("image/jpeg", "image/png", "image/jpg")
+_CONTENT_RANGE = re.compile(r"^bytes (\d+)-(\d+)/(\d+)$")
+_UPLOAD_ID = re.compile(r"^[0-9a-f]{32}$")
+
+
+class PhotoUploadError(Exception):
+    """이어 올리기 요청 오류 — 뷰에서 {"error": message, **extra} 응답으로 변환"""
+
+    def __init__(self, message, status_code=400, **extra):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+        self.extra = extra
+
+
+class ChunkParser(BaseParser):
+    """청크 본문을 읽지 않고 스트림 그대로 넘김 (write_chunk 가 블록 단위로 스풀에 기록)"""
+
+    media_type = "application/octet-stream"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        return stream
+
+
+class SpooledUpload(UploadedFile):
+    """스풀 파일을 업로드 파일처럼 — temporary_file_path 가 있어 ImageField 검증·저장소가 경로로 처리"""
+
+    def __init__(self, path, name, content_type, size):
+        super().__init__(open(path, "rb"), name=name, content_type=content_type, size=size)
+        self.path = str(path)
+
+    def temporary_file_path(self):
+        return self.path
+
+
+def _upload_dir():
+    return Path(getattr(settings, "PHOTO_UPLOAD_DIR", Path(settings.BASE_DIR) / "var" / "photo_uploads"))
+
+
+def _paths(upload_id):
+    directory = _upload_dir()
+    return directory / f"{upload_id}.json", directory / f"{upload_id}.part"
+
+
+def _received(part_path):
+    try:
+        return part_path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def session_payload(session):
+    return {
+        "upload_id": session["upload_id"],
+        "size": session["size"],
+        "received": _received(_paths(session["upload_id"])[1]),
+        "chunk_size": UPLOAD_CHUNK_SIZE,
+        "expires_at": session["created_at"] + PHOTO_UPLOAD_TTL.total_seconds(),
+    }
+
+
+def create_upload_session(user, note, size, content_type, filename="", sha256=""):
+    """빈 스풀 파일과 세션 정보 생성 → 세션 (크기·형식은 TastingNotePhotoUploadSessionSerializer 에서 검증)"""
+    session = {
+        "upload_id": uuid.uuid4().hex,
+        "user_id": user.pk,
+        "note_id": note.pk,
+        "size": size,
+        "content_type": content_type,
+        "filename": str(filename or "")[:200],
+        "sha256": sha256 or "",
+        "created_at": time.time(),
+    }
+    meta_path, part_path = _paths(session["upload_id"])
+    part_path.parent.mkdir(parents=True, exist_ok=True)
+    part_path.touch()
+    write_checkpoint(meta_path, session)
+    return session
+
+
+def get_upload_session(user, note, upload_id):
+    """본인·해당 노트의 만료 전 세션, 없으면 None"""
+    if not _UPLOAD_ID.match(upload_id or ""):
+        return None
+    meta_path, _ = _paths(upload_id)
+    try:
+        session = read_checkpoint(meta_path)
+    except (FileNotFoundError, ValueError):
+        return None
+    if session.get("user_id") != user.pk or session.get("note_id") != note.pk:
+        return None
+    if time.time() - session["created_at"] > PHOTO_UPLOAD_TTL.total_seconds():
+        return None
+    return session
+
+
+def parse_content_range(header, size):
+    """'bytes start-end/size' → (start, 길이)"""
+    match = _CONTENT_RANGE.match(header or "")
+    if not match:
+        raise PhotoUploadError("Content-Range: bytes start-end/size 헤더가 필요합니다.")
+    start, end, total = (int(value) for value in match.groups())
+    if total != size or start > end or end >= size:
+        raise PhotoUploadError("Content-Range가 세션 크기와 맞지 않습니다.", status_code=416)
+    length = end - start + 1
+    if length > MAX_CHUNK_SIZE:
+        raise PhotoUploadError("청크는 1MB를 초과할 수 없습니다.", status_code=413)
+    return start, length
+
+
+def write_chunk(session, start, length, stream):
+    """스트림에서 length 바이트를 스풀 파일 start 위치에 블록 단위로 기록 → 받은 바이트 수"""
+    _, part_path = _paths(session["upload_id"])
+    received = _received(part_path)
+    if start > received:
+        # 중간이 비면 조립할 수 없으므로 받은 위치부터 다시 보내도록
+        raise PhotoUploadError("앞선 청크가 아직 없습니다.", status_code=409, received=received)
+    if not hasattr(stream, "read"):
+        raise PhotoUploadError("청크 본문이 없습니다.", received=received)
+    written = 0
+    with open(part_path, "r+b") as fp:
+        fp.seek(start)
+        while written < length:
+            block = stream.read(min(COPY_BLOCK_SIZE, length - written))
+            if not block:
+                break
+            fp.write(block)
+            written += len(block)
+    if written < length:
+        # 끊긴 청크 — 받은 만큼은 유효하므로 클라이언트는 GET 으로 위치를 확인해 이어 보낸다
+        raise PhotoUploadError("청크 본문이 Content-Range보다 짧습니다.", received=_received(part_path))
+    return _received(part_path)
+
+
+def spooled_upload(session):
+    """모두 받은 세션의 스풀 파일 → 업로드 파일 (sha256 을 받았으면 스트리밍 해시로 검증)"""
+    _, part_path = _paths(session["upload_id"])
+    received = _received(part_path)
+    if received != session["size"]:
+        raise PhotoUploadError("아직 모든 청크를 받지 않았습니다.", status_code=409, received=received)
+    upload = SpooledUpload(part_path, session["filename"] or part_path.name, session["content_type"], received)
+    if session["sha256"]:
+        digest = hashlib.sha256()
+        for chunk in upload.chunks():
+            digest.update(chunk)
+        upload.seek(0)
+        if digest.hexdigest() != session["sha256"]:
+            upload.close()
+            discard_upload_session(session["upload_id"])
+            raise PhotoUploadError("sha256이 일치하지 않습니다. 처음부터 다시 업로드하세요.")
+        upload.digest = session["sha256"]
+    return upload
+
+
+def discard_upload_session(upload_id):
+    for path in _paths(upload_id):
+        path.unlink(missing_ok=True)
+
+
+def cleanup_expired_uploads(now=None):
+    """만료된 세션의 스풀·세션 파일 삭제 → 삭제한 세션 수"""
+    directory = _upload_dir()
+    if not directory.exists():
+        return 0
+    deadline = (now or time.time()) - PHOTO_UPLOAD_TTL.total_seconds()
+    removed = 0
+    for meta_path in directory.glob("*.json"):
+        try:
+            created_at = read_checkpoint(meta_path)["created_at"]
+        except (FileNotFoundError, ValueError, KeyError):
+            created_at = meta_path.stat().st_mtime if meta_path.exists() else 0
+        if created_at < deadline:
+            discard_upload_session(meta_path.stem)
+            removed += 1
+    # 세션 정보 없이 남은 스풀 파일
+    for part_path in directory.glob("*.part"):
+        if not (directory / f"{part_path.stem}.json").exists() and part_path.stat().st_mtime < deadline:
+            part_path.unlink(missing_ok=True)
+            removed += 1
+    return removed
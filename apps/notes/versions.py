@@ -0,0 +1,72 @@
+"""
+시음 노트 변경 버전 — 조건부 GET(ETag/Last-Modified) 검증자 (config.conditional)
+- 사용자별: UserNoteVersion.version 을 노트 저장/삭제마다 F() 증가, changed_at 갱신
+- 공개 노트 전체: PublicNoteVersion 카운터 합계 (공개 노트 또는 공개 여부가 바뀐 노트가 변경될 때만 증가).
+  프로세스별 캐시가 아닌 DB 라 모든 워커가 같은 값 — 다른 워커의 변경 뒤 오래된 304 가 나가지 않음.
+  사용자 ID % SHARDS 행에 나눠 증가시키므로 서로 다른 사용자의 공개 노트 쓰기가 한 행 잠금에 줄 서지 않음
+쿼리셋 update()/bulk_create 처럼 시그널을 거치지 않는 쓰기 후에는 bump_user_notes_version 을 직접 호출.
+- 와인 정보 변경: 노트에 와인 이름·타입 등이 함께 나가므로 그 와인에 노트를 쓴 사용자들의 버전 증가
+  (bump_wine_notes_versions — Wine 저장 시그널, 카탈로그 일괄 upsert, 와인 병합) → 대시보드 응답 캐시 키
+"""
+from django.db.models import F, Sum
+from django.utils import timezone
+
+from .models import PublicNoteVersion, TastingNote, UserNoteVersion
+
+
+def bump_user_notes_version(user_id, public=False):
+    """user_id 의 노트 변경 카운터 증가. public=True 면 공개 노트 세대도 증가."""
+    now = timezone.now()
+    updated = UserNoteVersion.objects.filter(user_id=user_id).update(version=F("version") + 1, changed_at=now)
+    if not updated:
+        _, created = UserNoteVersion.objects.get_or_create(
+            user_id=user_id, defaults={"version": 1, "changed_at": now}
+        )
+        if not created:
+            UserNoteVersion.objects.filter(user_id=user_id).update(version=F("version") + 1, changed_at=now)
+    if public:
+        bump_public_notes_generation(user_id)
+
+
+def bump_users_notes_version(user_ids):
+    """여러 사용자의 노트 변경 카운터를 한 번에 증가 (UPDATE 1회 + 없는 행 생성)"""
+    user_ids = set(user_ids)
+    if not user_ids:
+        return
+    now = timezone.now()
+    existing = UserNoteVersion.objects.filter(user_id__in=user_ids)
+    missing = user_ids - set(existing.values_list("user_id", flat=True))
+    existing.update(version=F("version") + 1, changed_at=now)
+    UserNoteVersion.objects.bulk_create(
+        [UserNoteVersion(user_id=user_id, version=1, changed_at=now) for user_id in missing],
+        ignore_conflicts=True,
+    )
+
+
+def bump_wine_notes_versions(wine_ids):
+    """wine_ids 와인에 노트를 쓴 사용자들의 버전 증가 (와인 정보 변경이 그 사용자들의 응답에 반영되도록)"""
+    bump_users_notes_version(
+        TastingNote.objects.filter(wine_id__in=list(wine_ids)).order_by().values_list("user_id", flat=True).distinct()
+    )
+
+
+def get_user_notes_version(user_id):
+    """(version, changed_at) — 노트를 한 번도 쓰지 않은 사용자는 (0, None)"""
+    row = UserNoteVersion.objects.filter(user_id=user_id).values_list("version", "changed_at").first()
+    return row or (0, None)
+
+
+def bump_public_notes_generation(user_id):
+    """공개 노트 카운터 증가 — user_id 의 샤드 행만 (호출자의 트랜잭션 안에서, 롤백되면 함께 취소)"""
+    now = timezone.now()
+    shard = user_id % PublicNoteVersion.SHARDS
+    rows = PublicNoteVersion.objects.filter(pk=shard)
+    if not rows.update(version=F("version") + 1, changed_at=now):
+        _, created = PublicNoteVersion.objects.get_or_create(pk=shard, defaults={"version": 1, "changed_at": now})
+        if not created:
+            rows.update(version=F("version") + 1, changed_at=now)
+
+
+def public_notes_generation():
+    """공개 노트 카운터 (샤드 합계) — 공개 노트가 한 번도 바뀌지 않았으면 0"""
+    return PublicNoteVersion.objects.aggregate(total=Sum("version"))["total"] or 0
@@ -2,31 +2,77 @@
 시음 노트 API (PRD 9.3)
 - GET/POST /api/tasting-notes/
 - GET/PATCH/DELETE /api/tasting-notes/{id}
-- 필터: wine, rating, tasted_date, location, is_public / 검색: notes, aroma_notes, pairing, wine__name
-- 커스텀 액션: my_notes, calendar, statistics, upload_photo, delete_photo
+- 필터: wine, rating, tasted_date, location, is_public,
+  custom_fields__<name>[__contains|__gt|__gte|__lt|__lte] (템플릿 커스텀 필드 값 색인, apps.notes.fieldindex),
+  tag (정규화된 아로마 태그, 여러 개면 AND — apps.notes.aromas)
+- 검색(?search=): notes, aroma_notes, pairing, wine__name 전문 검색 색인, 관련도 순 (apps.notes.fulltext)
+- 사진: upload_photo 는 원본을 내용 주소(SHA-256)로 중복 없이 저장 후 바로 응답, 썸네일·중간·WebP 렌디션은
+  워커 풀에서 생성. 마지막 참조가 사라진 원본은 삭제 (apps.notes.photos)
+- 사진 이어 올리기: photo_uploads (세션 생성 → 청크 PUT → finalize, apps.notes.uploads)
+- 커스텀 액션: bulk(일괄 생성), export(csv|ndjson|json 스트리밍 내보내기),
+  import / import_status(다른 앱 CSV 백그라운드 가져오기), my_notes, calendar, statistics,
+  aroma_tags(아로마 태그 빈도·와인 타입별), flavor_profile(맛 축 평균·분산·평점 상관, apps.notes.flavor),
+  upload_photo, delete_photo
+- ?pagination=cursor: COUNT 없는 키셋 페이지네이션 (-tasted_date, -created_at, id)
+- 목록(list, my_notes)은 values() 행 빠른 직렬화 + ?fields= 선택 필드 (config.fastlist)
+- 조회(list, retrieve, my_notes, calendar, statistics, aroma_tags, flavor_profile)는 조건부 GET 지원 — 사용자 노트 버전·공개 노트 세대·
+  카탈로그 세대 번호로 ETag 구성, 일치하면 쿼리·직렬화 없이 304 (config.conditional, apps.notes.versions)
 """
-from datetime import timedelta
-import uuid
 
-from django.db.models import Avg, Count, Q
-from django.db.models.functions import TruncMonth
+from django.db.models import Q
 from django.utils import timezone
-from django.core.files.storage import default_storage
+from django.http import StreamingHttpResponse
 from rest_framework import viewsets, permissions, status, filters
 from rest_framework.decorators import action
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from rest_framework.parsers import MultiPartParser, JSONParser
 from django_filters.rest_framework import DjangoFilterBackend
 
-from .models import Template, TastingNote
+from apps.wines.search import wine_search_index
+from config.conditional import ConditionalGetMixin
+from config.fastlist import get_fast_list_serializer
+from config.responsecache import CachedResponseMixin
+from .analytics import note_statistics
+from .aromas import (
+    AROMA_TAGS_LIMIT,
+    AROMA_TAGS_MAX_LIMIT,
+    AromaTagFilter,
+    aroma_tag_counts,
+    aroma_tag_counts_by_wine_type,
+)
+from .bulk import BULK_CREATE_MAX, create_notes_bulk, prefetch_related_objects
+from .export import EXPORT_FORMATS, ExportRenderer, stream_notes
+from .fieldindex import CustomFieldFilter
+from .flavor import note_flavor_profile
+from .fulltext import NoteFullTextSearchFilter
+from .importer import get_note_import_job, start_note_import_job
+from .models import NoteAromaTag, Template, TastingNote
+from .photos import add_note_photo, photo_entry, photo_thumbnail, photo_urls
+from .rollups import parse_date_range
 from .serializers import (
     TemplateSerializer,
     TastingNoteListSerializer,
     TastingNoteDetailSerializer,
     TastingNoteCreateUpdateSerializer,
     TastingNotePhotoUploadSerializer,
+    TastingNotePhotoUploadSessionSerializer,
     TastingNoteStatisticsSerializer,
+    TastingNoteBulkItemSerializer,
+)
+from .uploads import (
+    ChunkParser,
+    PhotoUploadError,
+    create_upload_session,
+    discard_upload_session,
+    get_upload_session,
+    parse_content_range,
+    session_payload,
+    spooled_upload,
+    write_chunk,
 )
+from .versions import get_user_notes_version, public_notes_generation
+from .visibility import VisibleNotes, visible_note_streams
 
 
 class IsOwnerOrReadOnly(permissions.BasePermission):
@@ -65,18 +111,22 @@ class TemplateViewSet(viewsets.ModelViewSet):
         )
 
 
-class TastingNoteViewSet(viewsets.ModelViewSet):
+class TastingNoteViewSet(CachedResponseMixin, ConditionalGetMixin, viewsets.ModelViewSet):
     """
     시음 노트 CRUD API.
-    list: 내 노트 + 공개 노트 / retrieve / create / update / destroy
-    액션: my_notes, calendar, statistics, upload_photo, delete_photo
+    list: 내 노트 + 공개 노트 (두 인덱스 스트림 병합, apps.notes.visibility) / retrieve / create / update / destroy
+    액션: bulk, export, import, import_status, my_notes, calendar, statistics, aroma_tags,
+    upload_photo, photo_uploads, delete_photo
     """
 
     permission_classes = [permissions.IsAuthenticated, IsOwnerOrReadOnly]
+    # 전문 검색은 관련도 정렬이 기본 정렬에 덮이지 않도록 OrderingFilter 뒤에
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
+        CustomFieldFilter,
+        AromaTagFilter,
         filters.OrderingFilter,
+        NoteFullTextSearchFilter,
     ]
     filterset_fields = {
         "wine": ["exact"],
@@ -88,15 +138,60 @@ class TastingNoteViewSet(viewsets.ModelViewSet):
     search_fields = ["notes", "aroma_notes", "pairing", "wine__name"]
     ordering_fields = ["tasted_date", "rating", "created_at"]
     ordering = ["-tasted_date", "-created_at"]
+    # ?pagination=cursor 키셋 페이지네이션 정렬 키 (list, my_notes)
+    cursor_ordering = ("-tasted_date", "-created_at", "id")
     parser_classes = (MultiPartParser, JSONParser)
 
+    def conditional_validators(self):
+        user = self.request.user
+        catalog = wine_search_index.current_generation()
+        if self.action in ("my_notes", "calendar", "statistics", "aroma_tags", "flavor_profile"):
+            version, changed_at = get_user_notes_version(user.pk)
+            return (version, catalog), changed_at
+        if self.action == "list":
+            # 다른 사용자의 공개 노트도 포함되므로 Last-Modified 없이 ETag만
+            version, _ = get_user_notes_version(user.pk)
+            return (version, public_notes_generation(), catalog), None
+        if self.action == "retrieve":
+            try:
+                pk = int(self.kwargs[self.lookup_field])
+            except (KeyError, ValueError):
+                return None
+            row = (
+                TastingNote.objects.filter(pk=pk)
+                .values_list("user_id", "is_public", "updated_at", "template__updated_at", "user__username")
+                .first()
+            )
+            if row is None or (row[0] != user.pk and not row[1]):
+                return None
+            return (pk, catalog, *row), row[2]
+        return None
+
     def get_queryset(self):
         user = self.request.user
-        return (
-            TastingNote.objects.filter(Q(user=user) | Q(is_public=True))
-            .select_related("user", "wine", "template")
-            .distinct()
+        # FK 조인만 있어 중복 행이 없으므로 DISTINCT 불필요 (목록은 list()에서 스트림 병합)
+        return TastingNote.objects.filter(Q(user=user) | Q(is_public=True)).select_related(
+            "user", "wine", "template"
+        )
+
+    def list(self, request, *args, **kwargs):
+        """
+        내 노트·남의 공개 노트를 각각 필터·정렬한 뒤 병합 (OR + DISTINCT 없이 인덱스 순서 스캔).
+        페이지 행은 values() 로 읽어 빠른 직렬화 (?fields= 선택 필드, config.fastlist)
+        """
+        fast = self.get_fast_list_serializer()
+        notes = VisibleNotes(
+            (self.filter_queryset(qs) for qs in visible_note_streams(request.user)),
+            fetch=lambda ids: fast.fetch(TastingNote.objects, ids),
         )
+        page = self.paginate_queryset(notes)
+        if page is not None:
+            return self.get_paginated_response(fast.serialize(page))
+        return Response(fast.serialize(notes[: notes.count()]))
+
+    def get_fast_list_serializer(self):
+        """목록 응답(TastingNoteListSerializer 형식) 빠른 직렬화기 — 키셋 커서용 정렬 키 열 포함"""
+        return get_fast_list_serializer(TastingNoteListSerializer, self.request, self.cursor_ordering)
 
     def get_serializer_class(self):
         if self.action == "list":
@@ -111,16 +206,95 @@ class TastingNoteViewSet(viewsets.ModelViewSet):
     def perform_destroy(self, instance):
         instance.delete()
 
+    @action(detail=False, methods=["post"], url_path="bulk", parser_classes=[JSONParser])
+    def bulk_create(self, request):
+        """
+        시음 노트 일괄 생성. Body: [{노트}, ...] 또는 {"notes": [...]} (최대 BULK_CREATE_MAX건)
+        query: partial=true 면 유효한 항목만 생성, 아니면 오류가 하나라도 있으면 아무것도 생성하지 않음
+        응답: created(생성된 노트), errors=[{index, errors}]
+        """
+        items = request.data.get("notes") if isinstance(request.data, dict) else request.data
+        if not isinstance(items, list) or not items:
+            return Response(
+                {"error": "노트 목록(배열)이 필요합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(items) > BULK_CREATE_MAX:
+            return Response(
+                {"error": f"한 번에 최대 {BULK_CREATE_MAX}건까지 생성할 수 있습니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        partial = request.query_params.get("partial") in ("1", "true")
+        context = {**self.get_serializer_context(), **prefetch_related_objects(items)}
+        valid, errors = [], []
+        for index, item in enumerate(items):
+            ser = TastingNoteBulkItemSerializer(data=item, context=context)
+            if ser.is_valid():
+                valid.append(ser.validated_data)
+            else:
+                errors.append({"index": index, "errors": ser.errors})
+        if errors and not partial:
+            return Response(
+                {"created": [], "errors": errors},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        notes = create_notes_bulk(request.user, valid)
+        return Response(
+            {"created": TastingNoteListSerializer(notes, many=True).data, "errors": errors},
+            status=status.HTTP_201_CREATED if notes else status.HTTP_400_BAD_REQUEST,
+        )
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path=r"export/(?P<fmt>csv|ndjson|json)",
+        renderer_classes=[JSONRenderer, ExportRenderer],
+    )
+    def export(self, request, fmt=None):
+        """내 시음 노트 전체를 CSV/NDJSON/JSON으로 스트리밍 (페이지네이션·COUNT 없음, 메모리 일정)"""
+        response = StreamingHttpResponse(stream_notes(request.user, fmt), content_type=EXPORT_FORMATS[fmt])
+        filename = f"tasting-notes-{timezone.localdate():%Y%m%d}.{fmt}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        # 리버스 프록시(nginx)가 본문을 모아 두지 않고 바로 전달하도록
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    @action(detail=False, methods=["post"], url_path="import", parser_classes=[MultiPartParser])
+    def import_notes(self, request):
+        """다른 앱에서 내보낸 노트 CSV 업로드 → 백그라운드 가져오기. Body: multipart/form-data, file=CSV"""
+        upload = request.FILES.get("file")
+        if upload is None:
+            return Response(
+                {"error": "file 파라미터가 필요합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        job_id = start_note_import_job(request.user, upload)
+        return Response(
+            {"message": "가져오기를 시작했습니다.", "job": job_id},
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+    @action(detail=False, methods=["get"])
+    def import_status(self, request):
+        """노트 가져오기 진행 상황. query: job=작업 ID"""
+        job = get_note_import_job(request.user, request.query_params.get("job", ""))
+        if job is None:
+            return Response(
+                {"error": "해당 작업을 찾을 수 없습니다."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        job.pop("user_id", None)
+        return Response(job)
+
     @action(detail=False, methods=["get"])
     def my_notes(self, request):
-        """내 시음 노트만 (공개 노트 제외)"""
-        qs = TastingNote.objects.filter(user=request.user).select_related("wine")
+        """내 시음 노트만 (공개 노트 제외, ?fields= 선택 필드)"""
+        fast = self.get_fast_list_serializer()
+        qs = fast.values(TastingNote.objects.filter(user=request.user))
         page = self.paginate_queryset(qs)
         if page is not None:
-            return self.get_paginated_response(
-                TastingNoteListSerializer(page, many=True).data
-            )
-        return Response(TastingNoteListSerializer(qs, many=True).data)
+            return self.get_paginated_response(fast.serialize(page))
+        return Response(fast.serialize(qs))
 
     @action(detail=False, methods=["get"])
     def calendar(self, request):
@@ -146,7 +320,7 @@ class TastingNoteViewSet(viewsets.ModelViewSet):
                     "id": note.id,
                     "wine_name": note.wine.name,
                     "rating": note.rating,
-                    "photo": (note.photos[0] if note.photos else None),
+                    "photo": photo_thumbnail(note.photos),
                 }
             )
 
@@ -159,91 +333,172 @@ class TastingNoteViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=["get"])
     def statistics(self, request):
         """
-        내 시음 통계. query: start_date, end_date (선택)
+        내 시음 통계. query: start_date, end_date (선택), 월별 추이는 최근 180일
+        계산은 dashboard 통계와 공유 (apps.notes.analytics — 사용자 통계 롤업 합산, 쿼리 2회)
         """
-        qs = TastingNote.objects.filter(user=request.user)
-        start_date = request.query_params.get("start_date")
-        end_date = request.query_params.get("end_date")
-        if start_date:
-            qs = qs.filter(tasted_date__gte=start_date)
-        if end_date:
-            qs = qs.filter(tasted_date__lte=end_date)
-
-        total_notes = qs.count()
-        avg_result = qs.aggregate(Avg("rating"))
-        average_rating = avg_result["rating__avg"]
-        if average_rating is not None:
-            average_rating = round(float(average_rating), 2)
-
-        type_row = (
-            qs.values("wine__type")
-            .annotate(count=Count("id"))
-            .order_by("-count")
-            .first()
-        )
-        favorite_wine_type = type_row["wine__type"] if type_row else ""
-        region_row = (
-            qs.values("wine__region")
-            .annotate(count=Count("id"))
-            .order_by("-count")
-            .first()
-        )
-        favorite_region = (region_row["wine__region"] or "") if region_row else ""
-
-        six_months_ago = timezone.now().date() - timedelta(days=180)
-        monthly_qs = (
-            qs.filter(tasted_date__gte=six_months_ago)
-            .annotate(month=TruncMonth("tasted_date"))
-            .values("month")
-            .annotate(count=Count("id"))
-            .order_by("month")
-        )
-        monthly_count = {
-            str(row["month"])[:7]: row["count"] for row in monthly_qs
-        }
-
-        rating_distribution = {
-            str(i): qs.filter(rating=i).count() for i in range(1, 6)
-        }
-
+        start_date, end_date = parse_date_range(request.query_params)
+        stats = note_statistics(request.user.pk, start_date, end_date, trend_days=180)
         data = {
-            "total_notes": total_notes,
-            "average_rating": average_rating,
-            "favorite_wine_type": favorite_wine_type,
-            "favorite_region": favorite_region,
-            "monthly_count": monthly_count,
-            "rating_distribution": rating_distribution,
+            "total_notes": stats["total"],
+            "average_rating": stats["average_rating"],
+            "favorite_wine_type": next(iter(stats["type_distribution"]), ""),
+            "favorite_region": next(iter(stats["region_distribution"]), ""),
+            "monthly_count": stats["monthly"],
+            "rating_distribution": stats["rating_distribution"],
         }
         serializer = TastingNoteStatisticsSerializer(data=data)
         serializer.is_valid(raise_exception=True)
         return Response(serializer.data)
 
+    @action(detail=False, methods=["get"])
+    def aroma_tags(self, request):
+        """
+        내 노트의 아로마 태그 빈도 (태그 클라우드). query: wine_type, region, start_date, end_date, limit (기본 50, 최대 200)
+        응답: tags = [{tag(정규화 키), name, count}] (노트 수 내림차순), by_wine_type = {타입: [{tag, name, count}]}
+        """
+        try:
+            limit = min(max(int(request.query_params.get("limit", AROMA_TAGS_LIMIT)), 1), AROMA_TAGS_MAX_LIMIT)
+        except ValueError:
+            return Response(
+                {"error": "limit는 정수여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        links = NoteAromaTag.objects.filter(user=request.user)
+        params = request.query_params
+        if params.get("wine_type"):
+            links = links.filter(note__wine__type=params["wine_type"])
+        if params.get("region"):
+            links = links.filter(note__wine__region=params["region"])
+        start_date, end_date = parse_date_range(params)
+        if start_date:
+            links = links.filter(note__tasted_date__gte=start_date)
+        if end_date:
+            links = links.filter(note__tasted_date__lte=end_date)
+        return Response(
+            {
+                "tags": aroma_tag_counts(links, limit),
+                "by_wine_type": aroma_tag_counts_by_wine_type(links, limit),
+            }
+        )
+
+    @action(detail=False, methods=["get"])
+    def flavor_profile(self, request):
+        """
+        내 노트의 맛 프로필 (레이더 차트). query: start_date, end_date (선택)
+        응답: axes (body, acidity, tannin, sweetness, aroma_intensity, appearance_intensity),
+        overall / by_wine_type = {note_count, average_rating, axes: {축: {count, mean, variance, rating_correlation}}}
+        미입력 값은 축마다 제외 (apps.notes.flavor — 조회 1회 + NumPy 벡터 연산).
+        노트 수에 비례하는 조회라 응답 본문은 노트 버전 키로 캐시 (config.responsecache)
+        """
+        start_date, end_date = parse_date_range(request.query_params)
+        notes = TastingNote.objects.filter(user=request.user)
+        if start_date:
+            notes = notes.filter(tasted_date__gte=start_date)
+        if end_date:
+            notes = notes.filter(tasted_date__lte=end_date)
+        return self.cached_response(lambda: note_flavor_profile(notes))
+
     @action(detail=True, methods=["post"])
     def upload_photo(self, request, pk=None):
-        """시음 노트에 사진 1장 추가. Body: multipart/form-data, photo=파일"""
+        """
+        시음 노트에 사진 1장 추가. Body: multipart/form-data, photo=파일
+        원본은 내용 해시 경로에 한 번만 저장(이미 있으면 재사용)하고 바로 응답 —
+        방향 정규화·EXIF 제거·렌디션 생성은 워커 풀에서 (apps.notes.photos)
+        """
         note = self.get_object()
         ser = TastingNotePhotoUploadSerializer(data=request.data)
         ser.is_valid(raise_exception=True)
         photo_file = ser.validated_data["photo"]
 
-        ext = (photo_file.name or "").split(".")[-1] or "jpg"
-        filename = f"tasting_notes/{request.user.pk}/{uuid.uuid4().hex}.{ext}"
-        path = default_storage.save(filename, photo_file)
-        url = default_storage.url(path)
+        entry = add_note_photo(note, photo_file)
 
-        if not note.photos:
-            note.photos = []
-        note.photos.append(url)
-        note.save(update_fields=["photos"])
+        return Response(
+            {
+                "message": "사진이 업로드되었습니다.",
+                "url": entry["url"],
+                "photos": [photo_entry(p) for p in note.photos],
+            },
+            status=status.HTTP_201_CREATED,
+        )
 
+    @action(detail=True, methods=["post"], url_path="photo_uploads", parser_classes=[JSONParser])
+    def create_photo_upload(self, request, pk=None):
+        """
+        사진 이어 올리기 세션 생성. Body: {size, content_type, filename, sha256(선택)}
+        이후 PUT photo_uploads/{upload_id}/ 로 청크 전송, POST .../finalize/ 로 노트에 추가 (apps.notes.uploads)
+        """
+        note = self.get_object()
+        ser = TastingNotePhotoUploadSessionSerializer(data=request.data)
+        ser.is_valid(raise_exception=True)
+        session = create_upload_session(request.user, note, **ser.validated_data)
+        return Response(session_payload(session), status=status.HTTP_201_CREATED)
+
+    @action(
+        detail=True,
+        methods=["get", "put"],
+        url_path=r"photo_uploads/(?P<upload_id>[0-9a-f]{32})",
+        parser_classes=[ChunkParser],
+    )
+    def photo_upload_chunk(self, request, pk=None, upload_id=None):
+        """
+        GET: 받은 바이트 수(received) — 끊긴 뒤 이어 보낼 위치
+        PUT: 청크 1개. Body: application/octet-stream, 헤더 Content-Range: bytes start-end/size
+        """
+        note = self.get_object()
+        session = get_upload_session(request.user, note, upload_id)
+        if session is None:
+            return Response(
+                {"error": "업로드 세션을 찾을 수 없습니다."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        if request.method == "PUT":
+            try:
+                start, length = parse_content_range(request.headers.get("Content-Range"), session["size"])
+                write_chunk(session, start, length, request.data)
+            except PhotoUploadError as exc:
+                return Response({"error": exc.message, **exc.extra}, status=exc.status_code)
+        return Response(session_payload(session))
+
+    @action(
+        detail=True,
+        methods=["post"],
+        url_path=r"photo_uploads/(?P<upload_id>[0-9a-f]{32})/finalize",
+        parser_classes=[JSONParser],
+    )
+    def finalize_photo_upload(self, request, pk=None, upload_id=None):
+        """모든 청크를 받은 세션의 파일을 검증하고 노트에 사진 추가 (응답은 upload_photo 와 같음)"""
+        note = self.get_object()
+        session = get_upload_session(request.user, note, upload_id)
+        if session is None:
+            return Response(
+                {"error": "업로드 세션을 찾을 수 없습니다."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        try:
+            upload = spooled_upload(session)
+        except PhotoUploadError as exc:
+            return Response({"error": exc.message, **exc.extra}, status=exc.status_code)
+        try:
+            ser = TastingNotePhotoUploadSerializer(data={"photo": upload})
+            if not ser.is_valid():
+                discard_upload_session(upload_id)
+                return Response(ser.errors, status=status.HTTP_400_BAD_REQUEST)
+            entry = add_note_photo(note, ser.validated_data["photo"])
+        finally:
+            upload.close()
+        discard_upload_session(upload_id)
         return Response(
-            {"message": "사진이 업로드되었습니다.", "url": url, "photos": note.photos},
+            {
+                "message": "사진이 업로드되었습니다.",
+                "url": entry["url"],
+                "photos": [photo_entry(p) for p in note.photos],
+            },
             status=status.HTTP_201_CREATED,
         )
 
     @action(detail=True, methods=["delete"])
     def delete_photo(self, request, pk=None):
-        """시음 노트에서 사진 제거. query: url=삭제할 URL"""
+        """시음 노트에서 사진 제거. query: url=삭제할 URL (원본 또는 렌디션 URL)"""
         note = self.get_object()
         photo_url = request.query_params.get("url")
         if not photo_url:
@@ -251,8 +506,9 @@ class TastingNoteViewSet(viewsets.ModelViewSet):
                 {"error": "url 파라미터가 필요합니다."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        if photo_url in note.photos:
-            note.photos = [u for u in note.photos if u != photo_url]
+        photos = [p for p in note.photos if photo_url not in photo_urls(p)]
+        if len(photos) != len(note.photos):
+            note.photos = photos
             note.save(update_fields=["photos"])
             return Response({"message": "사진이 삭제되었습니다."})
         return Response(
@@ -0,0 +1,99 @@
+"""
+시음 노트 목록 가시성 (내 노트 + 다른 사용자의 공개 노트)
+- Q(user=me) | Q(is_public=True) + DISTINCT 대신 서로소인 두 스트림으로 분리:
+  내 노트 (user, -tasted_date, -created_at, id) 인덱스 / 남의 공개 노트 (-tasted_date, -created_at, id) 부분 인덱스
+- 각 스트림에서 정렬 키만 인덱스 순서로 LIMIT 조회 → heapq.merge 로 병합 → 해당 페이지 노트만 ID로 조회
+  (fetch 로 인스턴스 대신 values() 행을 받을 수 있음 — config.fastlist)
+- VisibleNotes 는 페이지네이션이 쓰는 쿼리셋 연산(order_by, filter, count, 슬라이싱)만 흉내 내므로
+  config.pagination.KeysetPagination 의 페이지 번호·키셋 커서 모드를 그대로 사용
+"""
+import heapq
+from functools import total_ordering
+from itertools import islice
+
+from .models import TastingNote
+
+
+@total_ordering
+class _Desc:
+    """내림차순 정렬 키 래퍼"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+
+def visible_note_streams(user):
+    """서로소인 (내 노트, 다른 사용자의 공개 노트) 쿼리셋 — 합치면 목록 가시성 조건과 같다"""
+    return (
+        TastingNote.objects.filter(user=user),
+        TastingNote.objects.filter(is_public=True).exclude(user=user),
+    )
+
+
+class VisibleNotes:
+    """정렬된 두 노트 스트림을 DISTINCT 없이 병합하는 지연 목록 (페이지네이션용 쿼리셋 대용)"""
+
+    ordered = True
+
+    def __init__(self, streams, select_related=("user", "wine", "template"), fetch=None):
+        self.streams = tuple(streams)
+        self.model = self.streams[0].model
+        self.select_related = select_related
+        # fetch(ids) → 해당 페이지 행 (기본: 노트 인스턴스, 목록 빠른 직렬화는 values() 행)
+        self.fetch = fetch or self._fetch_notes
+
+    def _clone(self, streams):
+        return VisibleNotes(streams, self.select_related, self.fetch)
+
+    def _fetch_notes(self, ids):
+        notes = self.model.objects.select_related(*self.select_related).in_bulk(ids)
+        return [notes[pk] for pk in ids if pk in notes]
+
+    def order_by(self, *fields):
+        return self._clone(qs.order_by(*fields) for qs in self.streams)
+
+    def filter(self, *args, **kwargs):
+        return self._clone(qs.filter(*args, **kwargs) for qs in self.streams)
+
+    def count(self):
+        return sum(qs.count() for qs in self.streams)
+
+    def __len__(self):
+        return self.count()
+
+    def _ordering(self):
+        ordering = list(self.streams[0].query.order_by or self.model._meta.ordering)
+        if not any(f.lstrip("-") in ("id", "pk") for f in ordering):
+            ordering.append("id")
+        return ordering
+
+    def __getitem__(self, index):
+        if isinstance(index, int):
+            rows = self[index : index + 1]
+            if not rows:
+                raise IndexError(index)
+            return rows[0]
+        start, stop = index.start or 0, index.stop
+        if stop is None:
+            raise ValueError("VisibleNotes 슬라이스에는 끝 위치가 필요합니다.")
+        ordering = self._ordering()
+        names = [f.lstrip("-") for f in ordering]
+        descending = [f.startswith("-") for f in ordering]
+
+        def sort_key(row):
+            return tuple(_Desc(v) if desc else v for v, desc in zip(row, descending))
+
+        # 각 스트림에서 앞쪽 stop개의 정렬 키만 (인덱스 순서) 조회 후 병합
+        streams = [
+            qs.order_by(*ordering).values_list(*names, "pk")[:stop] for qs in self.streams
+        ]
+        merged = heapq.merge(*(iter(s) for s in streams), key=lambda row: sort_key(row[:-1]))
+        return self.fetch([row[-1] for row in islice(merged, start, stop)])
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Wine
+from .models import GrapeVariety, Wine
 
 
 @admin.register(Wine)
@@ -8,3 +8,9 @@ class WineAdmin(admin.ModelAdmin):
     list_filter = ("type", "country")
     search_fields = ("name", "winery", "region")
     ordering = ("name",)
+
+
+@admin.register(GrapeVariety)
+class GrapeVarietyAdmin(admin.ModelAdmin):
+    list_display = ("name", "key")
+    search_fields = ("name", "key")
@@ -5,3 +5,6 @@ class WinesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.wines"
     verbose_name = "와인"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,246 @@
+"""
+와인 카탈로그 중복 탐지·병합
+- 정규화: 악센트·대소문자 제거(apps.wines.search.normalize), 구두점 제거, 약어 통일(Ch. → chateau),
+  빈티지와 같은 연도 토큰 제거 → "Chateau Margaux 2015" == "Château Margaux (2015)".
+  빈티지가 비어 있으면 이름 속 연도(19xx/20xx)를 빈티지로 (블로킹 키·토큰 모두)
+- 블로킹: (빈티지, 와이너리) 같은 와인끼리만 비교. 와이너리가 비어 있으면 이름 첫 토큰으로 세분화,
+  큰 블록은 정렬 토큰 문자열 기준 인접 윈도우(sorted neighbourhood)만 비교
+- 유사도: 토큰 Jaccard 와 정렬 토큰 문자열의 SequenceMatcher 비율 중 큰 값.
+  숫자 토큰(퀴베 번호 등)이 다르면 중복 아님
+- 블록 단위 비교는 ProcessPoolExecutor 로 병렬 처리 (워커는 DB에 접근하지 않음)
+- 병합: TastingNote.wine FK 일괄 변경 → 와인 집계·사용자 통계 롤업 재계산·노트 검색 재색인 → 중복 와인 삭제 (한 트랜잭션)
+"""
+import re
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from difflib import SequenceMatcher
+
+from django.db import transaction
+
+from .models import Wine
+from .search import normalize
+
+DEFAULT_THRESHOLD = 0.88
+# Wine.name_key 최대 길이
+NAME_KEY_LENGTH = 255
+# 이 크기를 넘는 블록은 전체 쌍(O(n²)) 대신 정렬 후 인접 WINDOW_SIZE 개와만 비교
+MAX_BLOCK_SIZE = 50
+WINDOW_SIZE = 20
+TOKEN_ALIASES = {
+    "ch": "chateau",
+    "chat": "chateau",
+    "dom": "domaine",
+    "st": "saint",
+    "ste": "sainte",
+    "샤또": "샤토",
+}
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_YEAR = re.compile(r"(?<!\d)(19\d\d|20\d\d)(?!\d)")
+
+
+def name_vintage(name, vintage=None):
+    """빈티지 — 비어 있으면 이름 속 마지막 연도(19xx/20xx), 없으면 None"""
+    if vintage:
+        return vintage
+    years = _YEAR.findall(name or "")
+    return int(years[-1]) if years else None
+
+
+def name_tokens(name, vintage=None):
+    """비교용 이름 토큰 (정렬·중복 제거된 튜플). 빈티지(비어 있으면 이름 속 연도) 토큰은 제외"""
+    vintage = name_vintage(name, vintage)
+    text = _PUNCTUATION.sub(" ", normalize(name)).replace("_", " ")
+    tokens = {TOKEN_ALIASES.get(t, t) for t in text.split()}
+    if vintage:
+        tokens.discard(str(vintage))
+    return tuple(sorted(tokens))
+
+
+def similarity(a, b, threshold=0.0):
+    """토큰 튜플 유사도 (0~1). threshold 미만이 확실하면 SequenceMatcher 계산을 생략하고 0."""
+    if a == b:
+        return 1.0
+    set_a, set_b = set(a), set(b)
+    if {t for t in set_a if t.isdigit()} != {t for t in set_b if t.isdigit()}:
+        return 0.0
+    union = set_a | set_b
+    if not union:
+        return 0.0
+    jaccard = len(set_a & set_b) / len(union)
+    if jaccard >= threshold:
+        return max(jaccard, SequenceMatcher(None, " ".join(a), " ".join(b)).ratio())
+    matcher = SequenceMatcher(None, " ".join(a), " ".join(b))
+    if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+        return 0.0
+    return max(jaccard, matcher.ratio())
+
+
+def wine_name_key(name, vintage=None):
+    """Wine.name_key — 이름 토큰을 공백으로 이은 문자열 (토큰이 없으면 정규화 이름)"""
+    return (" ".join(name_tokens(name, vintage)) or normalize(name))[:NAME_KEY_LENGTH]
+
+
+def build_blocks(rows):
+    """rows: (id, name, winery, vintage, type) → 비교 대상 블록 목록 [[(id, tokens, type), ...], ...]"""
+    blocks = defaultdict(list)
+    for pk, name, winery, vintage, wine_type in rows:
+        vintage = name_vintage(name, vintage)
+        tokens = name_tokens(name, vintage)
+        if not tokens:
+            continue
+        winery_key = normalize(winery)
+        key = (vintage, winery_key) if winery_key else (vintage, "", tokens[0])
+        blocks[key].append((pk, tokens, wine_type))
+    return [members for members in blocks.values() if len(members) >= 2]
+
+
+def _candidate_pairs(members):
+    """블록 안 비교 쌍 — 작은 블록은 전체, 큰 블록은 정렬 토큰 문자열의 인접 윈도우"""
+    if len(members) > MAX_BLOCK_SIZE:
+        members = sorted(members, key=lambda m: " ".join(m[1]))
+        window = WINDOW_SIZE
+    else:
+        window = len(members)
+    for i, member in enumerate(members):
+        for other in members[i + 1 : i + 1 + window]:
+            yield member, other
+
+
+def score_blocks(blocks, threshold=DEFAULT_THRESHOLD):
+    """블록 안의 모든 쌍을 비교해 threshold 이상인 (id_a, id_b, score) 목록 (프로세스 풀 작업 단위)"""
+    pairs = []
+    for members in blocks:
+        for (pk_a, tokens_a, type_a), (pk_b, tokens_b, type_b) in _candidate_pairs(members):
+            if type_a != type_b and "other" not in (type_a, type_b):
+                continue
+            score = similarity(tokens_a, tokens_b, threshold)
+            if score >= threshold:
+                pairs.append((min(pk_a, pk_b), max(pk_a, pk_b), round(score, 3)))
+    return pairs
+
+
+def _chunks(blocks, max_pairs):
+    """작업 단위로 블록 묶기 — 묶음당 비교 쌍 수가 max_pairs 근처가 되도록"""
+    chunk, pairs = [], 0
+    for members in blocks:
+        chunk.append(members)
+        pairs += len(members) * min(len(members), WINDOW_SIZE if len(members) > MAX_BLOCK_SIZE else len(members))
+        if pairs >= max_pairs:
+            yield chunk
+            chunk, pairs = [], 0
+    if chunk:
+        yield chunk
+
+
+def find_duplicate_pairs(threshold=DEFAULT_THRESHOLD, workers=None, chunk_pairs=20000):
+    """카탈로그 전체에서 중복 후보 쌍 탐색. workers=1 이면 프로세스 풀 없이 실행."""
+    rows = Wine.objects.values_list("id", "name", "winery", "vintage", "type").order_by()
+    blocks = build_blocks(rows.iterator(chunk_size=5000))
+    if workers == 1:
+        return score_blocks(blocks, threshold)
+    pairs = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(score_blocks, chunk, threshold) for chunk in _chunks(blocks, chunk_pairs)]
+        for future in futures:
+            pairs.extend(future.result())
+    return pairs
+
+
+def cluster_pairs(pairs):
+    """후보 쌍을 union-find로 묶어 병합 그룹 생성 → [{canonical, duplicates, score}, ...]
+    대표 와인은 시음 노트가 가장 많은 와인(동률이면 먼저 등록된 ID)."""
+    from apps.notes.models import WineNoteStats
+
+    parent = {}
+
+    def find(x):
+        parent.setdefault(x, x)
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    min_score = {}
+    for a, b, score in pairs:
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[root_b] = root_a
+    groups = defaultdict(list)
+    for pk in parent:
+        groups[find(pk)].append(pk)
+    for a, b, score in pairs:
+        root = find(a)
+        min_score[root] = min(score, min_score.get(root, 1.0))
+
+    counts = dict(
+        WineNoteStats.objects.filter(wine_id__in=list(parent)).values_list("wine_id", "note_count")
+    )
+    candidates = []
+    for root, members in groups.items():
+        members.sort(key=lambda pk: (-counts.get(pk, 0), pk))
+        candidates.append(
+            {"canonical": members[0], "duplicates": members[1:], "score": min_score[root]}
+        )
+    candidates.sort(key=lambda c: c["canonical"])
+    return candidates
+
+
+MERGE_FILL_FIELDS = (
+    "region",
+    "country",
+    "vintage",
+    "grape_varieties",
+    "alcohol_content",
+    "average_price",
+    "winery",
+)
+
+
+def merge_wines(canonical_id, duplicate_ids):
+    """
+    중복 와인을 대표 와인으로 병합: 시음 노트 FK 일괄 변경, 대표 와인의 빈 필드를 중복 와인 값으로 채움,
+    와인 집계·사용자 통계 롤업 재계산 후 중복 와인 삭제. 옮긴 노트 수 반환.
+    """
+    from apps.notes.aggregates import rebuild_wine_stats_for
+    from apps.notes.fulltext import index_notes
+    from apps.notes.models import TastingNote
+    from apps.notes.rollups import rebuild_user_rollups
+    from apps.notes.versions import bump_users_notes_version
+
+    duplicate_ids = [pk for pk in duplicate_ids if pk != canonical_id]
+    if not duplicate_ids:
+        return 0
+    with transaction.atomic():
+        canonical = Wine.objects.select_for_update().get(pk=canonical_id)
+        duplicates = list(Wine.objects.filter(pk__in=duplicate_ids).order_by("id"))
+        user_ids = list(
+            TastingNote.objects.filter(wine_id__in=duplicate_ids).values_list("user_id", flat=True).distinct()
+        )
+        moved = TastingNote.objects.filter(wine_id__in=duplicate_ids).update(wine_id=canonical_id)
+
+        changed = []
+        for field in MERGE_FILL_FIELDS:
+            if getattr(canonical, field) in (None, "", []):
+                value = next((getattr(d, field) for d in duplicates if getattr(d, field) not in (None, "", [])), None)
+                if value is not None:
+                    setattr(canonical, field, value)
+                    changed.append(field)
+        external_id = canonical.external_id or next((d.external_id for d in duplicates if d.external_id), None)
+
+        Wine.objects.filter(pk__in=duplicate_ids).delete()
+        if external_id != canonical.external_id:
+            # unique 제약 때문에 중복 와인 삭제 후 external_id 이전
+            canonical.external_id = external_id
+            changed.append("external_id")
+        if changed:
+            canonical.save(update_fields=changed)
+        rebuild_wine_stats_for([canonical_id])
+        if user_ids:
+            # 롤업의 와인별 노트 수가 중복 와인 ID 를 가리키므로 해당 사용자 롤업 재계산
+            rebuild_user_rollups(user_ids)
+            # FK 일괄 변경은 시그널이 없으므로 노트 버전(조건부 GET·대시보드 응답 캐시)을 직접 증가
+            bump_users_notes_version(user_ids)
+        if moved:
+            # 노트 검색 문서의 와인 이름 갱신 (FK 일괄 변경은 시그널 없음)
+            index_notes(TastingNote.objects.filter(wine_id=canonical_id))
+    return moved
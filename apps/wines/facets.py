@@ -0,0 +1,63 @@
+"""
+와인 검색 패싯 (type / country / region 별 건수)
+- 색인 사용 가능: 매치된 ID 집합을 메모리에서 한 번 훑어 집계 (DB 조회 0회)
+- 색인 준비 전: 검색 쿼리셋에서 (type, country, region) 을 최대 FACET_DB_SCAN_LIMIT 행만 읽어 집계
+  → 카탈로그 크기와 무관하게 요청당 DB 비용 상한, 잘린 경우 truncated=True
+- 결과는 정규화된 검색어 + 필터 + 카탈로그 세대 번호(DB 와인 변경 로그, 모든 프로세스 공통)로 캐시
+  (와인 변경 시 자동 무효화). 아직 그 세대까지 동기화하지 못한 색인의 결과는 캐시하지 않음
+"""
+import hashlib
+from collections import Counter
+
+from django.core.cache import cache
+
+from .grapes import grape_key, wine_ids_for_grape
+from .search import FACET_FIELDS, normalize, wine_search_index
+
+FACET_LIMIT = 20
+FACET_DB_SCAN_LIMIT = 10000
+FACET_CACHE_TIMEOUT = 60 * 10
+
+
+def _cache_key(q, wine_type, region, grape, generation):
+    raw = "|".join((normalize(q), wine_type or "", normalize(region), grape_key(grape), str(generation)))
+    return "wines:facets:" + hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+
+def get_facet_counts(q, wine_type, region, queryset, wine_ids=None, grape=""):
+    """
+    검색 조건의 패싯 건수 → {"type": {...}, "country": {...}, "region": {...}, "truncated": bool}
+    wine_ids: 이미 색인으로 찾은(품종 필터까지 적용된) 매치 ID — 있으면 재검색 생략
+    """
+    generation = wine_search_index.current_generation()
+    key = _cache_key(q, wine_type, region, grape, generation)
+    facets = cache.get(key)
+    if facets is not None:
+        return facets
+
+    cacheable = True
+    if wine_search_index.is_ready():
+        cacheable = wine_search_index.generation >= generation
+        if wine_ids is None:
+            wine_ids = wine_search_index.search(q, wine_type=wine_type, region=region, ordered=False)
+            if grape:
+                grape_wine_ids = wine_ids_for_grape(grape)
+                wine_ids = [pk for pk in wine_ids if pk in grape_wine_ids]
+        facets = wine_search_index.facet_counts(wine_ids, limit=FACET_LIMIT)
+        facets["truncated"] = False
+    else:
+        counters = {field: Counter() for field in FACET_FIELDS}
+        rows = queryset.order_by().values_list(*FACET_FIELDS)[: FACET_DB_SCAN_LIMIT + 1]
+        scanned = 0
+        for row in rows:
+            scanned += 1
+            if scanned > FACET_DB_SCAN_LIMIT:
+                break
+            for field, value in zip(FACET_FIELDS, row):
+                if value:
+                    counters[field][value] += 1
+        facets = {field: dict(counter.most_common(FACET_LIMIT)) for field, counter in counters.items()}
+        facets["truncated"] = scanned > FACET_DB_SCAN_LIMIT
+    if cacheable:
+        cache.set(key, facets, FACET_CACHE_TIMEOUT)
+    return facets
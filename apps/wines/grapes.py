@@ -0,0 +1,116 @@
+"""
+품종 정규화·색인 동기화 (Wine.grape_varieties → GrapeVariety / WineGrape)
+- 정규화 키: 악센트·대소문자 제거, 하이픈/구두점 → 공백, 별칭 통일 (예: "Pinot Nero" → "pinot noir")
+- Wine 저장 시 시그널로 동기화, bulk 쓰기(카탈로그 가져오기 등) 후에는 sync_wine_grapes_bulk 호출
+- rebuild_grape_index 관리 명령으로 전체 백필
+"""
+import re
+
+from django.db import transaction
+
+from .models import GrapeVariety, Wine, WineGrape
+from .search import normalize
+
+# 같은 품종의 다른 표기 → 대표 정규화 키
+GRAPE_ALIASES = {
+    "cab sauv": "cabernet sauvignon",
+    "cabernet": "cabernet sauvignon",
+    "pinot nero": "pinot noir",
+    "spatburgunder": "pinot noir",
+    "pinot grigio": "pinot gris",
+    "grauburgunder": "pinot gris",
+    "shiraz": "syrah",
+    "garnacha": "grenache",
+    "monastrell": "mourvedre",
+    "mataro": "mourvedre",
+    "tinta roriz": "tempranillo",
+    "sauv blanc": "sauvignon blanc",
+    "카베르네 소비뇽": "cabernet sauvignon",
+    "까베르네 쇼비뇽": "cabernet sauvignon",
+    "피노 누아": "pinot noir",
+    "피노 누아르": "pinot noir",
+    "메를로": "merlot",
+    "샤르도네": "chardonnay",
+    "쉬라즈": "syrah",
+    "시라": "syrah",
+    "소비뇽 블랑": "sauvignon blanc",
+    "리슬링": "riesling",
+}
+_SEPARATORS = re.compile(r"[\s\-_/.,'’]+")
+
+
+def grape_key(value):
+    """품종 표기 → 정규화 키 (빈 값이면 "")"""
+    if not isinstance(value, str):
+        return ""
+    key = _SEPARATORS.sub(" ", normalize(value)).strip()
+    return GRAPE_ALIASES.get(key, key)[:100]
+
+
+def _display_name(key, raw):
+    """새 품종의 표시명 — 처음 들어온 표기 그대로, 별칭으로 통일된 경우 키를 제목 형식으로"""
+    if _SEPARATORS.sub(" ", normalize(raw)).strip() == key:
+        return raw.strip()[:100]
+    return key.title() if key.isascii() else key
+
+
+def resolve_grapes(raw_values):
+    """표기 목록 → {정규화 키: GrapeVariety} (없는 품종은 일괄 생성)"""
+    names = {}
+    for raw in raw_values:
+        key = grape_key(raw)
+        if key and key not in names:
+            names[key] = _display_name(key, raw)
+    if not names:
+        return {}
+    grapes = {g.key: g for g in GrapeVariety.objects.filter(key__in=names)}
+    missing = [GrapeVariety(key=key, name=name) for key, name in names.items() if key not in grapes]
+    if missing:
+        GrapeVariety.objects.bulk_create(missing, ignore_conflicts=True)
+        grapes.update({g.key: g for g in GrapeVariety.objects.filter(key__in=[g.key for g in missing])})
+    return grapes
+
+
+def sync_wine_grapes_bulk(rows):
+    """
+    rows: (wine_id, grape_varieties) 목록 → WineGrape 연결을 grape_varieties 와 일치시킴.
+    품종 조회 1회 + 생성 1회 + 기존 연결 삭제 1회 + 연결 생성 1회.
+    """
+    rows = [(wine_id, varieties if isinstance(varieties, list) else []) for wine_id, varieties in rows]
+    if not rows:
+        return
+    grapes = resolve_grapes(v for _, varieties in rows for v in varieties)
+    links = []
+    for wine_id, varieties in rows:
+        keys = {grape_key(v) for v in varieties} - {""}
+        links.extend(WineGrape(wine_id=wine_id, grape=grapes[key]) for key in keys)
+    with transaction.atomic():
+        WineGrape.objects.filter(wine_id__in=[wine_id for wine_id, _ in rows]).delete()
+        WineGrape.objects.bulk_create(links, ignore_conflicts=True)
+
+
+def sync_wine_grapes(wine):
+    sync_wine_grapes_bulk([(wine.pk, wine.grape_varieties)])
+
+
+def rebuild_grape_index(batch_size=2000):
+    """전체 와인의 품종 연결 재구축 → 처리한 와인 수"""
+    count = 0
+    batch = []
+    rows = Wine.objects.values_list("id", "grape_varieties").order_by("id")
+    for row in rows.iterator(chunk_size=batch_size):
+        batch.append(row)
+        if len(batch) >= batch_size:
+            sync_wine_grapes_bulk(batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        sync_wine_grapes_bulk(batch)
+        count += len(batch)
+    return count
+
+
+def wine_ids_for_grape(value):
+    """품종 표기로 연결된 와인 ID 집합 (grape, wine) 인덱스 조회"""
+    key = grape_key(value)
+    return set(WineGrape.objects.filter(grape__key=key).values_list("wine_id", flat=True))
@@ -0,0 +1,344 @@
+"""
+와인 카탈로그 대량 가져오기 (PRD SEARCH-002: 외부 카탈로그 연동)
+- CSV / NDJSON 파일을 한 행씩 스트리밍으로 읽어 메모리 사용량 일정
+- batch_size 단위로 검증 → bulk_create(update_conflicts) 로 external_id 기준 upsert
+- 배치마다 짧은 트랜잭션으로 커밋하고 체크포인트(JSON)에 진행 상황과 파일 바이트 위치 기록
+  → 중단 시 그 위치로 seek 해 이어서 실행 (앞부분을 다시 읽지 않음)
+"""
+import codecs
+import csv
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .dedup import wine_name_key
+from .grapes import sync_wine_grapes_bulk
+from .models import Wine, WINE_TYPES
+from .search import record_wine_changes
+
+CATALOG_FORMATS = ("csv", "ndjson")
+UPSERT_FIELDS = [
+    "name",
+    "type",
+    "region",
+    "country",
+    "vintage",
+    "grape_varieties",
+    "alcohol_content",
+    "average_price",
+    "winery",
+    "name_key",
+]
+MAX_ERROR_SAMPLES = 100
+
+logger = logging.getLogger(__name__)
+
+_TYPE_LOOKUP = {key: key for key, _ in WINE_TYPES}
+_TYPE_LOOKUP.update({label: key for key, label in WINE_TYPES})
+
+
+class CatalogRowError(ValueError):
+    """카탈로그 행 검증 실패"""
+
+
+def detect_format(path):
+    suffix = Path(path).suffix.lower()
+    if suffix in (".ndjson", ".jsonl"):
+        return "ndjson"
+    return "csv"
+
+
+class _LineReader:
+    """바이너리 파일을 줄 단위로 디코드 — 지금까지 읽은 바이트 위치(offset)와 줄 번호(line_no)를 기록"""
+
+    def __init__(self, fp, offset=0, line_no=0):
+        fp.seek(offset)
+        self.fp = fp
+        self.offset = offset
+        self.line_no = line_no
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        raw = self.fp.readline()
+        if not raw:
+            raise StopIteration
+        start = self.offset
+        self.offset += len(raw)
+        self.line_no += 1
+        if start == 0 and raw.startswith(codecs.BOM_UTF8):
+            raw = raw[len(codecs.BOM_UTF8):]
+        return raw.decode("utf-8")
+
+
+def iter_catalog_rows(fp, fmt, offset=0, line_no=0):
+    """
+    바이너리 파일 객체에서 (행 번호, dict, (끝 바이트 위치, 끝 줄 번호)) 를 하나씩 생성.
+    offset/line_no 는 이전 실행이 기록한 위치 — 그 위치로 seek 해 이어 읽음 (CSV 는 헤더만 처음에서 다시 읽음)
+    """
+    if fmt == "ndjson":
+        lines = _LineReader(fp, offset, line_no)
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                row = None
+            yield lines.line_no, row, (lines.offset, lines.line_no)
+        return
+    # 헤더는 항상 파일 처음에서
+    header = _LineReader(fp)
+    fieldnames = next(csv.reader(header), None)
+    lines = header if not offset else _LineReader(fp, offset, line_no)
+    reader = csv.DictReader(lines, fieldnames=fieldnames)
+    while True:
+        # 여러 줄에 걸친 인용 필드가 있어도 행 번호는 행이 시작하는 줄
+        start = lines.line_no + 1
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        yield start, row, (lines.offset, lines.line_no)
+
+
+def _text(row, key, max_length):
+    value = row.get(key)
+    value = "" if value is None else str(value).strip()
+    if len(value) > max_length:
+        raise CatalogRowError(f"{key}: 최대 {max_length}자입니다.")
+    return value
+
+
+def _decimal(row, key, max_digits, decimal_places):
+    value = row.get(key)
+    if value in (None, ""):
+        return None
+    try:
+        number = Decimal(str(value).strip()).quantize(Decimal(1).scaleb(-decimal_places))
+    except InvalidOperation:
+        raise CatalogRowError(f"{key}: 숫자가 아닙니다.")
+    if len(number.as_tuple().digits) > max_digits:
+        raise CatalogRowError(f"{key}: 자릿수가 너무 큽니다.")
+    return number
+
+
+def _grapes(value):
+    if value in (None, ""):
+        return []
+    if isinstance(value, list):
+        return [str(g).strip() for g in value if str(g).strip()]
+    value = str(value).strip()
+    if value.startswith("["):
+        try:
+            return _grapes(json.loads(value))
+        except ValueError:
+            raise CatalogRowError("grape_varieties: JSON 리스트 형식이 아닙니다.")
+    separator = "|" if "|" in value else ","
+    return [g.strip() for g in value.split(separator) if g.strip()]
+
+
+def clean_row(row):
+    """카탈로그 행 1개 → Wine 필드 dict. 잘못된 행은 CatalogRowError."""
+    if not isinstance(row, dict):
+        raise CatalogRowError("행을 해석할 수 없습니다.")
+    external_id = _text(row, "external_id", 100)
+    if not external_id:
+        raise CatalogRowError("external_id가 필요합니다.")
+    name = _text(row, "name", 200)
+    if not name:
+        raise CatalogRowError("name이 필요합니다.")
+    wine_type = _text(row, "type", 20)
+    wine_type = _TYPE_LOOKUP.get(wine_type.lower() or "other")
+    if wine_type is None:
+        raise CatalogRowError(f"type: 알 수 없는 종류입니다 ({row.get('type')}).")
+    vintage = row.get("vintage")
+    if vintage in (None, ""):
+        vintage = None
+    else:
+        try:
+            vintage = int(str(vintage).strip())
+        except ValueError:
+            raise CatalogRowError("vintage: 정수가 아닙니다.")
+        if not 1900 <= vintage <= datetime.now().year + 1:
+            raise CatalogRowError("vintage: 범위를 벗어났습니다.")
+    return {
+        "external_id": external_id,
+        "name": name,
+        "type": wine_type,
+        "region": _text(row, "region", 100),
+        "country": _text(row, "country", 100),
+        "vintage": vintage,
+        "grape_varieties": _grapes(row.get("grape_varieties")),
+        "alcohol_content": _decimal(row, "alcohol_content", 4, 2),
+        "average_price": _decimal(row, "average_price", 12, 2),
+        "winery": _text(row, "winery", 200),
+        # bulk upsert는 Wine.save 를 거치지 않으므로 이름 대조 키를 직접
+        "name_key": wine_name_key(name, vintage),
+    }
+
+
+class CatalogImporter:
+    """
+    카탈로그 파일 1개를 배치 upsert로 가져온다.
+    checkpoint_path 가 있으면 배치마다 진행 상황을 기록하고, resume=True 면 기록된 위치부터 이어서 실행.
+    """
+
+    def __init__(self, path, fmt=None, batch_size=1000, checkpoint_path=None, resume=False, progress=None):
+        self.path = Path(path)
+        self.fmt = fmt or detect_format(path)
+        if self.fmt not in CATALOG_FORMATS:
+            raise ValueError(f"지원하지 않는 형식입니다: {self.fmt}")
+        self.batch_size = batch_size
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        self.progress = progress
+        self.state = {
+            "source": str(self.path),
+            "format": self.fmt,
+            "status": "pending",
+            "rows_read": 0,
+            "offset": 0,
+            "line_no": 0,
+            "rows_upserted": 0,
+            "rows_failed": 0,
+            "error_samples": [],
+            "started_at": timezone.now().isoformat(),
+            "updated_at": None,
+        }
+        if resume and self.checkpoint_path and self.checkpoint_path.exists():
+            saved = read_checkpoint(self.checkpoint_path)
+            # 바이트 위치가 없는 이전 형식 체크포인트는 처음부터 (upsert 이므로 다시 읽어도 안전)
+            if saved.get("source") == str(self.path) and saved.get("status") != "done" and "offset" in saved:
+                self.state.update(saved)
+
+    def run(self):
+        self.state["status"] = "running"
+        started = time.perf_counter()
+        batch = []
+        try:
+            with open(self.path, "rb") as fp:
+                rows = iter_catalog_rows(fp, self.fmt, self.state["offset"], self.state["line_no"])
+                for line_no, raw, position in rows:
+                    batch.append((line_no, raw, position))
+                    if len(batch) >= self.batch_size:
+                        self._flush(batch, started)
+                        batch = []
+                if batch:
+                    self._flush(batch, started)
+        except Exception as exc:
+            self.state["status"] = "failed"
+            self.state["error"] = str(exc)
+            self._save_checkpoint()
+            raise
+        self.state["status"] = "done"
+        self._save_checkpoint()
+        return self.state
+
+    def _flush(self, batch, started):
+        from apps.notes.versions import bump_wine_notes_versions
+
+        cleaned = {}
+        for line_no, raw, _ in batch:
+            try:
+                values = clean_row(raw)
+            except CatalogRowError as exc:
+                self.state["rows_failed"] += 1
+                if len(self.state["error_samples"]) < MAX_ERROR_SAMPLES:
+                    self.state["error_samples"].append({"line": line_no, "error": str(exc)})
+                continue
+            # 같은 배치 안의 중복 external_id는 마지막 행 기준 (ON CONFLICT 중복 갱신 방지)
+            cleaned[values["external_id"]] = values
+        if cleaned:
+            with transaction.atomic():
+                Wine.objects.bulk_create(
+                    [Wine(**values) for values in cleaned.values()],
+                    update_conflicts=True,
+                    unique_fields=["external_id"],
+                    update_fields=UPSERT_FIELDS,
+                )
+                # bulk upsert는 시그널이 없으므로 품종 연결·노트 버전·검색 색인 변경 로그를 직접 갱신
+                rows = list(Wine.objects.filter(external_id__in=list(cleaned)).values_list("id", "grape_varieties"))
+                sync_wine_grapes_bulk(rows)
+                bump_wine_notes_versions([wine_id for wine_id, _ in rows])
+                record_wine_changes([wine_id for wine_id, _ in rows])
+        self.state["rows_read"] += len(batch)
+        self.state["offset"], self.state["line_no"] = batch[-1][2]
+        self.state["rows_upserted"] += len(cleaned)
+        self._save_checkpoint()
+        if self.progress:
+            self.progress(self.state, time.perf_counter() - started)
+
+    def _save_checkpoint(self):
+        self.state["updated_at"] = timezone.now().isoformat()
+        if self.checkpoint_path:
+            write_checkpoint(self.checkpoint_path, self.state)
+
+
+def write_checkpoint(path, state):
+    """체크포인트를 임시 파일에 쓴 뒤 교체 (중단되어도 깨진 파일이 남지 않음)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as fp:
+        json.dump(state, fp, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def read_checkpoint(path):
+    with open(path, encoding="utf-8") as fp:
+        return json.load(fp)
+
+
+# --- API 업로드용 백그라운드 작업 (작업 ID = 체크포인트 파일명) ---
+
+
+def _import_dir():
+    return Path(getattr(settings, "WINE_IMPORT_DIR", Path(settings.BASE_DIR) / "var" / "imports"))
+
+
+def start_import_job(uploaded_file, fmt=None):
+    """업로드 파일을 디스크에 청크 단위로 저장하고 백그라운드 스레드에서 가져오기 시작 → 작업 ID"""
+    fmt = fmt or detect_format(uploaded_file.name or "")
+    job_id = uuid.uuid4().hex
+    directory = _import_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    source = directory / f"{job_id}.{fmt}"
+    with open(source, "wb") as fp:
+        for chunk in uploaded_file.chunks():
+            fp.write(chunk)
+    importer = CatalogImporter(source, fmt=fmt, checkpoint_path=directory / f"{job_id}.json")
+    importer._save_checkpoint()
+    threading.Thread(target=_run_import_job, args=(importer,), daemon=True).start()
+    return job_id
+
+
+def _run_import_job(importer):
+    try:
+        importer.run()
+        importer.path.unlink(missing_ok=True)
+    except Exception:  # noqa: BLE001 — 실패 상태는 체크포인트에 기록됨
+        logger.exception("와인 카탈로그 가져오기 실패: %s", importer.path)
+    finally:
+        connection.close()
+
+
+def get_import_job(job_id):
+    """작업 진행 상황 (없으면 None)"""
+    if not job_id.isalnum():
+        return None
+    path = _import_dir() / f"{job_id}.json"
+    if not path.exists():
+        return None
+    return read_checkpoint(path)
@@ -0,0 +1,39 @@
+"""
+와인 검색 색인 구축 — DB 전체를 읽어 n-gram 역색인을 만들고 스냅샷 파일로 저장.
+워커는 첫 검색 시 스냅샷을 적재하므로 대량 카탈로그에서도 DB 전체 스캔 없이 시작한다.
+저장 이후 변경은 와인 변경 로그로 따라잡으며, 하루(변경 로그 보존 기간의 절반)보다 오래된 스냅샷은 무시하고 재구축.
+
+사용: python manage.py build_wine_search_index [--output PATH]
+"""
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.wines.search import wine_search_index
+
+
+class Command(BaseCommand):
+    help = "와인 검색용 n-gram 역색인을 구축하고 스냅샷 파일로 저장합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            default=getattr(settings, "WINE_SEARCH_INDEX_PATH", None),
+            help="스냅샷 파일 경로 (기본: settings.WINE_SEARCH_INDEX_PATH)",
+        )
+
+    def handle(self, *args, **options):
+        output = options["output"]
+        if not output:
+            raise CommandError("--output 또는 settings.WINE_SEARCH_INDEX_PATH가 필요합니다.")
+        started = time.perf_counter()
+        count = wine_search_index.build()
+        path = Path(output)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        wine_search_index.save(path)
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(f"와인 {count}건 색인 완료 ({elapsed:.1f}초) → {path}")
+        )
@@ -0,0 +1,46 @@
+"""
+와인 카탈로그 중복 후보 탐지 (빈티지·와이너리 블로킹 + 이름 토큰 유사도, 프로세스 풀 병렬) 및 병합.
+
+사용: python manage.py find_duplicate_wines [--threshold 0.88] [--workers 4] [--output candidates.json]
+      python manage.py find_duplicate_wines --merge        # 탐지된 후보를 모두 병합
+"""
+import json
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.wines.dedup import DEFAULT_THRESHOLD, cluster_pairs, find_duplicate_pairs, merge_wines
+
+
+class Command(BaseCommand):
+    help = "중복 와인 후보를 찾고, --merge 시 시음 노트를 대표 와인으로 옮긴 뒤 중복 와인을 삭제합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+        parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수, 1이면 단일 프로세스)")
+        parser.add_argument("--output", help="후보 목록 JSON 저장 경로")
+        parser.add_argument("--merge", action="store_true", help="후보를 모두 병합")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        pairs = find_duplicate_pairs(threshold=options["threshold"], workers=options["workers"])
+        candidates = cluster_pairs(pairs)
+        elapsed = time.perf_counter() - started
+        self.stdout.write(f"후보 쌍 {len(pairs)}개 → 병합 그룹 {len(candidates)}개 ({elapsed:.1f}초)")
+
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as fp:
+                json.dump(candidates, fp, ensure_ascii=False, indent=2)
+            self.stdout.write(f"후보 목록 저장: {options['output']}")
+        else:
+            for candidate in candidates[:20]:
+                self.stdout.write(
+                    f"  {candidate['canonical']} ← {candidate['duplicates']} (score {candidate['score']})"
+                )
+
+        if options["merge"]:
+            moved = 0
+            for candidate in candidates:
+                moved += merge_wines(candidate["canonical"], candidate["duplicates"])
+            merged = sum(len(c["duplicates"]) for c in candidates)
+            self.stdout.write(self.style.SUCCESS(f"와인 {merged}건 병합, 시음 노트 {moved}건 이동"))
@@ -0,0 +1,57 @@
+"""
+와인 카탈로그 대량 가져오기 — CSV/NDJSON 스트리밍, external_id 기준 배치 upsert.
+컬럼: external_id(필수), name(필수), type, region, country, vintage, grape_varieties,
+      alcohol_content, average_price, winery
+
+사용: python manage.py import_wine_catalog catalog.csv [--format csv|ndjson] [--batch-size 1000]
+      python manage.py import_wine_catalog catalog.ndjson --resume   # 체크포인트부터 이어서
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.wines.importer import CATALOG_FORMATS, CatalogImporter
+
+
+class Command(BaseCommand):
+    help = "CSV/NDJSON 와인 카탈로그를 external_id 기준으로 배치 upsert 합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="카탈로그 파일 경로")
+        parser.add_argument("--format", choices=CATALOG_FORMATS, help="기본: 확장자로 판단")
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--checkpoint",
+            help="체크포인트 파일 경로 (기본: <path>.checkpoint.json)",
+        )
+        parser.add_argument("--resume", action="store_true", help="체크포인트 위치부터 이어서 실행")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        importer = CatalogImporter(
+            path,
+            fmt=options["format"],
+            batch_size=options["batch_size"],
+            checkpoint_path=options["checkpoint"] or f"{path}.checkpoint.json",
+            resume=options["resume"],
+            progress=self._progress,
+        )
+        if importer.state["rows_read"]:
+            self.stdout.write(f"체크포인트에서 재개: {importer.state['rows_read']}행 이후")
+        try:
+            state = importer.run()
+        except OSError as exc:
+            raise CommandError(str(exc))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"완료: {state['rows_read']}행 읽음, {state['rows_upserted']}건 upsert, "
+                f"{state['rows_failed']}행 오류"
+            )
+        )
+        for sample in state["error_samples"][:10]:
+            self.stdout.write(self.style.WARNING(f"  {sample['line']}행: {sample['error']}"))
+
+    def _progress(self, state, elapsed):
+        rate = state["rows_read"] / elapsed if elapsed else 0
+        self.stdout.write(
+            f"  {state['rows_read']:>10}행  upsert {state['rows_upserted']:>10}  "
+            f"오류 {state['rows_failed']:>6}  ({rate:,.0f}행/초)"
+        )
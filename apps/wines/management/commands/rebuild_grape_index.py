@@ -0,0 +1,22 @@
+"""
+품종 사전·와인↔품종 연결 색인 백필 (Wine.grape_varieties 기준 전체 재구축).
+
+사용: python manage.py rebuild_grape_index [--batch-size 2000]
+"""
+from django.core.management.base import BaseCommand
+
+from apps.wines.grapes import rebuild_grape_index
+from apps.wines.models import GrapeVariety
+
+
+class Command(BaseCommand):
+    help = "Wine.grape_varieties 로부터 품종 사전과 와인↔품종 연결을 재구축합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        count = rebuild_grape_index(batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(f"와인 {count}건 품종 연결 완료 (품종 {GrapeVariety.objects.count()}종)")
+        )
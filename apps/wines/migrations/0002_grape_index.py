@@ -0,0 +1,87 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:16
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wines", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GrapeVariety",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "key",
+                    models.CharField(
+                        max_length=100, unique=True, verbose_name="정규화 키"
+                    ),
+                ),
+                ("name", models.CharField(max_length=100, verbose_name="품종명")),
+            ],
+            options={
+                "verbose_name": "품종",
+                "verbose_name_plural": "품종",
+                "db_table": "grape_varieties",
+                "ordering": ["name"],
+            },
+        ),
+        migrations.CreateModel(
+            name="WineGrape",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "grape",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="wine_links",
+                        to="wines.grapevariety",
+                    ),
+                ),
+                (
+                    "wine",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="grape_links",
+                        to="wines.wine",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "와인 품종",
+                "verbose_name_plural": "와인 품종",
+                "db_table": "wine_grapes",
+                "indexes": [
+                    models.Index(
+                        fields=["grape", "wine"], name="wine_grapes_grape_i_532eec_idx"
+                    )
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="winegrape",
+            constraint=models.UniqueConstraint(
+                fields=("wine", "grape"), name="uniq_wine_grape"
+            ),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 4.2.30 on 2026-10-18 13:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wines", "0002_grape_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WineChange",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "wine_id",
+                    models.BigIntegerField(
+                        blank=True, null=True, verbose_name="와인 ID"
+                    ),
+                ),
+                (
+                    "changed_at",
+                    models.DateTimeField(
+                        auto_now_add=True, db_index=True, verbose_name="변경 시각"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "와인 변경 로그",
+                "verbose_name_plural": "와인 변경 로그",
+                "db_table": "wine_changes",
+            },
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 4.2.30 on 2026-10-18 13:37
+
+from django.db import migrations, models
+
+from apps.wines.dedup import wine_name_key
+
+
+def backfill_name_key(apps, schema_editor):
+    """기존 와인의 이름 대조 키 채우기 (1000건씩 bulk_update)"""
+    Wine = apps.get_model("wines", "Wine")
+    batch = []
+    for wine in Wine.objects.only("id", "name", "vintage").order_by().iterator(chunk_size=1000):
+        wine.name_key = wine_name_key(wine.name, wine.vintage)
+        batch.append(wine)
+        if len(batch) >= 1000:
+            Wine.objects.bulk_update(batch, ["name_key"])
+            batch = []
+    Wine.objects.bulk_update(batch, ["name_key"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wines", "0003_wine_change_log"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="wine",
+            name="name_key",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="정규화 이름 토큰 (apps.wines.dedup.wine_name_key) — 노트 가져오기의 와인 대조",
+                max_length=255,
+                verbose_name="이름 대조 키",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="wine",
+            index=models.Index(fields=["name_key"], name="wines_name_ke_9bbca6_idx"),
+        ),
+        migrations.RunPython(backfill_name_key, migrations.RunPython.noop),
+    ]
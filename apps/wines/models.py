@@ -2,6 +2,9 @@
 와인 정보 모델 (PRD 8.2.2)
 - mywine2 / winenote / mywine notes·와인 모델 참조하여 정리
 - name, type, region, country, vintage, grape_varieties(JSON), alcohol_content, average_price, winery, external_id
+- name_key: 이름 대조 키 (apps.wines.dedup.wine_name_key — 대소문자·악센트·구두점·약어·연도 무시), 저장 시 갱신
+- GrapeVariety / WineGrape: grape_varieties 정규화 품종 사전과 와인↔품종 연결 색인
+- WineChange: 와인 변경 로그 — 최대 ID 가 카탈로그 세대 번호 (프로세스 간 검색 색인 증분 동기화, 캐시 키·ETag)
 """
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
@@ -101,6 +104,13 @@ class Wine(models.Model):
         null=True,
         blank=True,
     )
+    name_key = models.CharField(
+        "이름 대조 키",
+        max_length=255,
+        blank=True,
+        editable=False,
+        help_text="정규화 이름 토큰 (apps.wines.dedup.wine_name_key) — 노트 가져오기의 와인 대조",
+    )
     created_at = models.DateTimeField("등록일", auto_now_add=True)
 
     class Meta:
@@ -110,6 +120,7 @@ class Wine(models.Model):
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["name"]),
+            models.Index(fields=["name_key"]),
             models.Index(fields=["winery"]),
             models.Index(fields=["type"]),
             models.Index(fields=["region"]),
@@ -121,8 +132,80 @@ class Wine(models.Model):
             return f"{self.name} ({self.vintage})"
         return self.name
 
+    def save(self, *args, **kwargs):
+        from .dedup import wine_name_key
+
+        self.name_key = wine_name_key(self.name, self.vintage)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"name", "vintage"} & set(update_fields):
+            kwargs["update_fields"] = {*update_fields, "name_key"}
+        super().save(*args, **kwargs)
+
     def get_grape_varieties_display(self):
         """품종 리스트를 문자열로 반환 (mywine 참조)"""
         if not self.grape_varieties:
             return ""
         return ", ".join(str(g) for g in self.grape_varieties)
+
+
+class GrapeVariety(models.Model):
+    """품종 사전 — 표기 정규화된 품종 (Wine.grape_varieties 값을 apps.wines.grapes 로 정규화)"""
+
+    key = models.CharField("정규화 키", max_length=100, unique=True)
+    name = models.CharField("품종명", max_length=100)
+
+    class Meta:
+        db_table = "grape_varieties"
+        verbose_name = "품종"
+        verbose_name_plural = "품종"
+        ordering = ["name"]
+
+    def __str__(self):
+        return self.name
+
+
+class WineGrape(models.Model):
+    """와인 ↔ 품종 연결 색인 — Wine 저장 시 grape_varieties 로부터 동기화"""
+
+    wine = models.ForeignKey(
+        Wine,
+        on_delete=models.CASCADE,
+        related_name="grape_links",
+    )
+    grape = models.ForeignKey(
+        GrapeVariety,
+        on_delete=models.CASCADE,
+        related_name="wine_links",
+    )
+
+    class Meta:
+        db_table = "wine_grapes"
+        verbose_name = "와인 품종"
+        verbose_name_plural = "와인 품종"
+        constraints = [
+            models.UniqueConstraint(fields=["wine", "grape"], name="uniq_wine_grape"),
+        ]
+        indexes = [
+            models.Index(fields=["grape", "wine"]),
+        ]
+
+    def __str__(self):
+        return f"{self.wine_id} — {self.grape_id}"
+
+
+class WineChange(models.Model):
+    """
+    와인 변경 로그 — 저장·삭제·일괄 쓰기마다 와인 ID 1행 (wine_id 가 NULL 이면 전체 재구축).
+    쓰기와 같은 트랜잭션에 기록되므로 롤백되면 함께 사라진다 (apps.wines.search.record_wine_changes)
+    """
+
+    wine_id = models.BigIntegerField("와인 ID", null=True, blank=True)
+    changed_at = models.DateTimeField("변경 시각", auto_now_add=True, db_index=True)
+
+    class Meta:
+        db_table = "wine_changes"
+        verbose_name = "와인 변경 로그"
+        verbose_name_plural = "와인 변경 로그"
+
+    def __str__(self):
+        return f"#{self.pk} wine={self.wine_id}"
@@ -0,0 +1,398 @@
+"""
+와인 검색용 n-gram 역색인 (PRD SEARCH-001: 검색 결과 0.5초 이내)
+- name, winery, region, country 4개 필드를 정규화 후 문자 bigram으로 색인
+- 한글(음절 단위)·라틴 문자(대소문자·악센트 무시) 모두 지원
+- 검색: bigram posting list 교집합 → 부분 문자열 검증 → (name, id) 순 정렬된 ID 목록
+- 패싯: 매치된 ID 집합을 한 번 훑어 type/country/region 건수 집계 (DB 조회 없음)
+- 프로세스 내 메모리 색인. 최초 검색 시 백그라운드로 구축하거나 스냅샷 파일에서 적재
+- 증분 갱신: 와인 쓰기는 같은 트랜잭션에서 변경 로그(WineChange)에 와인 ID 를 기록 (record_wine_changes —
+  Wine 저장/삭제 시그널, 카탈로그·노트 가져오기, 병합). 각 프로세스는 검색 전 로그의 최대 ID(세대 번호)를
+  확인해 자기 세대 이후 바뀐 와인만 DB 에서 다시 읽어 반영. 커밋된 자기 프로세스 변경은 on_commit 으로 즉시 반영
+- 로그가 너무 많이 쌓였거나(MAX_SYNC_CHANGES 초과) 전체 재구축 표시(wine_id NULL)가 있거나 오래 동기화하지 않아
+  로그가 정리됐을 수 있으면 백그라운드 재구축 (그동안 DB 검색으로 폴백)
+- 정렬 순서 (name, id) 는 bisect 로 유지하는 정렬 목록 — 와인 1건 변경에 카탈로그 전체 재정렬 없음
+"""
+import bisect
+import logging
+import pickle
+import threading
+import time
+import unicodedata
+from collections import Counter, defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Max
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+NGRAM_SIZE = 2
+SEARCH_FIELDS = ("name", "winery", "region", "country")
+# 필드 경계를 넘는 부분 문자열 매치를 막기 위한 구분자 (정규화된 검색어에는 나타나지 않음)
+FIELD_SEPARATOR = "\x1f"
+# 스냅샷 형식 버전 (_Doc 구조 변경 시 증가 → 이전 스냅샷은 무시하고 재구축)
+SNAPSHOT_VERSION = 3
+FACET_FIELDS = ("type", "country", "region")
+# 한 번의 동기화로 반영할 최대 변경 수 (넘으면 재구축이 더 싸다)
+MAX_SYNC_CHANGES = 5000
+# 변경 로그 보존 기간 — 이보다 오래된 행은 재구축 시 정리. 절반 이상 동기화하지 않은 색인·스냅샷은 재구축
+WINE_CHANGE_RETENTION = timedelta(days=2)
+# 시퀀스 순서와 커밋 순서가 다를 수 있으므로(PostgreSQL) 최근 ID 구간은 다시 확인
+SYNC_LOOKBACK = 200
+# 세대 번호가 그대로여도 늦게 커밋된 변경을 확인하는 간격 (초)
+SYNC_RECHECK_SECONDS = 5
+
+
+def record_wine_changes(wine_ids):
+    """
+    와인 변경 기록 — 호출자의 트랜잭션 안에서 (롤백되면 기록도 사라짐). 이후 모든 프로세스의 색인이 증분 반영.
+    MAX_SYNC_CHANGES 보다 많으면 전체 재구축 표시 1행
+    """
+    from .models import WineChange
+
+    wine_ids = {pk for pk in wine_ids if pk is not None}
+    if not wine_ids:
+        return
+    if len(wine_ids) > MAX_SYNC_CHANGES:
+        WineChange.objects.create(wine_id=None)
+        return
+    WineChange.objects.bulk_create([WineChange(wine_id=pk) for pk in sorted(wine_ids)])
+
+
+def prune_wine_changes():
+    """보존 기간이 지난 변경 로그 정리 (최신 행은 세대 번호이므로 남김) → 삭제 행 수"""
+    from .models import WineChange
+
+    latest = WineChange.objects.aggregate(latest=Max("id"))["latest"]
+    if latest is None:
+        return 0
+    cutoff = timezone.now() - WINE_CHANGE_RETENTION
+    deleted, _ = WineChange.objects.filter(changed_at__lt=cutoff, id__lt=latest).delete()
+    return deleted
+
+
+def normalize(text):
+    """검색용 정규화: 호환 분해 → 결합 문자(악센트) 제거 → 재조합(한글 음절 복원) → casefold"""
+    if not text:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", str(text))
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(unicodedata.normalize("NFC", stripped).casefold().split())
+
+
+def ngrams(text, n=NGRAM_SIZE):
+    """정규화된 문자열의 문자 n-gram 집합"""
+    if len(text) < n:
+        return {text} if text else set()
+    return {text[i : i + n] for i in range(len(text) - n + 1)}
+
+
+class _Doc:
+    """색인된 와인 1건 — 검증용 정규화 텍스트, 메모리 필터용 컬럼, 패싯용 원본 값"""
+
+    __slots__ = ("text", "name", "type", "region", "country_label", "region_label")
+
+    def __init__(self, text, name, wine_type, region, country_label="", region_label=""):
+        self.text = text
+        self.name = name
+        self.type = wine_type
+        self.region = region
+        self.country_label = country_label
+        self.region_label = region_label
+
+    def as_tuple(self):
+        return (self.text, self.name, self.type, self.region, self.country_label, self.region_label)
+
+
+class WineSearchIndex:
+    """와인 4개 필드에 대한 문자 n-gram 역색인 (스레드 안전)"""
+
+    def __init__(self, n=NGRAM_SIZE):
+        self.n = n
+        self._lock = threading.RLock()
+        self._postings = defaultdict(set)
+        self._docs = {}
+        # (name, id) 정렬 목록 — 검색 결과 정렬용
+        self._order = []
+        self._ready = False
+        self._building = False
+        self._sync_lock = threading.Lock()
+        # 반영한 변경 로그 최대 ID, 최근 구간(SYNC_LOOKBACK)에서 반영한 로그 ID, 마지막 동기화 시각
+        self._generation = 0
+        self._applied = set()
+        self._synced_at = 0.0
+        self._checked_at = 0.0
+
+    # --- 색인 구축/갱신 ---
+
+    @staticmethod
+    def _doc_for(values):
+        text = FIELD_SEPARATOR.join(normalize(values.get(f)) for f in SEARCH_FIELDS)
+        return _Doc(
+            text,
+            values.get("name") or "",
+            values.get("type") or "",
+            normalize(values.get("region")),
+            (values.get("country") or "").strip(),
+            (values.get("region") or "").strip(),
+        )
+
+    def _grams_for(self, doc):
+        grams = set()
+        for part in doc.text.split(FIELD_SEPARATOR):
+            grams |= ngrams(part, self.n)
+        return grams
+
+    def _add(self, pk, doc, ordered=True):
+        self._remove(pk)
+        self._docs[pk] = doc
+        for gram in self._grams_for(doc):
+            self._postings[gram].add(pk)
+        if ordered:
+            bisect.insort(self._order, (doc.name, pk))
+
+    def _remove(self, pk):
+        doc = self._docs.pop(pk, None)
+        if doc is None:
+            return
+        for gram in self._grams_for(doc):
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(pk)
+                if not posting:
+                    del self._postings[gram]
+        position = bisect.bisect_left(self._order, (doc.name, pk))
+        if position < len(self._order) and self._order[position] == (doc.name, pk):
+            del self._order[position]
+
+    def _replace(self, fresh, generation):
+        """새로 만든 색인 내용으로 교체 (정렬 목록은 한 번에 정렬)"""
+        with self._lock:
+            self._postings = fresh._postings
+            self._docs = fresh._docs
+            self._order = sorted((doc.name, pk) for pk, doc in fresh._docs.items())
+            self._generation = generation
+            self._applied = set()
+            self._synced_at = self._checked_at = time.monotonic()
+            self._ready = True
+
+    def build(self, chunk_size=5000):
+        """DB 전체를 읽어 색인을 새로 구축. 구축 중에도 기존 색인으로 검색 가능."""
+        from .models import Wine
+
+        prune_wine_changes()
+        fresh = WineSearchIndex(self.n)
+        # 구축 중 바뀐 와인은 이후 동기화에서 다시 반영되도록 읽기 전 세대 번호
+        generation = self.current_generation()
+        rows = Wine.objects.values("id", "type", *SEARCH_FIELDS).order_by()
+        for row in rows.iterator(chunk_size=chunk_size):
+            fresh._add(row["id"], self._doc_for(row), ordered=False)
+        self._replace(fresh, generation)
+        logger.info("와인 검색 색인 구축 완료: %d건", len(self._docs))
+        return len(self._docs)
+
+    def add_wine(self, wine):
+        """Wine 인스턴스 1건 색인 (post_save 의 on_commit)"""
+        values = {f: getattr(wine, f) for f in SEARCH_FIELDS}
+        values["type"] = wine.type
+        with self._lock:
+            self._add(wine.pk, self._doc_for(values))
+
+    def remove_wine(self, pk):
+        """Wine 1건 색인 제거 (post_delete 의 on_commit)"""
+        with self._lock:
+            self._remove(pk)
+
+    @property
+    def generation(self):
+        """이 프로세스 색인이 반영한 세대 번호"""
+        return self._generation
+
+    @staticmethod
+    def current_generation():
+        """카탈로그 세대 번호 (변경 로그 최대 ID, 없으면 0) — 모든 프로세스가 같은 값. 캐시 키·ETag에 포함"""
+        from .models import WineChange
+
+        return WineChange.objects.aggregate(latest=Max("id"))["latest"] or 0
+
+    def invalidate(self):
+        """바뀐 와인 ID 를 알 수 없는 대량 변경 — 모든 프로세스 색인 재구축 표시 (호출자의 트랜잭션 안에서)"""
+        from .models import WineChange
+
+        WineChange.objects.create(wine_id=None)
+
+    def sync(self):
+        """
+        변경 로그에서 이 색인의 세대 이후 변경을 반영 → 색인을 그대로 써도 되는지.
+        반영할 변경이 너무 많거나 재구축 표시가 있으면 False (호출자가 재구축 시작)
+        """
+        from .models import Wine, WineChange
+
+        now = time.monotonic()
+        generation = self.current_generation()
+        if generation == self._generation and now - self._checked_at < SYNC_RECHECK_SECONDS:
+            return True
+        if now - self._synced_at > WINE_CHANGE_RETENTION.total_seconds() / 2:
+            # 그 사이 로그가 정리됐을 수 있음
+            return False
+        if not self._sync_lock.acquire(blocking=False):
+            # 다른 스레드가 반영 중 — 직전 상태로 검색
+            return True
+        try:
+            floor = self._generation - SYNC_LOOKBACK
+            changes = [
+                (change_id, wine_id)
+                for change_id, wine_id in WineChange.objects.filter(id__gt=floor, id__lte=generation)
+                .order_by("id")
+                .values_list("id", "wine_id")[: MAX_SYNC_CHANGES + SYNC_LOOKBACK + 1]
+                if change_id not in self._applied
+            ]
+            if len(changes) > MAX_SYNC_CHANGES or any(wine_id is None for _, wine_id in changes):
+                return False
+            wine_ids = {wine_id for _, wine_id in changes}
+            rows = {
+                row["id"]: row
+                for row in Wine.objects.filter(pk__in=wine_ids).values("id", "type", *SEARCH_FIELDS)
+            }
+            with self._lock:
+                for pk in wine_ids:
+                    if pk in rows:
+                        self._add(pk, self._doc_for(rows[pk]))
+                    else:
+                        self._remove(pk)
+                self._generation = generation
+                self._applied = {change_id for change_id in self._applied if change_id > generation - SYNC_LOOKBACK}
+                self._applied.update(change_id for change_id, _ in changes)
+                self._synced_at = self._checked_at = now
+            return True
+        finally:
+            self._sync_lock.release()
+
+    # --- 스냅샷 (관리 명령으로 구축한 색인을 워커 시작 시 빠르게 적재) ---
+
+    def save(self, path):
+        with self._lock:
+            payload = {
+                "version": SNAPSHOT_VERSION,
+                "n": self.n,
+                "generation": self._generation,
+                "saved_at": time.time(),
+                "docs": {pk: d.as_tuple() for pk, d in self._docs.items()},
+            }
+        with open(path, "wb") as fp:
+            pickle.dump(payload, fp, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def load(self, path):
+        """
+        스냅샷 적재 — 저장 당시 세대 번호부터 변경 로그로 따라잡는다.
+        형식이 다르거나 변경 로그가 정리됐을 만큼 오래된 스냅샷이면 False (재구축 필요).
+        """
+        with open(path, "rb") as fp:
+            payload = pickle.load(fp)
+        if payload.get("version") != SNAPSHOT_VERSION or payload.get("n") != self.n:
+            return False
+        if time.time() - payload["saved_at"] > WINE_CHANGE_RETENTION.total_seconds() / 2:
+            return False
+        fresh = WineSearchIndex(self.n)
+        for pk, values in payload["docs"].items():
+            fresh._add(pk, _Doc(*values), ordered=False)
+        self._replace(fresh, payload["generation"])
+        return self.sync()
+
+    # --- 준비 상태 ---
+
+    def is_ready(self):
+        """
+        검색에 사용 가능한지. 다른 프로세스의 변경은 변경 로그로 증분 반영하고,
+        미구축이거나 증분 반영이 불가능하면 백그라운드 구축을 시작하고 False.
+        """
+        if self._ready and self.sync():
+            return True
+        self._start_background_build()
+        return False
+
+    def _start_background_build(self):
+        with self._lock:
+            if self._building:
+                return
+            self._building = True
+        threading.Thread(target=self._background_build, daemon=True).start()
+
+    def _background_build(self):
+        from django.db import connection
+
+        try:
+            path = getattr(settings, "WINE_SEARCH_INDEX_PATH", None)
+            loaded = False
+            if path and not self._ready:
+                try:
+                    loaded = self.load(path)
+                except (OSError, pickle.UnpicklingError, EOFError, KeyError):
+                    loaded = False
+            if not loaded:
+                self.build()
+        except Exception:  # noqa: BLE001 — 색인 실패 시 DB 검색으로 폴백
+            logger.exception("와인 검색 색인 구축 실패")
+        finally:
+            self._building = False
+            connection.close()
+
+    # --- 검색 ---
+
+    def sort_key(self, pk):
+        """search() 결과 정렬 키 (name, id) — 키셋 페이지네이션 위치 탐색용"""
+        return (self._docs[pk].name, pk)
+
+    def search(self, query, wine_type=None, region=None, ordered=True):
+        """
+        query를 4개 필드 중 하나에 부분 문자열로 포함하는 와인 ID 목록 ((name, id) 순, 빈 query는 전체).
+        wine_type(정확히 일치), region(부분 일치) 필터는 메모리에서 적용. ordered=False면 정렬 생략.
+        """
+        q = normalize(query)
+        region_q = normalize(region)
+        with self._lock:
+            if len(q) >= self.n:
+                postings = [self._postings.get(g) for g in ngrams(q, self.n)]
+                if any(p is None for p in postings):
+                    return []
+                postings.sort(key=len)
+                candidates = postings[0].intersection(*postings[1:])
+            else:
+                # 1글자 검색어는 bigram으로 찾을 수 없으므로 메모리 텍스트 전체를 검증
+                candidates = self._docs.keys()
+            docs = self._docs
+            matched = [
+                pk
+                for pk in candidates
+                if q in docs[pk].text
+                and (not wine_type or docs[pk].type == wine_type)
+                and (not region_q or region_q in docs[pk].region)
+            ]
+            if ordered:
+                if len(matched) * 8 > len(self._order):
+                    # 매치가 많으면 정렬 목록을 한 번 훑어 순서대로
+                    matched_set = set(matched)
+                    matched = [pk for _, pk in self._order if pk in matched_set]
+                else:
+                    matched.sort(key=self.sort_key)
+        return matched
+
+    def facet_counts(self, wine_ids, limit=20):
+        """매치된 ID 집합을 한 번 훑어 type/country/region 별 건수 (건수 내림차순, 필드당 limit개)"""
+        counters = {field: Counter() for field in FACET_FIELDS}
+        with self._lock:
+            docs = self._docs
+            for pk in wine_ids:
+                doc = docs.get(pk)
+                if doc is None:
+                    continue
+                counters["type"][doc.type] += 1
+                counters["country"][doc.country_label] += 1
+                counters["region"][doc.region_label] += 1
+        for counter in counters.values():
+            counter.pop("", None)
+        return {field: dict(counter.most_common(limit)) for field, counter in counters.items()}
+
+
+wine_search_index = WineSearchIndex()
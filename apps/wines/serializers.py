@@ -1,7 +1,43 @@
+from django.core.exceptions import ObjectDoesNotExist
 from rest_framework import serializers
 from .models import Wine
 
 
+def get_note_stats(wine):
+    """와인별 노트 집계 (notes.WineNoteStats). 노트가 한 번도 없던 와인은 None."""
+    try:
+        return wine.note_stats
+    except ObjectDoesNotExist:
+        return None
+
+
+def average_from_stats(note_count, rating_sum):
+    """WineNoteStats.average_rating 과 같은 계산 (values() 행용)"""
+    if not note_count:
+        return None
+    return round(rating_sum / note_count, 2)
+
+
+class WineNoteStatsFieldsMixin(serializers.Serializer):
+    """tasting_notes_count, average_rating — 집계 테이블에서 O(1) 조회 (select_related("note_stats") 권장)"""
+
+    tasting_notes_count = serializers.SerializerMethodField()
+    average_rating = serializers.SerializerMethodField()
+    # 목록 빠른 직렬화(config.fastlist)용 — values() 열과 변환
+    fast_fields = {
+        "tasting_notes_count": (("note_stats__note_count",), lambda count: count or 0),
+        "average_rating": (("note_stats__note_count", "note_stats__rating_sum"), average_from_stats),
+    }
+
+    def get_tasting_notes_count(self, obj):
+        stats = get_note_stats(obj)
+        return stats.note_count if stats else 0
+
+    def get_average_rating(self, obj):
+        stats = get_note_stats(obj)
+        return stats.average_rating if stats else None
+
+
 class WineListSerializer(serializers.ModelSerializer):
     """검색/목록용 (PRD 9.2)"""
 
@@ -21,13 +57,15 @@ class WineListSerializer(serializers.ModelSerializer):
         )
 
 
-class WineDetailSerializer(serializers.ModelSerializer):
-    """상세용 — tasting_notes_count, average_rating는 ViewSet에서 주입"""
+class WineSearchSerializer(WineNoteStatsFieldsMixin, WineListSerializer):
+    """와인 검색 목록용 — 목록 필드 + 노트 집계"""
+
+    class Meta(WineListSerializer.Meta):
+        fields = WineListSerializer.Meta.fields + ("tasting_notes_count", "average_rating")
+
 
-    tasting_notes_count = serializers.IntegerField(read_only=True, default=0)
-    average_rating = serializers.DecimalField(
-        max_digits=3, decimal_places=2, read_only=True, default=None
-    )
+class WineDetailSerializer(WineNoteStatsFieldsMixin, serializers.ModelSerializer):
+    """상세용 — tasting_notes_count, average_rating는 노트 집계(WineNoteStats)에서 조회"""
 
     class Meta:
         model = Wine
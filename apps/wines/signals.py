@@ -0,0 +1,31 @@
+"""
+와인 시그널 — 검색 색인 증분 갱신 (apps.wines.search), 품종 연결 동기화 (apps.wines.grapes)
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .grapes import sync_wine_grapes
+from .models import Wine
+from .search import record_wine_changes, wine_search_index
+
+
+@receiver(post_save, sender=Wine)
+def index_wine_on_save(sender, instance, **kwargs):
+    # 변경 로그는 같은 트랜잭션에 (다른 프로세스용), 현재 프로세스 색인은 커밋된 뒤에만
+    record_wine_changes([instance.pk])
+    transaction.on_commit(lambda: wine_search_index.add_wine(instance))
+
+
+@receiver(post_save, sender=Wine)
+def sync_grapes_on_save(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and "grape_varieties" not in update_fields:
+        return
+    sync_wine_grapes(instance)
+
+
+@receiver(post_delete, sender=Wine)
+def unindex_wine_on_delete(sender, instance, **kwargs):
+    pk = instance.pk
+    record_wine_changes([pk])
+    transaction.on_commit(lambda: wine_search_index.remove_wine(pk))
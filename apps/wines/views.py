@@ -2,28 +2,89 @@
 와인 API (PRD 9.2)
 - GET /api/wines/search?q=&type=&region=&page=&page_size=
 - GET /api/wines/{id}
+- POST /api/wines/import_catalog/ (관리자) — CSV/NDJSON 카탈로그 업로드 → 백그라운드 upsert
+- GET  /api/wines/import_status/?job= (관리자) — 가져오기 진행 상황
+- ?pagination=cursor: COUNT 없는 키셋 페이지네이션 (name, id)
+- 노트 수·평균 평점은 notes.WineNoteStats 집계에서 조회 (노트 스캔 없음)
+- q 검색은 n-gram 역색인(apps.wines.search)으로 ID를 찾고, 해당 페이지의 와인만 DB에서 조회
+- ?grape=: 품종 필터 (정규화된 품종 연결 색인 WineGrape 사용, 표기 차이 무시)
+- ?facets=1: 응답에 type/country/region 패싯 건수 추가 (apps.wines.facets)
+- 목록은 values() 행 빠른 직렬화 + ?fields= 선택 필드 (config.fastlist, 응답 형식은 WineSearchSerializer)
+- 상세 조회는 조건부 GET 지원 (ETag: 등록일 + 카탈로그 세대 번호 + 노트 집계 값, config.conditional)
 """
-from rest_framework import viewsets
+from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
-from django.db.models import Q, Count, Avg
-from .models import Wine
-from .serializers import WineListSerializer, WineDetailSerializer
+from rest_framework.parsers import MultiPartParser
+from rest_framework.response import Response
+from django.db.models import Q
+from config.conditional import ConditionalGetMixin
+from config.fastlist import get_fast_list_serializer
+from .facets import get_facet_counts
+from .grapes import grape_key, wine_ids_for_grape
+from .importer import CATALOG_FORMATS, get_import_job, start_import_job
+from .models import Wine, WINE_TYPES
+from .search import wine_search_index
+from .serializers import WineSearchSerializer, WineDetailSerializer
 
 
-class WineViewSet(viewsets.ReadOnlyModelViewSet):
+WINE_VALIDATOR_FIELDS = (
+    "created_at",
+    "note_stats__note_count",
+    "note_stats__rating_sum",
+    "note_stats__rating_1",
+    "note_stats__rating_2",
+    "note_stats__rating_3",
+    "note_stats__rating_4",
+    "note_stats__rating_5",
+    "note_stats__last_tasted_date",
+)
+
+
+class WineViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     """와인 검색·상세 (쓰기는 admin 또는 시음노트 작성 시 생성)"""
-    queryset = Wine.objects.all().order_by("name")
+    queryset = Wine.objects.select_related("note_stats").order_by("name")
+    # ?pagination=cursor 키셋 페이지네이션 정렬 키 (config.pagination.KeysetPagination)
+    cursor_ordering = ("name", "id")
+
+    def cursor_key(self, wine_id):
+        """색인 검색 결과(ID 목록)의 키셋 위치 키"""
+        return wine_search_index.sort_key(wine_id)
+
+    def conditional_validators(self):
+        """상세 조회: 와인 1행 + 집계 1행의 값싼 조회로 ETag 구성 (와인 수정은 카탈로그 세대 번호로 감지)"""
+        if self.action != "retrieve":
+            return None
+        try:
+            pk = int(self.kwargs[self.lookup_field])
+        except (KeyError, ValueError):
+            return None
+        row = Wine.objects.filter(pk=pk).values_list(*WINE_VALIDATOR_FIELDS).first()
+        if row is None:
+            return None
+        return (pk, wine_search_index.current_generation(), *row), None
 
     def get_serializer_class(self):
         if self.action == "retrieve":
             return WineDetailSerializer
-        return WineListSerializer
+        return WineSearchSerializer
+
+    def _search_params(self):
+        params = self.request.query_params
+        wine_type = params.get("type", "").strip().lower()
+        if wine_type not in dict(WINE_TYPES):
+            wine_type = ""
+        return (
+            params.get("q", "").strip(),
+            wine_type,
+            params.get("region", "").strip(),
+        )
+
+    def _grape_param(self):
+        return self.request.query_params.get("grape", "").strip()
 
     def get_queryset(self):
         qs = super().get_queryset()
-        q = self.request.query_params.get("q", "").strip()
-        wine_type = self.request.query_params.get("type", "").strip().upper()
-        region = self.request.query_params.get("region", "").strip()
+        q, wine_type, region = self._search_params()
         if q:
             qs = qs.filter(
                 Q(name__icontains=q)
@@ -31,27 +92,95 @@ class WineViewSet(viewsets.ReadOnlyModelViewSet):
                 | Q(region__icontains=q)
                 | Q(country__icontains=q)
             )
-        if wine_type and wine_type in dict(Wine.WINE_TYPES):
+        if wine_type:
             qs = qs.filter(type=wine_type)
         if region:
             qs = qs.filter(region__icontains=region)
+        grape = self._grape_param()
+        if grape:
+            qs = qs.filter(grape_links__grape__key=grape_key(grape))
         return qs
 
-    def retrieve(self, request, *args, **kwargs):
-        """상세 시 tasting_notes_count, average_rating 포함"""
-        instance = self.get_object()
-        from apps.notes.models import TastingNote
+    def list(self, request, *args, **kwargs):
+        """q 검색은 색인이 준비되어 있으면 색인으로, 아니면 DB icontains로 처리"""
+        q, wine_type, region = self._search_params()
+        wine_ids = None
+        if q and wine_search_index.is_ready():
+            wine_ids = wine_search_index.search(q, wine_type=wine_type, region=region)
+            grape = self._grape_param()
+            if grape:
+                grape_wine_ids = wine_ids_for_grape(grape)
+                wine_ids = [pk for pk in wine_ids if pk in grape_wine_ids]
+            page_ids = self.paginate_queryset(wine_ids)
+            if page_ids is not None:
+                response = self.get_paginated_response(self._serialize_ids(page_ids))
+            else:
+                response = Response(self._serialize_ids(wine_ids))
+        else:
+            fast = self.get_fast_list_serializer()
+            qs = fast.values(self.filter_queryset(self.get_queryset()))
+            page = self.paginate_queryset(qs)
+            if page is not None:
+                response = self.get_paginated_response(fast.serialize(page))
+            else:
+                response = Response(fast.serialize(qs))
 
-        agg = TastingNote.objects.filter(wine=instance).aggregate(
-            count=Count("id"),
-            avg_rating=Avg("rating"),
-        )
-        serializer = WineDetailSerializer(instance)
-        data = serializer.data
-        data["tasting_notes_count"] = agg["count"] or 0
-        data["average_rating"] = (
-            round(float(agg["avg_rating"]), 2) if agg["avg_rating"] is not None else None
+        if request.query_params.get("facets") in ("1", "true"):
+            if not isinstance(response.data, dict):
+                response.data = {"results": response.data}
+            response.data["facets"] = get_facet_counts(
+                q,
+                wine_type,
+                region,
+                self.get_queryset(),
+                wine_ids=wine_ids,
+                grape=self._grape_param(),
+            )
+        return response
+
+    def get_fast_list_serializer(self):
+        """목록 응답(WineSearchSerializer 형식) 빠른 직렬화기 — 키셋 커서용 정렬 키 열 포함"""
+        return get_fast_list_serializer(WineSearchSerializer, self.request, self.cursor_ordering)
+
+    def _serialize_ids(self, wine_ids):
+        """ID 순서를 유지한 채 해당 와인만 조회해 직렬화"""
+        fast = self.get_fast_list_serializer()
+        return fast.serialize(fast.fetch(Wine.objects, wine_ids))
+
+    @action(
+        detail=False,
+        methods=["post"],
+        permission_classes=[permissions.IsAdminUser],
+        parser_classes=[MultiPartParser],
+    )
+    def import_catalog(self, request):
+        """카탈로그 파일 업로드. Body: multipart/form-data, file=CSV|NDJSON, format=csv|ndjson(선택)"""
+        upload = request.FILES.get("file")
+        if upload is None:
+            return Response(
+                {"error": "file 파라미터가 필요합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        fmt = request.data.get("format") or None
+        if fmt is not None and fmt not in CATALOG_FORMATS:
+            return Response(
+                {"error": f"format은 {', '.join(CATALOG_FORMATS)} 중 하나여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        job_id = start_import_job(upload, fmt=fmt)
+        return Response(
+            {"message": "가져오기를 시작했습니다.", "job": job_id},
+            status=status.HTTP_202_ACCEPTED,
         )
-        from rest_framework.response import Response
 
-        return Response(data)
+    @action(detail=False, methods=["get"], permission_classes=[permissions.IsAdminUser])
+    def import_status(self, request):
+        """가져오기 진행 상황. query: job=작업 ID"""
+        job = get_import_job(request.query_params.get("job", ""))
+        if job is None:
+            return Response(
+                {"error": "해당 작업을 찾을 수 없습니다."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        job.pop("source", None)
+        return Response(job)
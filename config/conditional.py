@@ -0,0 +1,80 @@
+"""
+조건부 GET (ETag / Last-Modified → 304 Not Modified)
+- 뷰가 conditional_validators() 로 값싼 버전 스탬프(사용자 노트 버전, 와인 세대 번호 등)를 반환하면
+  인증·권한 확인 직후 If-None-Match / If-Modified-Since 와 비교해 일치 시 쿼리·직렬화 없이 304
+- ETag는 경로 + 쿼리 문자열 + 사용자 + 오늘 날짜(기본값이 오늘 기준인 통계) + 버전 스탬프의 해시
+- Last-Modified 는 사용자 노트 변경 시각 기반의 보조 검증자 (If-None-Match 가 있으면 ETag 우선)
+- 응답은 사용자별이므로 Cache-Control: private, no-cache (매번 재검증)
+"""
+import hashlib
+
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+from rest_framework.exceptions import APIException
+
+
+class NotModified(APIException):
+    """검증자 일치 — handle_exception 에서 본문 없는 304 응답으로 변환"""
+
+    status_code = 304
+
+    def __init__(self, response):
+        super().__init__()
+        self.response = response
+
+
+def make_etag(request, *parts):
+    """요청 URL·사용자·날짜와 버전 스탬프로 약한 ETag 생성"""
+    user_id = getattr(request.user, "pk", None)
+    key = "|".join(
+        str(p) for p in (request.get_full_path(), user_id, timezone.localdate(), *parts)
+    )
+    return 'W/"%s"' % hashlib.md5(key.encode()).hexdigest()
+
+
+class ConditionalGetMixin:
+    """
+    APIView / ViewSet 용. conditional_validators() 가 (etag_parts, last_modified) 를 반환하면 조건부 GET 적용,
+    None 이면 해당 요청은 일반 처리. last_modified 는 timezone-aware datetime 또는 None.
+    """
+
+    def conditional_validators(self):
+        return None
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self._conditional = None
+        if request.method not in ("GET", "HEAD"):
+            return
+        validators = self.conditional_validators()
+        if validators is None:
+            return
+        parts, last_modified = validators
+        etag = make_etag(request, *parts)
+        timestamp = None
+        if last_modified:
+            # ETag처럼 날짜가 바뀌면 다시 내려받도록 오늘 0시보다 이르지 않게
+            midnight = timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+            timestamp = int(max(last_modified, midnight).timestamp())
+        self._conditional = (etag, timestamp)
+        not_modified = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if not_modified is not None:
+            raise NotModified(not_modified)
+
+    def handle_exception(self, exc):
+        if isinstance(exc, NotModified):
+            return exc.response
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        conditional = getattr(self, "_conditional", None)
+        if conditional and response.status_code in (200, 304):
+            etag, timestamp = conditional
+            response.headers["ETag"] = etag
+            if timestamp is not None:
+                response.headers["Last-Modified"] = http_date(timestamp)
+            patch_cache_control(response, private=True, no_cache=True)
+            patch_vary_headers(response, ("Authorization", "Cookie"))
+        return response
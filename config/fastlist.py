@@ -0,0 +1,153 @@
+"""
+목록 API 빠른 직렬화 + 선택 필드 (PRD 9 — 목록 API 공통)
+- ?fields=id,rating,wine.name,wine.vintage : 응답 필드 선택 (중첩은 점 표기, "wine" 만 쓰면 중첩 전체)
+  알 수 없는 필드는 400
+- 기존 DRF 시리얼라이저 선언에서 한 번 "직렬화 계획"을 만들어 (시리얼라이저 클래스, fields) 키로 캐시:
+  필드마다 values() 열과 변환 함수 — 문자·정수·불리언·JSON 은 그대로, 날짜·Decimal·choice 등은
+  같은 DRF 필드의 to_representation, get_<field>_display 는 미리 만든 choice 라벨 사전 조회
+- 행은 queryset.values_list(*열, named=True) 로 읽어 모델 인스턴스·DRF 필드 순회 없이 dict 로 변환
+  → 응답 JSON 은 DRF 시리얼라이저와 같고, 요청한 필드의 열만 조회
+- SerializerMethodField 처럼 열에서 바로 만들 수 없는 필드는 시리얼라이저 클래스의
+  fast_fields = {이름: ((열, ...), 변환 함수)} 로 선언
+- 키셋 페이지네이션이 행의 정렬 키를 읽을 수 있도록 key_columns(cursor_ordering 필드)를 항상 함께 조회
+"""
+from functools import lru_cache
+
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+FIELDS_QUERY_PARAM = "fields"
+# values() 로 읽은 값을 DRF 표현 그대로 쓰는 필드 (to_representation 이 str()/int()/그대로 반환)
+IDENTITY_FIELDS = (
+    serializers.CharField,
+    serializers.IntegerField,
+    serializers.BooleanField,
+    serializers.JSONField,
+    serializers.ReadOnlyField,
+)
+
+
+def parse_fields(raw):
+    """'id,wine.name,wine.vintage' → {"id": None, "wine": {"name": None, "vintage": None}} (None = 하위 전체), 비었으면 None"""
+    spec = {}
+    for name in (raw or "").split(","):
+        *parents, leaf = [part.strip() for part in name.split(".")]
+        if not leaf:
+            continue
+        node = spec
+        for part in parents:
+            if node.get(part, {}) is None:
+                break
+            node = node.setdefault(part, {})
+        else:
+            node[leaf] = None
+    return spec or None
+
+
+def _freeze(spec):
+    """선택 필드 사전 → 캐시 키용 튜플"""
+    if spec is None:
+        return None
+    return tuple(sorted((name, _freeze(value)) for name, value in spec.items()))
+
+
+def _thaw(frozen):
+    if frozen is None:
+        return None
+    return {name: _thaw(value) for name, value in frozen}
+
+
+def _choice_labels(model, name):
+    field = model._meta.get_field(name)
+    labels = {value: str(label) for value, label in field.flatchoices}
+    return lambda value: labels.get(value, value)
+
+
+class FastListSerializer:
+    """
+    DRF 시리얼라이저 선언 → values() 행 직렬화기.
+    values(qs): 필요한 열만 named 튜플로 읽는 쿼리셋, fetch(qs, ids): ID 순서 행 목록, serialize(rows): dict 목록
+    """
+
+    def __init__(self, serializer_class, fields=None, key_columns=("id",)):
+        self.columns = []
+        self._index = {}
+        self.plan = self._compile(serializer_class, fields, "")
+        for column in key_columns:
+            self._column(column)
+
+    def _column(self, name):
+        if name not in self._index:
+            self._index[name] = len(self.columns)
+            self.columns.append(name)
+        return self._index[name]
+
+    def _compile(self, serializer_class, fields, prefix):
+        serializer = serializer_class()
+        model = serializer.Meta.model
+        declared = serializer.fields
+        if fields is not None:
+            unknown = sorted(set(fields) - set(declared))
+            if unknown:
+                raise ValidationError({FIELDS_QUERY_PARAM: f"알 수 없는 필드: {', '.join(prefix + n for n in unknown)}"})
+        fast_fields = getattr(serializer_class, "fast_fields", {})
+        plan = []
+        for name, field in declared.items():
+            if fields is not None and name not in fields:
+                continue
+            if name in fast_fields:
+                columns, convert = fast_fields[name]
+                indexes = tuple(self._column(prefix + column) for column in columns)
+                plan.append((name, indexes, convert, None, False))
+            elif isinstance(field, serializers.BaseSerializer):
+                nested_prefix = f"{prefix}{field.source.replace('.', '__')}__"
+                # 중첩 대상이 없으면(NULL FK) DRF 처럼 None
+                pk_index = self._column(f"{nested_prefix}id")
+                nested = self._compile(type(field), fields.get(name) if fields else None, nested_prefix)
+                plan.append((name, (pk_index,), None, nested, True))
+            elif isinstance(field, serializers.SerializerMethodField):
+                raise TypeError(f"{serializer_class.__name__}.{name}: fast_fields 선언이 필요합니다.")
+            elif field.source.startswith("get_") and field.source.endswith("_display"):
+                column = field.source[len("get_") : -len("_display")]
+                plan.append((name, (self._column(prefix + column),), _choice_labels(model, column), None, True))
+            else:
+                convert = None if type(field) in IDENTITY_FIELDS else field.to_representation
+                plan.append((name, (self._column(prefix + field.source.replace(".", "__")),), convert, None, True))
+        return tuple(plan)
+
+    def values(self, queryset):
+        return queryset.values_list(*self.columns, named=True)
+
+    def fetch(self, queryset, ids):
+        """ID 목록 → 같은 순서의 행 (없는 ID 는 제외, IN 조회 1회)"""
+        rows = {row.id: row for row in self.values(queryset.filter(pk__in=ids))}
+        return [rows[pk] for pk in ids if pk in rows]
+
+    def serialize(self, rows):
+        plan = self.plan
+        return [_render(plan, row) for row in rows]
+
+
+def _render(plan, row):
+    data = {}
+    for name, indexes, convert, nested, skip_none in plan:
+        if nested is not None:
+            data[name] = None if row[indexes[0]] is None else _render(nested, row)
+        elif not skip_none:
+            data[name] = convert(*(row[i] for i in indexes))
+        else:
+            value = row[indexes[0]]
+            data[name] = value if convert is None or value is None else convert(value)
+    return data
+
+
+@lru_cache(maxsize=256)
+def _cached(serializer_class, frozen_fields, key_columns):
+    return FastListSerializer(serializer_class, _thaw(frozen_fields), key_columns)
+
+
+def get_fast_list_serializer(serializer_class, request=None, key_columns=("id",)):
+    """요청의 ?fields= 를 반영한 직렬화기 (계획은 (클래스, 필드, 키 열) 단위로 캐시)"""
+    raw = request.query_params.get(FIELDS_QUERY_PARAM) if request is not None else None
+    key_columns = tuple(dict.fromkeys(("id", *(column.lstrip("-") for column in key_columns))))
+    return _cached(serializer_class, _freeze(parse_fields(raw)), key_columns)
@@ -0,0 +1,128 @@
+"""
+목록 API 페이지네이션 (PRD 9 — 목록 API 공통)
+- 기본: PageNumberPagination (?page=) — COUNT(*) + OFFSET
+- 선택: 키셋(커서) 모드 (?pagination=cursor 로 시작, 이후 응답의 next 링크 사용)
+  COUNT 없이 마지막 행의 정렬 키 비교로 다음 페이지를 조회하므로 깊은 페이지도 일정한 비용.
+  ViewSet에 고유한 정렬 키 cursor_ordering (예: ("name", "id"))을 지정해야 사용 가능.
+"""
+import base64
+import binascii
+import datetime
+import json
+from bisect import bisect_right
+from functools import reduce
+from operator import or_
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class _CursorEncoder(DjangoJSONEncoder):
+    """DjangoJSONEncoder는 datetime을 밀리초로 자르므로 키 비교가 어긋나지 않게 마이크로초까지 유지"""
+
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+class KeysetPagination(PageNumberPagination):
+    """페이지 번호(기본) + 키셋 커서(선택) 겸용 페이지네이션"""
+
+    cursor_query_param = "cursor"
+    mode_query_param = "pagination"
+    invalid_cursor_message = "유효하지 않은 커서입니다."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        ordering = getattr(view, "cursor_ordering", None)
+        self.keyset = bool(ordering) and self.is_cursor_requested(request)
+        if not self.keyset:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.ordering = tuple(ordering)
+        page_size = self.get_page_size(request)
+        position = self.decode_cursor(request)
+
+        if isinstance(queryset, list):
+            # 이미 cursor_ordering(오름차순) 순으로 정렬된 목록 — view.cursor_key(item)로 위치 탐색
+            key = view.cursor_key
+            start = bisect_right(queryset, tuple(position), key=key) if position else 0
+            rows = queryset[start : start + page_size + 1]
+        else:
+            queryset = queryset.order_by(*self.ordering)
+            if position:
+                queryset = queryset.filter(self._after(position, queryset.model))
+            rows = list(queryset[: page_size + 1])
+            key = self._row_key
+
+        self.has_next = len(rows) > page_size
+        rows = rows[:page_size]
+        self.next_position = key(rows[-1]) if self.has_next else None
+        return rows
+
+    def get_paginated_response(self, data):
+        if not self.keyset:
+            return super().get_paginated_response(data)
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_next_link(self):
+        if not self.keyset:
+            return super().get_next_link()
+        if self.next_position is None:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.next_position))
+
+    def is_cursor_requested(self, request):
+        return (
+            self.cursor_query_param in request.query_params
+            or request.query_params.get(self.mode_query_param) == "cursor"
+        )
+
+    # --- 커서 인코딩 ---
+
+    def encode_cursor(self, position):
+        raw = json.dumps(list(position), cls=_CursorEncoder, separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            position = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        except (ValueError, binascii.Error, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return position
+
+    # --- 키셋 조건 ---
+
+    def _row_key(self, row):
+        return tuple(getattr(row, field.lstrip("-")) for field in self.ordering)
+
+    def _after(self, position, model):
+        """(a, b, c) 정렬에서 position 다음 행: a>x | (a=x & b>y) | (a=x & b=y & c>z) — 내림차순은 lt"""
+        values = []
+        for field, raw in zip(self.ordering, position):
+            try:
+                values.append(model._meta.get_field(field.lstrip("-")).to_python(raw))
+            except Exception:  # noqa: BLE001 — 변조된 커서 값
+                raise NotFound(self.invalid_cursor_message)
+        clauses = []
+        for i, field in enumerate(self.ordering):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            equal = {f.lstrip("-"): values[j] for j, f in enumerate(self.ordering[:i])}
+            clauses.append(Q(**equal, **{f"{name}__{lookup}": values[i]}))
+        # 첫 정렬 키 범위 조건을 AND로 덧붙여 OR 조건만으로는 못 쓰는 인덱스 범위 스캔을 유도
+        first = self.ordering[0]
+        bound = Q(**{f"{first.lstrip('-')}__{'lte' if first.startswith('-') else 'gte'}": values[0]})
+        return bound & reduce(or_, clauses)
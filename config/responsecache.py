@@ -0,0 +1,103 @@
+"""
+버전 키 응답 캐시 + 단일 계산(single-flight) — 조건부 GET(config.conditional)과 함께 사용
+- 캐시 키 = 뷰 이름 + 조건부 GET ETag (경로·쿼리 문자열·사용자·오늘 날짜·버전 스탬프의 해시)
+  → 데이터가 바뀌면 버전이 올라 키 자체가 달라지므로 삭제·무효화가 필요 없음 (이전 키는 만료로 정리)
+- 응답 본문(response.data)만 저장하고 렌더링은 요청마다 — 형식(JSON/브라우저블 API)과 무관
+- Django 캐시 API(add/get/set/delete)만 사용 — local-memory·file 캐시에서 외부 서비스 없이 동작
+- 같은 키의 동시 미스는 한 번만 계산:
+  · 프로세스 안: 키별 진행 중 계산에 합류해 결과를 공유 (스레드 대기)
+  · 프로세스 사이(file 캐시 공유): cache.add 잠금 키를 잡은 쪽만 계산, 나머지는 값이 채워질 때까지 폴링
+    (잠금은 LOCK_TIMEOUT 후 만료 — 계산 중 프로세스가 죽어도 LOCK_WAIT 뒤 각자 계산)
+- 계산 중 예외(400 등)는 캐시하지 않고, 합류한 요청에도 같은 예외를 전달
+"""
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.response import Response
+
+RESPONSE_CACHE_PREFIX = "response"
+# 날짜가 바뀌면 ETag(키)도 바뀌므로 하루면 충분
+RESPONSE_CACHE_TIMEOUT = 60 * 60 * 24
+LOCK_TIMEOUT = 30
+LOCK_WAIT = 10
+POLL_INTERVAL = 0.05
+
+_MISSING = object()
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+_flights = {}
+_flights_lock = threading.Lock()
+
+
+def _compute_shared(key, compute, timeout):
+    """캐시 미스 — 다른 프로세스가 계산 중이면 결과를 기다리고, 아니면 잠금을 잡고 계산해 저장"""
+    lock_key = f"{key}:lock"
+    deadline = time.monotonic() + LOCK_WAIT
+    while not cache.add(lock_key, 1, LOCK_TIMEOUT):
+        value = cache.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        if time.monotonic() >= deadline:
+            return compute()
+        time.sleep(POLL_INTERVAL)
+    try:
+        # 잠금을 기다리는 사이 다른 프로세스가 채웠을 수 있음
+        value = cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            cache.set(key, value, timeout)
+        return value
+    finally:
+        cache.delete(lock_key)
+
+
+def get_or_compute(key, compute, timeout=None):
+    """key 의 캐시 값, 없으면 compute() 결과를 저장해 반환 — 동시 미스는 계산 1회"""
+    value = cache.get(key, _MISSING)
+    if value is not _MISSING:
+        return value
+    if timeout is None:
+        timeout = getattr(settings, "RESPONSE_CACHE_TIMEOUT", RESPONSE_CACHE_TIMEOUT)
+    with _flights_lock:
+        flight = _flights.get(key)
+        leader = flight is None
+        if leader:
+            flight = _flights[key] = _Flight()
+    if not leader:
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.value
+    try:
+        flight.value = _compute_shared(key, compute, timeout)
+        return flight.value
+    except Exception as exc:
+        flight.error = exc
+        raise
+    finally:
+        with _flights_lock:
+            _flights.pop(key, None)
+        flight.done.set()
+
+
+class CachedResponseMixin:
+    """
+    ConditionalGetMixin 뷰용 — cached_response(compute) 가 ETag 키로 응답 본문을 캐시.
+    검증자가 없는 요청(conditional_validators() 가 None)은 캐시 없이 계산.
+    """
+
+    def cached_response(self, compute):
+        conditional = getattr(self, "_conditional", None)
+        if conditional is None:
+            return Response(compute())
+        key = f"{RESPONSE_CACHE_PREFIX}:{type(self).__name__}:{conditional[0]}"
+        return Response(get_or_compute(key, compute))
@@ -104,7 +104,7 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    "DEFAULT_PAGINATION_CLASS": "config.pagination.KeysetPagination",
     "PAGE_SIZE": 20,
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
@@ -121,3 +121,18 @@ SPECTACULAR_SETTINGS = {
     "DESCRIPTION": "와인 시음 플랫폼 API (PRD 기반)",
     "VERSION": "1.0.0",
 }
+
+# 와인 검색 n-gram 색인 스냅샷 (python manage.py build_wine_search_index)
+WINE_SEARCH_INDEX_PATH = BASE_DIR / "var" / "wine_search_index.pickle"
+
+# 와인 카탈로그 가져오기 업로드·체크포인트 저장 위치 (POST /api/wines/import_catalog/)
+WINE_IMPORT_DIR = BASE_DIR / "var" / "imports"
+
+# 시음 노트 CSV 가져오기 업로드·체크포인트 저장 위치 (POST /api/tasting-notes/import/)
+NOTE_IMPORT_DIR = BASE_DIR / "var" / "note_imports"
+
+# 시음 노트 사진 렌디션 생성 워커 스레드 수 (apps.notes.photos)
+PHOTO_WORKERS = int(os.environ.get("PHOTO_WORKERS", "2"))
+
+# 시음 노트 사진 이어 올리기 청크 스풀 위치 (POST /api/tasting-notes/{id}/photo_uploads/)
+PHOTO_UPLOAD_DIR = BASE_DIR / "var" / "photo_uploads"